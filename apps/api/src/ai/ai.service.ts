@@ -5,6 +5,9 @@ import { firstValueFrom } from 'rxjs';
 @Injectable()
 export class AiService {
   private readonly logger = new Logger(AiService.name);
+  private static readonly SCHEDULE_JOB_POLL_MS = 500;
+  private static readonly SCHEDULE_JOB_TIMEOUT_MS = 120000;
+  private static readonly SCHEDULE_JOB_MAX_RETRY_DELAY_MS = 10000;
 
   constructor(private http: HttpService) {}
 
@@ -39,6 +42,9 @@ export class AiService {
     startDate: string;
     endDate: string;
     gapMinutes?: number;
+    startTime?: string;
+    assignRooms?: boolean;
+    mode?: 'fast' | 'hybrid' | 'exact';
     sessions: Array<{
       id: number;
       title: string;
@@ -46,6 +52,9 @@ export class AiService {
       durationMin: number;
       topic: string;
       capacity: number;
+      roomId?: number | null;
+      startTime?: string | null; // Previous assignment, used as a solver hint
+      pinned?: boolean; // Keep startTime fixed
     }>;
     rooms: Array<{
       id: number;
@@ -60,20 +69,67 @@ export class AiService {
     }>;
     success: boolean;
     message?: string;
+    diagnosis?: Array<{
+      kind: string;
+      message: string;
+      roomId?: number | null;
+      speaker?: string | null;
+      sessionIds: number[];
+      demandMinutes?: number | null;
+      availableMinutes?: number | null;
+    }> | null;
+    movedSessions?: number | null;
+    engine?: string | null;
+    cache?: string | null;
   }> {
     this.logger.log(`Sending schedule request to AI service for event ${dto.eventId}`);
     try {
-      const res = await firstValueFrom(this.http.post('/schedule-event', dto));
-      this.logger.log('Successfully generated schedule from AI service');
-      const data = res.data as {
-        assignments: Array<{
-          sessionId: number;
-          roomId?: number | null;
-          startTime?: string | null;
-        }>;
-        success: boolean;
-        message?: string;
+      // Solves can take longer than the HTTP timeout, so submit a job and poll for it
+      const deadline = Date.now() + AiService.SCHEDULE_JOB_TIMEOUT_MS;
+      const jobId = await this.submitScheduleJob(dto, deadline);
+      this.logger.log(`Schedule job ${jobId} queued for event ${dto.eventId}`);
+
+      let job: {
+        status: string;
+        result?: {
+          assignments: Array<{
+            sessionId: number;
+            roomId?: number | null;
+            startTime?: string | null;
+          }>;
+          success: boolean;
+          message?: string;
+          diagnosis?: Array<{
+            kind: string;
+            message: string;
+            roomId?: number | null;
+            speaker?: string | null;
+            sessionIds: number[];
+            demandMinutes?: number | null;
+            availableMinutes?: number | null;
+          }> | null;
+          movedSessions?: number | null;
+          engine?: string | null;
+          cache?: string | null;
+        } | null;
+        error?: string | null;
       };
+      do {
+        await new Promise((resolve) => setTimeout(resolve, AiService.SCHEDULE_JOB_POLL_MS));
+        const res = await firstValueFrom(this.http.get(`/jobs/${jobId}`));
+        job = res.data as typeof job;
+      } while ((job.status === 'queued' || job.status === 'running') && Date.now() < deadline);
+
+      if (job.status === 'queued' || job.status === 'running') {
+        await firstValueFrom(this.http.delete(`/jobs/${jobId}`));
+        throw new Error(`Schedule job ${jobId} did not finish in time`);
+      }
+      if (job.status !== 'succeeded' || !job.result) {
+        throw new Error(job.error || `Schedule job ${jobId} ${job.status}`);
+      }
+
+      const data = job.result;
+      this.logger.log('Successfully generated schedule from AI service');
       this.logger.log(`Schedule generated - success: ${data.success}, assignments: ${data.assignments.length}`);
       return data;
     } catch (error: unknown) {
@@ -83,4 +139,28 @@ export class AiService {
       throw error;
     }
   }
+
+  // The AI service sheds load with 429/503 and a Retry-After header; wait and resubmit until the deadline
+  private async submitScheduleJob(dto: { eventId: number }, deadline: number): Promise<string> {
+    for (;;) {
+      try {
+        const submitted = await firstValueFrom(this.http.post('/schedule-event/jobs', dto));
+        return (submitted.data as { jobId: string }).jobId;
+      } catch (error: unknown) {
+        const response = (error as { response?: { status?: number; headers?: Record<string, string | undefined> } }).response;
+        if (response?.status !== 429 && response?.status !== 503) {
+          throw error;
+        }
+        const retryAfterMs = Math.min(
+          (Number(response.headers?.['retry-after']) || 1) * 1000,
+          AiService.SCHEDULE_JOB_MAX_RETRY_DELAY_MS,
+        );
+        if (Date.now() + retryAfterMs >= deadline) {
+          throw error;
+        }
+        this.logger.warn(`AI service busy (${response.status}) for event ${dto.eventId}, retrying in ${retryAfterMs} ms`);
+        await new Promise((resolve) => setTimeout(resolve, retryAfterMs));
+      }
+    }
+  }
 }
@@ -1,5 +1,5 @@
 import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
-import { IsOptional, IsNumber, Min, Max, IsBoolean, IsString } from 'class-validator';
+import { IsOptional, IsNumber, Min, Max, IsBoolean, IsString, IsIn } from 'class-validator';
 
 export class ScheduleEventRequestDto {
   @ApiPropertyOptional({ description: 'Gap time in minutes between sessions in the same room', default: 0, minimum: 0, maximum: 60 })
@@ -18,6 +18,16 @@ export class ScheduleEventRequestDto {
   @IsOptional()
   @IsString()
   startTime?: string;
+
+  @ApiPropertyOptional({ description: 'If true, the scheduler also picks a room (by capacity) for sessions without one instead of reserving the whole venue', default: false })
+  @IsOptional()
+  @IsBoolean()
+  assignRooms?: boolean;
+
+  @ApiPropertyOptional({ description: 'Scheduling engine: fast (greedy, milliseconds), hybrid (greedy refined by a short CP-SAT run) or exact (CP-SAT)', enum: ['fast', 'hybrid', 'exact'], default: 'hybrid' })
+  @IsOptional()
+  @IsIn(['fast', 'hybrid', 'exact'])
+  mode?: 'fast' | 'hybrid' | 'exact';
 }
 
 export class ScheduleEventResponseDto {
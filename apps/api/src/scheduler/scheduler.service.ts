@@ -18,7 +18,7 @@ export class SchedulerService {
     private aiService: AiService,
   ) {}
 
-  async generateSchedule(eventId: number, organizerId: number, gapMinutes: number = 0, dryRun: boolean = false, startTime?: string) {
+  async generateSchedule(eventId: number, organizerId: number, gapMinutes: number = 0, dryRun: boolean = false, startTime?: string, assignRooms: boolean = false, mode: 'fast' | 'hybrid' | 'exact' = 'hybrid') {
     this.logger.log(`Generating schedule for event ${eventId} by organizer ${organizerId} with gap time: ${gapMinutes} minutes (dryRun: ${dryRun})`);
 
     // Fetch event with relations (including session rooms)
@@ -52,6 +52,8 @@ export class SchedulerService {
       endDate: event.endDate,
       gapMinutes: gapMinutes,
       startTime: startTime, // UTC start time (format: YYYY-MM-DDTHH:mm:ss)
+      assignRooms: assignRooms, // Let the solver choose rooms for sessions without one
+      mode: mode, // Scheduling engine (interactive requests default to hybrid)
       sessions: event.sessions.map((s) => ({
         id: s.id,
         title: s.title,
@@ -60,6 +62,7 @@ export class SchedulerService {
         topic: s.topic,
         capacity: s.capacity,
         roomId: s.room?.id || null,  // Include user-provided room assignment (or null for whole venue)
+        startTime: s.startTime ? s.startTime.toISOString() : null,  // Previous assignment, so the solver keeps churn low
       })),
       rooms: event.rooms.map((r) => ({
         id: r.id,
@@ -78,9 +81,13 @@ export class SchedulerService {
     }
 
     if (!scheduleResponse.success) {
-      throw new BadRequestException(
-        scheduleResponse.message || 'Failed to generate a feasible schedule'
-      );
+      // Keep the AI service's diagnosis (overloaded rooms/speakers) so the planner knows what to relax
+      throw new BadRequestException({
+        statusCode: 400,
+        error: 'Bad Request',
+        message: scheduleResponse.message || 'Failed to generate a feasible schedule',
+        diagnosis: scheduleResponse.diagnosis || undefined,
+      });
     }
 
     // If dryRun, return assignments without saving
@@ -90,6 +97,7 @@ export class SchedulerService {
         assignments: scheduleResponse.assignments,
         success: true,
         message: scheduleResponse.message || 'Schedule generated successfully (preview)',
+        movedSessions: scheduleResponse.movedSessions,
       };
     }
 
@@ -1,20 +1,81 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
 from pydantic import BaseModel
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
 import os
+import asyncio
+import logging
+import multiprocessing
 import spacy
 import re
-from typing import Optional, Tuple, List, Dict
-from datetime import datetime, timedelta
+import json
+import math
+import time
+import hashlib
+import sqlite3
+import tempfile
+import threading
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from collections import OrderedDict
+from contextlib import contextmanager
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Callable, Optional, Tuple, List, Dict
+from datetime import date, datetime, timedelta, timezone
+from math import gcd
 from ortools.sat.python import cp_model
 
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+logging.basicConfig(level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s %(message)s")
+logger = logging.getLogger("ai-service")
+
 MODEL = os.environ.get("SPACY_MODEL", "en_core_web_sm")
 try:
     nlp = spacy.load(MODEL)
-except OSError:
-    from spacy.cli import download
-    download(MODEL)
-    nlp = spacy.load(MODEL)
+except OSError as e:
+    # Models are installed at build time (see the Dockerfile), never downloaded by a serving process
+    raise RuntimeError(f"spaCy model '{MODEL}' is not installed; run `python -m spacy download {MODEL}`") from e
+
+# Pipeline profiles: comma-separated component names per endpoint, or "full" for the whole model.
+# "sentencizer" is added as a rule-based component when the model doesn't ship one.
+BRIEF_PIPELINE = os.environ.get("BRIEF_PIPELINE", "sentencizer")
+ENTITIES_PIPELINE = os.environ.get("ENTITIES_PIPELINE", "ner")
+
+
+def build_pipeline_profile(spec: str):
+    """
+    Build a trimmed pipeline that shares the loaded model's vocab, tokenizer and weights.
+    Components the requested ones listen to (e.g. a shared tok2vec) are pulled in automatically.
+    """
+    names = [n.strip() for n in spec.split(",") if n.strip()]
+    if not names or names == ["full"]:
+        return nlp
+
+    wanted = set(names)
+    for upstream, pipe in nlp.pipeline:
+        if wanted & set(getattr(pipe, "listening_components", [])):
+            wanted.add(upstream)
+
+    profile = nlp.__class__(vocab=nlp.vocab, meta=nlp.meta)
+    profile.tokenizer = nlp.tokenizer
+    # Keep the model's own component order
+    for name in nlp.pipe_names:
+        if name in wanted:
+            profile.add_pipe(name, source=nlp)
+    if "sentencizer" in wanted and "sentencizer" not in nlp.pipe_names:
+        profile.add_pipe("sentencizer", first=True)
+    return profile
+
+
+brief_nlp = build_pipeline_profile(BRIEF_PIPELINE)
+entities_nlp = build_pipeline_profile(ENTITIES_PIPELINE)
 
 app = FastAPI(title="Event AI Service", version="0.2.0")
 
@@ -28,45 +89,455 @@ app.add_middleware(
 )
 
 
+# ============================================================================
+# Metrics
+# ============================================================================
+# Prometheus histograms, scraped from /metrics. Schedule phase timings are
+# measured where the solve runs (possibly a worker process) and travel back on
+# the response, so they are recorded by the serving process. Under serve.py
+# (PROMETHEUS_MULTIPROC_DIR set) every HTTP worker writes its samples to that
+# directory and /metrics reports the sum over all workers.
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+REQUEST_LATENCY = Histogram(
+    "ai_request_latency_seconds", "Endpoint latency in seconds", ["endpoint"], buckets=LATENCY_BUCKETS
+)
+SCHEDULE_PHASE_SECONDS = Histogram(
+    "ai_schedule_phase_seconds", "Time spent per schedule-event phase", ["phase"], buckets=LATENCY_BUCKETS
+)
+SCHEDULE_MODEL_SIZE = Histogram(
+    "ai_schedule_model_size", "CP-SAT model size per solve", ["kind"],
+    buckets=(100, 300, 1000, 3000, 10000, 30000, 100000, 300000, 1000000)
+)
+# Admission control, for autoscaling: requests running / waiting per gate, and load shed
+ADMISSION_IN_FLIGHT = Gauge(
+    "ai_admission_in_flight", "Requests running behind an admission gate", ["gate"], multiprocess_mode="livesum"
+)
+ADMISSION_QUEUE_DEPTH = Gauge(
+    "ai_admission_queue_depth", "Requests waiting at an admission gate", ["gate"], multiprocess_mode="livesum"
+)
+ADMISSION_REJECTED = Counter(
+    "ai_admission_rejected", "Requests rejected by an admission gate", ["gate", "reason"]
+)
+SCHEDULE_CACHE_LOOKUPS = Counter(
+    "ai_schedule_cache_lookups", "Schedule cache lookups by result", ["result"]
+)
+
+
+class PhaseTimer:
+    """Wall-clock seconds per named phase of one request."""
+
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.seconds[name] = self.seconds.get(name, 0.0) + time.perf_counter() - started
+
+
+def observe_schedule_metrics(response) -> None:
+    """Record the phase timings and model size carried by a ScheduleEventResponse."""
+    for phase, seconds in (response.phaseSeconds or {}).items():
+        SCHEDULE_PHASE_SECONDS.labels(phase).observe(seconds)
+    if response.solverStats is not None and response.solverStats.numVariables:
+        SCHEDULE_MODEL_SIZE.labels("variables").observe(response.solverStats.numVariables)
+        SCHEDULE_MODEL_SIZE.labels("constraints").observe(response.solverStats.numConstraints)
+
+
+@app.get("/metrics")
+def metrics():
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return Response(generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
+# ============================================================================
+# Admission Control
+# ============================================================================
+# CPU-heavy endpoints run behind a concurrency limit with a short, bounded wait
+# queue. Excess load is rejected at once (429 when the queue is full, 503 when
+# the wait runs out) with a Retry-After estimated from the queued work, so a few
+# large solves cannot starve parsing or the health probes.
+
+class AdmissionGate:
+    """
+    Concurrency limit plus bounded wait queue for one group of endpoints.
+    Each request has a cost (e.g. sessions x slots); the gate learns seconds per
+    unit of cost from finished requests to estimate how long the backlog takes.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queued: int, max_wait_seconds: float,
+                 default_seconds: float = 1.0):
+        self.name = name
+        self.max_concurrent = max(1, max_concurrent)
+        self.max_queued = max(0, max_queued)
+        self.max_wait_seconds = max_wait_seconds
+        self.default_seconds = default_seconds  # Per request, until there are measurements
+        self.seconds_per_cost: Optional[float] = None
+        self.in_flight = 0
+        self.queued = 0
+        self._backlog_cost = 0.0  # Running and waiting
+        self._condition = threading.Condition()
+        self._release_listeners: List[Callable[[], None]] = []
+
+    def retry_after(self, extra_cost: float = 0.0, extra_count: int = 0) -> int:
+        """
+        Seconds until the current backlog (plus work queued outside the gate) should
+        have drained (call with the lock held).
+        """
+        if self.seconds_per_cost is None:
+            seconds = self.default_seconds * (self.in_flight + self.queued + extra_count) / self.max_concurrent
+        else:
+            seconds = self.seconds_per_cost * (self._backlog_cost + extra_cost) / self.max_concurrent
+        return min(300, max(1, math.ceil(seconds)))
+
+    def reject(self, status_code: int, reason: str, detail: str,
+               extra_cost: float = 0.0, extra_count: int = 0) -> HTTPException:
+        with self._condition:
+            ADMISSION_REJECTED.labels(self.name, reason).inc()
+            retry_after = self.retry_after(extra_cost, extra_count)
+        return HTTPException(status_code=status_code, detail=detail, headers={"Retry-After": str(retry_after)})
+
+    def try_acquire(self, cost: float) -> bool:
+        """Take a free slot without waiting; False when all are busy or requests already wait for one."""
+        with self._condition:
+            if self.in_flight >= self.max_concurrent or self.queued:
+                return False
+            self._backlog_cost += cost
+            self.in_flight += 1
+            ADMISSION_IN_FLIGHT.labels(self.name).inc()
+            return True
+
+    def add_release_listener(self, listener: Callable[[], None]) -> None:
+        """Call listener (without the gate's lock) whenever a slot is released."""
+        self._release_listeners.append(listener)
+
+    def acquire(self, cost: float) -> None:
+        with self._condition:
+            if self.in_flight >= self.max_concurrent or self.queued:
+                if self.queued >= self.max_queued:
+                    raise self.reject(429, "queue_full", f"Too many {self.name} requests in progress")
+                self.queued += 1
+                self._backlog_cost += cost
+                ADMISSION_QUEUE_DEPTH.labels(self.name).inc()
+                deadline = time.monotonic() + self.max_wait_seconds
+                try:
+                    while self.in_flight >= self.max_concurrent:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self._backlog_cost -= cost
+                            raise self.reject(503, "wait_timeout", f"The {self.name} service is overloaded")
+                        self._condition.wait(remaining)
+                finally:
+                    self.queued -= 1
+                    ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+            else:
+                self._backlog_cost += cost
+            self.in_flight += 1
+            ADMISSION_IN_FLIGHT.labels(self.name).inc()
+
+    def release(self, cost: float, seconds: float) -> None:
+        with self._condition:
+            sample = seconds / max(cost, 1.0)
+            self.seconds_per_cost = sample if self.seconds_per_cost is None else 0.8 * self.seconds_per_cost + 0.2 * sample
+            self.in_flight -= 1
+            self._backlog_cost -= cost
+            ADMISSION_IN_FLIGHT.labels(self.name).dec()
+            self._condition.notify()
+        for listener in self._release_listeners:
+            listener()
+
+    def release_after(self, cost: float, started: float, futures: List[Future]) -> None:
+        """Release once every future is done, for work that outlives the request that started it."""
+        pending = [future for future in futures if not future.done()]
+        if not pending:
+            self.release(cost, time.perf_counter() - started)
+            return
+        remaining = [len(pending)]
+        lock = threading.Lock()
+
+        def finished(_: Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                last = remaining[0] == 0
+            if last:
+                self.release(cost, time.perf_counter() - started)
+
+        for future in pending:
+            future.add_done_callback(finished)
+
+    @contextmanager
+    def admit(self, cost: float):
+        """Hold a slot for the duration of the block, or raise 429/503."""
+        self.acquire(cost)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(cost, time.perf_counter() - started)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "inFlight": self.in_flight,
+                "queued": self.queued,
+                "maxConcurrent": self.max_concurrent,
+                "maxQueued": self.max_queued,
+                "retryAfterSeconds": self.retry_after(),
+            }
+
+
+def build_admission_gate(name: str, max_concurrent: int, max_queued: int, max_wait_seconds: float,
+                         default_seconds: float) -> AdmissionGate:
+    """Gate with ADMISSION_<NAME>_CONCURRENCY / _QUEUE / _MAX_WAIT_SECONDS env overrides."""
+    prefix = f"ADMISSION_{name.upper()}_"
+    return AdmissionGate(
+        name,
+        max_concurrent=int(os.environ.get(prefix + "CONCURRENCY", str(max_concurrent))),
+        max_queued=int(os.environ.get(prefix + "QUEUE", str(max_queued))),
+        max_wait_seconds=float(os.environ.get(prefix + "MAX_WAIT_SECONDS", str(max_wait_seconds))),
+        default_seconds=default_seconds,
+    )
+
+
+# HTTP worker processes sharing this machine's cores (serve.py forks this many)
+WEB_CONCURRENCY = max(1, int(os.environ.get("WEB_CONCURRENCY", "1")))
+
+# Solves split the machine's cores between them, so only a couple run at once across
+# all HTTP workers; each worker admits its share (at least one)
+schedule_gate = build_admission_gate(
+    "schedule", max(1, 2 // WEB_CONCURRENCY), max(1, 8 // WEB_CONCURRENCY), 10, default_seconds=10
+)
+parse_gate = build_admission_gate("parse", 8, 32, 2, default_seconds=0.05)
+entities_gate = build_admission_gate("entities", 8, 32, 2, default_seconds=0.05)
+
+
+@app.get("/admission/stats")
+def admission_stats():
+    return {gate.name: gate.stats() for gate in (schedule_gate, parse_gate, entities_gate)}
+
+
 class Brief(BaseModel):
     text: str
 
 
+# Set by warm_up(); until then the readiness probe keeps traffic away
+ready = threading.Event()
+
+
 @app.get("/health")
 def health():
-    return {"status": "ok", "model": MODEL}
+    return {
+        "status": "ok" if ready.is_set() else "starting",
+        "model": MODEL,
+        "pipelines": {"brief": brief_nlp.pipe_names, "entities": entities_nlp.pipe_names},
+    }
+
+
+@app.get("/health/live")
+def health_live():
+    """Liveness: the process answers requests (no dependency checks)."""
+    return {"status": "ok"}
+
+
+@app.get("/health/ready")
+def health_ready():
+    """Readiness: models loaded and warmed up, so the first real request is not slow."""
+    if not ready.is_set():
+        return Response(content='{"status":"starting"}', status_code=503, media_type="application/json")
+    return {"status": "ready", "model": MODEL}
+
+
+# ============================================================================
+# Brief Extraction Engine
+# ============================================================================
+# All patterns are compiled once at import. The field patterns are combined into
+# one scanner of zero-width named alternatives, so a single pass over the brief
+# reports where each pattern matches. Patterns that can start at the same
+# position end in different keywords, so no match hides another.
+
+# Bump whenever extraction rules change so cached parse results are invalidated
+EXTRACTOR_VERSION = "3"
+
+# Number formats shared by the extraction patterns
+_INT = r'\d{1,6}(?:,\d{3})*'
+_DECIMAL = r'\d{1,6}(?:,\d{3})*(?:\.\d+)?'
+_CURRENCY = r'(?:\b(?:lkr|rs|rupees?)(?![a-z]))'  # Whole word, though digits may follow (LKR250k)
+
+# Field patterns in priority order: the first pattern that matches anywhere wins.
+# Group 1 of each pattern is the number.
+AUDIENCE_PATTERNS = [
+    ('audience', rf'\b({_INT})\s*(?:people|attendees?|participants?|guests?|delegates?|visitors?|programmers?|developers?|users?|members?|attendees?)\b'),
+]
+BUDGET_PATTERNS = [
+    ('budget_million', rf'\b({_DECIMAL})\s*million\s*{_CURRENCY}?\b'),  # 1.5 million LKR
+    ('budget_k', rf'\b({_DECIMAL})\s*k\s*{_CURRENCY}?\b'),  # 250k LKR
+    ('budget_thousand', rf'\b({_DECIMAL})\s*(?:thousand|k)\s*{_CURRENCY}?\b'),  # 250 thousand LKR
+    ('budget_keyword', rf'budget[:\s]+(?:of\s+)?{_CURRENCY}?\s*({_DECIMAL})\s*(?:k|thousand|million)?'),  # budget: 250k
+    ('budget_currency', rf'{_CURRENCY}\s*({_DECIMAL})\s*(?:k|thousand|million)?'),  # LKR 250k
+]
+TRACK_PATTERNS = [
+    ('tracks_count', r'\b(\d+)\s*tracks?\b'),
+    ('sessions_count', r'\b(\d+)\s*sessions?\b'),
+    ('streams_count', r'\b(\d+)\s*streams?\b'),
+    ('tracks_of', r'track[s]?\s*(?:of\s+)?(\d+)'),
+    ('sessions_of', r'session[s]?\s*(?:of\s+)?(\d+)'),
+]
+_FIELD_PATTERNS = {
+    'audience': AUDIENCE_PATTERNS,
+    'budget': BUDGET_PATTERNS,
+    'tracks': TRACK_PATTERNS,
+}
+_COMPILED_FIELD_PATTERNS = {
+    field: [re.compile(pattern) for _, pattern in patterns]
+    for field, patterns in _FIELD_PATTERNS.items()
+}
+# Pattern name -> (field, priority)
+_FIELD_PRIORITY = {
+    name: (field, rank)
+    for field, patterns in _FIELD_PATTERNS.items()
+    for rank, (name, _) in enumerate(patterns)
+}
+# Every field pattern starts with a digit or one of "budget", "lkr", "rs", "rupee", "track", "session"
+_FIELD_SCANNER = re.compile(
+    r'(?=[\dblrst])(?:'
+    + '|'.join(f'(?=(?P<{name}>{pattern}))' for patterns in _FIELD_PATTERNS.values() for name, pattern in patterns)
+    + ')'
+)
+
+
+def scan_brief_fields(low: str) -> Dict[str, Optional[re.Match]]:
+    """
+    Scan the lowercased brief once and return, per field, the first match of the
+    highest-priority pattern that matches anywhere, i.e. what re.search over each
+    pattern list in order would find.
+    """
+    best: Dict[str, Tuple[int, int]] = {}  # field -> (priority, position)
+    for match in _FIELD_SCANNER.finditer(low):
+        field, rank = _FIELD_PRIORITY[match.lastgroup]
+        if field not in best or rank < best[field][0]:
+            best[field] = (rank, match.start())
+            # Nothing can outrank the top pattern of every field
+            if len(best) == len(_FIELD_PATTERNS) and all(r == 0 for r, _ in best.values()):
+                break
+    return {
+        field: _COMPILED_FIELD_PATTERNS[field][best[field][0]].match(low, best[field][1]) if field in best else None
+        for field in _FIELD_PATTERNS
+    }
+
+
+# Fallback candidates for extract_number_with_context
+_AUDIENCE_NUMBER_RE = re.compile(rf'\b({_INT})\b')
+_BUDGET_NUMBER_RE = re.compile(rf'\b({_DECIMAL})\b')
+
+AUDIENCE_CONTEXT_WORDS = [
+    'people', 'attendees', 'attendee', 'participants', 'participant',
+    'guests', 'guest', 'delegates', 'visitors', 'visitor',
+    'programmers', 'programmer', 'developers', 'developer',
+    'users', 'user', 'members', 'member',
+    'audience', 'crowd', 'attendance'
+]
+BUDGET_CONTEXT_WORDS = ['budget', 'cost', 'price', 'spending', 'expense']
+
+WRITTEN_NUMBERS = {
+    'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
+    'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
+}
+_WRITTEN_TRACKS_RE = re.compile(rf"({'|'.join(WRITTEN_NUMBERS)}) (?:track|session)")
+
+EVENT_KEYWORDS = ['summit', 'conference', 'workshop', 'seminar', 'meetup', 'event', 'festival', 'expo', 'exhibition']
+EVENT_TITLE_PREFIXES = ['a ', 'an ', 'the ', 'this ', 'that ', 'our ', 'my ']
+FALLBACK_TITLE_PREFIXES = ['a ', 'an ', 'the ', 'this ', 'that ']
+
+# Title cleaning: spans to strip (budget, location, audience, filler words) and
+# trailing clauses that cut the title, found together in one scan
+_TITLE_STRIP_PATTERNS = [
+    rf'\b{_DECIMAL}\s*million\s*{_CURRENCY}?\b',
+    rf'\b{_DECIMAL}\s*k\s*{_CURRENCY}?\b',
+    rf'\b{_DECIMAL}\s*(?:thousand|k)\s*{_CURRENCY}?\b',
+    rf'budget[:\s]+(?:of\s+)?{_CURRENCY}?\s*{_DECIMAL}\s*(?:k|thousand|million)?(?:\s*{_CURRENCY}\b)?',
+    rf'{_CURRENCY}\s*{_DECIMAL}\s*(?:k|thousand|million)?',
+    r'\bin\s+(?:colombo|sri\slanka|lanka)\b',
+    rf'\b{_INT}\s*(?:people|attendees?|participants?|guests?|delegates?|visitors?)\b',
+    r'\brequirements\b',
+]
+_TITLE_CUT_WORDS = ['need', 'with', 'including', 'and', 'or', 'for', 'of', 'at', 'in', 'on', 'near', 'around', 'nearby']
+_TITLE_SCANNER = re.compile(
+    f"(?P<strip>{'|'.join(_TITLE_STRIP_PATTERNS)})"
+    f"|(?P<cut>\\s*,\\s*(?:{'|'.join(_TITLE_CUT_WORDS)})\\s+.*$)",
+    re.IGNORECASE,
+)
+# Sentence punctuation (with surrounding whitespace) and stray symbols become a single space
+_TITLE_PUNCTUATION_RE = re.compile(r'(?:\s*[,.?:;])+\s*|[*/+\-_\|\~\^\&\(\)\[\]\{\}<>\`]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=None)
+def _keyword_finder(context_words: Tuple[str, ...]) -> re.Pattern:
+    return re.compile('(?=(?:' + '|'.join(map(re.escape, context_words)) + '))')
 
 
-def extract_number_with_context(text: str, pattern: str, context_words, multiplier: int = 1) -> Optional[int]:
+def _keyword_positions(low: str, context_words: Tuple[str, ...]) -> Dict[str, List[int]]:
+    """Sorted start offsets of every (possibly overlapping) occurrence of each context word."""
+    positions: Dict[str, List[int]] = {word: [] for word in context_words}
+    for match in _keyword_finder(context_words).finditer(low):
+        pos = match.start()
+        for word in context_words:
+            if low.startswith(word, pos):
+                positions[word].append(pos)
+    return positions
+
+
+def extract_number_with_context(text: str, pattern, context_words, multiplier: int = 1) -> Optional[int]:
     """Extract a number that appears near specific context words."""
-    matches = list(re.finditer(pattern, text, re.IGNORECASE))
-    for match in matches:
+    low = text.lower()
+    context_words = tuple(context_words)
+    positions = _keyword_positions(low, context_words)
+    number_re = pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.IGNORECASE)
+    for match in number_re.finditer(low):
         num_str = match.group(1).replace(",", "").replace(" ", "")
         try:
             num = int(num_str)
-            # Check context around the number (50 chars before and after)
-            start = max(0, match.start() - 50)
-            end = min(len(text), match.end() + 50)
-            context = text[start:end].lower()
-
-            # Check if any context word appears near this number
-            for word in context_words:
-                if word in context:
-                    # Check proximity - word should be within 30 chars of the number
-                    word_pos = context.find(word)
-                    num_pos_in_context = match.start() - start
-                    if word_pos != -1 and abs(word_pos - num_pos_in_context) < 30:
-                        return num * multiplier
         except ValueError:
             continue
+        # Context window is 50 chars before and after the number
+        start = max(0, match.start() - 50)
+        end = min(len(low), match.end() + 50)
+        for word in context_words:
+            # First occurrence of the word inside the window must be within 30 chars of the number
+            occurrences = positions[word]
+            k = bisect_left(occurrences, start)
+            if k < len(occurrences) and occurrences[k] + len(word) <= end:
+                if abs(occurrences[k] - match.start()) < 30:
+                    return num * multiplier
     return None
 
 
-def _apply_substitutions(s: str, patterns: list) -> str:
-    """Apply a list of (pattern, repl, flags) substitutions to string s."""
-    for pat, repl, flags in patterns:
-        s = re.sub(pat, repl, s, flags=flags)
-    return s.strip()
+def clean_title_text(title: str) -> str:
+    """Strip budget/location/audience spans and trailing clauses, then normalize punctuation."""
+    parts = []
+    pos = 0
+    for match in _TITLE_SCANNER.finditer(title):
+        parts.append(title[pos:match.start()])
+        pos = match.end()
+        if match.lastgroup == 'cut':
+            break
+    parts.append(title[pos:])
+    return _WHITESPACE_RE.sub(' ', _TITLE_PUNCTUATION_RE.sub(' ', ''.join(parts))).strip()
+
+
+def _strip_prefixes(title: str, prefixes: List[str]) -> str:
+    for prefix in prefixes:
+        if title.lower().startswith(prefix):
+            title = title[len(prefix):].strip()
+    return title
 
 
 def extract_and_clean_title(text: str, doc) -> Optional[str]:
@@ -75,72 +546,19 @@ def extract_and_clean_title(text: str, doc) -> Optional[str]:
     Returns cleaned title or None.
     """
     try:
-        sentences = [s.text.strip() for s in doc.sents]
-        event_keywords = ['summit', 'conference', 'workshop', 'seminar', 'meetup', 'event', 'festival', 'expo', 'exhibition']
-
-        # Precompiled substitution patterns for cleaning: (pattern, repl, flags)
-        # These combine many of the original repeated re.sub calls
-        budget_patterns = [
-            (r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*million\s*(?:lkr|rs|rupees?)?\b', r'', re.IGNORECASE),
-            (r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*k\s*(?:lkr|rs|rupees?)?\b', r'', re.IGNORECASE),
-            (r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*(?:thousand|k)\s*(?:lkr|rs|rupees?)?\b', r'', re.IGNORECASE),
-            (r'budget[:\s]+(?:of\s+)?(?:lkr|rs|rupees?)?\s*(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|thousand|million)?', r'', re.IGNORECASE),
-            (r'(?:lkr|rs|rupees?)\s*(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|thousand|million)?', r'', re.IGNORECASE),
-        ]
-
-        location_patterns = [
-            (r'\bin\s+(?:colombo|sri\slanka|lanka)\b', r'', re.IGNORECASE),
-        ]
-
-        audience_patterns = [
-            (r'\b(\d{1,6}(?:,\d{3})*)\s*(?:people|attendees?|participants?|guests?|delegates?|visitors?)\b', r'', re.IGNORECASE),
-        ]
-
-        trailing_phrases_patterns = [
-            (r'\brequirements\b', r'', re.IGNORECASE),
-            (r'\s*,\s*need\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*with\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*including\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*and\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*or\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*for\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*of\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*at\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*in\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*on\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*near\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*around\s+.*$', r'', re.IGNORECASE),
-            (r'\s*,\s*nearby\s+.*$', r'', re.IGNORECASE),
-        ]
-
-        punctuation_clean_patterns = [
-            (r'\s*,\s*', ' ', 0),
-            (r'\s*\.\s*', ' ', 0),
-            (r'\s*\?\s*', ' ', 0),
-            (r'\s*\:\s*', ' ', 0),
-            (r'\s*\;\s*', ' ', 0),
-            # remove a variety of punctuation/symbols
-            (r'[*/+\-_\|\~\^\&\(\)\[\]\{\}<>\`]', ' ', 0),
-        ]
+        # Only the first few sentences are ever considered
+        sentences = [s.text.strip() for s in islice(doc.sents, 3)]
 
         # Try to find a sentence with event keywords (prefer first 3 sentences)
         if sentences:
             for sent in sentences[:3]:
                 sent_low = sent.lower()
-                if any(keyword in sent_low for keyword in event_keywords):
-                    title = sent.strip()
-
-                    # Remove common short prefixes
-                    for prefix in ['a ', 'an ', 'the ', 'this ', 'that ', 'our ', 'my ']:
-                        if title.lower().startswith(prefix):
-                            title = title[len(prefix):].strip()
-
-                    # Apply grouped cleaning steps
-                    title = _apply_substitutions(title, budget_patterns + location_patterns + audience_patterns + trailing_phrases_patterns + punctuation_clean_patterns)
+                if any(keyword in sent_low for keyword in EVENT_KEYWORDS):
+                    # Remove common short prefixes, then strip budget/location/audience noise
+                    title = clean_title_text(_strip_prefixes(sent.strip(), EVENT_TITLE_PREFIXES))
 
                     # Capitalize first letter
                     if title:
-                        title = title.strip()
                         title = title[0].upper() + title[1:] if len(title) > 1 else title.upper()
 
                     # Limit length (try natural breaks)
@@ -158,13 +576,8 @@ def extract_and_clean_title(text: str, doc) -> Optional[str]:
             for sent in sentences[:2]:
                 # pick short-ish meaningful sentences
                 if 10 < len(sent) and len(sent.split()) <= 12:
-                    title = sent.strip()
-                    for prefix in ['a ', 'an ', 'the ', 'this ', 'that ']:
-                        if title.lower().startswith(prefix):
-                            title = title[len(prefix):].strip()
-                    title = _apply_substitutions(title, budget_patterns + location_patterns + audience_patterns + trailing_phrases_patterns + punctuation_clean_patterns)
+                    title = clean_title_text(_strip_prefixes(sent.strip(), FALLBACK_TITLE_PREFIXES))
                     if title:
-                        title = title.strip()
                         title = title[0].upper() + title[1:] if len(title) > 1 else title.upper()
                     return title
 
@@ -173,32 +586,25 @@ def extract_and_clean_title(text: str, doc) -> Optional[str]:
         return None
 
 
-@app.post("/parse-brief")
-def parse_brief(b: Brief):
+def extract_brief_fields(text: str, doc) -> dict:
+    """
+    Extract title, audience, budget and tracks from a brief and its spaCy doc.
+    Shared by the single and batch parse endpoints.
+    """
     try:
-        doc = nlp(b.text)
         audience = None
         budget = None
         tracks = None
-        title = None
-        text = b.text
         low = text.lower()
 
         # Title extraction & cleaning now delegated
         title = extract_and_clean_title(text, doc)
 
+        # One scan over the brief resolves the audience, budget and track patterns
+        matches = scan_brief_fields(low)
+
         # Extract audience - look for numbers near audience-related words
-        audience_pattern = r'\b(\d{1,6}(?:,\d{3})*)\s*(?:people|attendees?|participants?|guests?|delegates?|visitors?|programmers?|developers?|users?|members?|attendees?)\b'
-        audience_words = [
-            'people', 'attendees', 'attendee', 'participants', 'participant', 
-            'guests', 'guest', 'delegates', 'visitors', 'visitor',
-            'programmers', 'programmer', 'developers', 'developer',
-            'users', 'user', 'members', 'member',
-            'audience', 'crowd', 'attendance'
-        ]
-
-        # Try regex pattern first
-        audience_match = re.search(audience_pattern, low)
+        audience_match = matches['audience']
         if audience_match:
             try:
                 audience = int(audience_match.group(1).replace(",", ""))
@@ -207,47 +613,27 @@ def parse_brief(b: Brief):
 
         # Fallback: look for numbers with context
         if audience is None:
-            audience = extract_number_with_context(
-                text,
-                r'\b(\d{1,6}(?:,\d{3})*)\b',
-                audience_words
-            )
+            audience = extract_number_with_context(text, _AUDIENCE_NUMBER_RE, AUDIENCE_CONTEXT_WORDS)
 
         # Extract budget - look for currency and budget-related patterns
-        budget_patterns = [
-            r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*million\s*(?:lkr|rs|rupees?)?\b',  # 1.5 million LKR
-            r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*k\s*(?:lkr|rs|rupees?)?\b',  # 250k LKR
-            r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*(?:thousand|k)\s*(?:lkr|rs|rupees?)?\b',  # 250 thousand LKR
-            r'budget[:\s]+(?:of\s+)?(?:lkr|rs|rupees?)?\s*(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|thousand|million)?',  # budget: 250k
-            r'(?:lkr|rs|rupees?)\s*(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\s*(?:k|thousand|million)?',  # LKR 250k
-        ]
-
-        for pattern in budget_patterns:
-            budget_match = re.search(pattern, low)
-            if budget_match:
-                try:
-                    num_str = budget_match.group(1).replace(",", "")
-                    budget = float(num_str)
-                    # Check what multiplier to use based on context
-                    match_context = low[max(0, budget_match.start() - 10):min(len(low), budget_match.end() + 10)]
-                    if 'million' in match_context:
-                        budget = int(budget * 1000000)
-                    elif 'k' in match_context or 'thousand' in match_context:
-                        budget = int(budget * 1000)
-                    else:
-                        budget = int(budget)
-                    break
-                except (ValueError, IndexError):
-                    continue
+        budget_match = matches['budget']
+        if budget_match:
+            try:
+                budget = float(budget_match.group(1).replace(",", ""))
+                # Check what multiplier to use based on context
+                match_context = low[max(0, budget_match.start() - 10):min(len(low), budget_match.end() + 10)]
+                if 'million' in match_context:
+                    budget = int(budget * 1000000)
+                elif 'k' in match_context or 'thousand' in match_context:
+                    budget = int(budget * 1000)
+                else:
+                    budget = int(budget)
+            except (ValueError, IndexError):
+                budget = None
 
         # Fallback: look for numbers near budget keywords
         if budget is None:
-            budget = extract_number_with_context(
-                text,
-                r'\b(\d{1,6}(?:,\d{3})*(?:\.\d+)?)\b',
-                ['budget', 'cost', 'price', 'spending', 'expense'],
-                multiplier=1
-            )
+            budget = extract_number_with_context(text, _BUDGET_NUMBER_RE, BUDGET_CONTEXT_WORDS, multiplier=1)
             # Check if "million", "k", or "thousand" appears near the budget number
             if budget:
                 budget_keywords = ['budget', 'cost', 'price']
@@ -267,31 +653,18 @@ def parse_brief(b: Brief):
                             break
 
         # Extract tracks - look for various track patterns
-        track_patterns = [
-            r'\b(\d+)\s*tracks?\b',
-            r'\b(\d+)\s*sessions?\b',
-            r'\b(\d+)\s*streams?\b',
-            r'track[s]?\s*(?:of\s+)?(\d+)',
-            r'session[s]?\s*(?:of\s+)?(\d+)',
-        ]
-
-        for pattern in track_patterns:
-            track_match = re.search(pattern, low)
-            if track_match:
-                try:
-                    tracks = int(track_match.group(1))
-                    break
-                except (ValueError, IndexError):
-                    continue
+        track_match = matches['tracks']
+        if track_match:
+            try:
+                tracks = int(track_match.group(1))
+            except (ValueError, IndexError):
+                pass
 
-        # Fallback: check for written numbers
+        # Fallback: check for written numbers (in WRITTEN_NUMBERS order)
         if tracks is None:
-            written_numbers = {
-                'one': 1, 'two': 2, 'three': 3, 'four': 4, 'five': 5,
-                'six': 6, 'seven': 7, 'eight': 8, 'nine': 9, 'ten': 10
-            }
-            for word, num in written_numbers.items():
-                if f'{word} track' in low or f'{word} session' in low:
+            written = {m.group(1) for m in _WRITTEN_TRACKS_RE.finditer(low)}
+            for word, num in WRITTEN_NUMBERS.items():
+                if word in written:
                     tracks = num
                     break
 
@@ -312,14 +685,347 @@ def parse_brief(b: Brief):
         }
 
 
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", "1024"))
+RESULT_CACHE_MAX_BYTES = int(os.environ.get("RESULT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+RESULT_CACHE_TTL_SECONDS = float(os.environ.get("RESULT_CACHE_TTL_SECONDS", "3600"))
+
+
+class ResultCache:
+    """
+    Thread-safe in-process LRU cache for NLP results, bounded by entry count,
+    approximate size in bytes and TTL. Keys are hashes of the whitespace-normalized
+    text, scoped by a fingerprint of the model, pipeline and extractor version so
+    a change to any of them never serves stale results.
+    """
+
+    def __init__(self, fingerprint: str, max_entries: int, max_bytes: int, ttl_seconds: float):
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, int, Any]]" = OrderedDict()  # key -> (expires_at, size, value)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, namespace: str, text: str) -> str:
+        normalized = _WHITESPACE_RE.sub(' ', text).strip()
+        return hashlib.sha256(f"{self.fingerprint}|{namespace}|{normalized}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, _, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        size = len(key) + len(json.dumps(value, default=str))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, size, value)
+            self._bytes += size
+            # Evict least recently used entries until both bounds hold
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "maxEntries": self.max_entries,
+                "maxBytes": self.max_bytes,
+                "ttlSeconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hitRate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+result_cache = ResultCache(
+    fingerprint=f"{MODEL}|{BRIEF_PIPELINE}|{ENTITIES_PIPELINE}|{EXTRACTOR_VERSION}",
+    max_entries=RESULT_CACHE_MAX_ENTRIES,
+    max_bytes=RESULT_CACHE_MAX_BYTES,
+    ttl_seconds=RESULT_CACHE_TTL_SECONDS,
+)
+
+
+@app.get("/cache/stats")
+def cache_stats():
+    return {"fingerprint": result_cache.fingerprint, **result_cache.stats()}
+
+
+@app.post("/parse-brief")
+def parse_brief(b: Brief):
+    with parse_gate.admit(len(b.text)), REQUEST_LATENCY.labels("/parse-brief").time():
+        return _parse_brief(b)
+
+
+def _parse_brief(b: Brief):
+    cache_key = result_cache.key("parse-brief", b.text)
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    try:
+        doc = brief_nlp(b.text)
+    except Exception as e:
+        return {
+            "title": None,
+            "estimatedAudience": None,
+            "budgetLkr": None,
+            "tracks": None,
+            "error": str(e)
+        }
+    result = extract_brief_fields(b.text, doc)
+    if "error" not in result:
+        result_cache.put(cache_key, result)
+    return result
+
+
+# Batch parsing defaults (overridable per request)
+PARSE_BATCH_SIZE = int(os.environ.get("PARSE_BATCH_SIZE", "64"))
+PARSE_N_PROCESS = int(os.environ.get("PARSE_N_PROCESS", "1"))
+
+
+class BriefBatch(BaseModel):
+    briefs: List[Brief]
+    batchSize: Optional[int] = None  # Docs per nlp.pipe batch (defaults to PARSE_BATCH_SIZE)
+    nProcess: Optional[int] = None  # Worker processes for nlp.pipe (defaults to PARSE_N_PROCESS)
+
+
+@app.post("/parse-brief/batch")
+def parse_brief_batch(req: BriefBatch):
+    """
+    Parse many briefs in one request by streaming them through nlp.pipe.
+    Results are returned in the same order as the input briefs.
+    """
+    with parse_gate.admit(sum(len(b.text) for b in req.briefs)):
+        return _parse_brief_batch(req)
+
+
+def _parse_brief_batch(req: BriefBatch):
+    texts = [b.text for b in req.briefs]
+    if not texts:
+        return {"results": []}
+
+    # Serve repeats from the cache and only run the pipeline over the misses
+    keys = [result_cache.key("parse-brief", text) for text in texts]
+    results = [result_cache.get(key) for key in keys]
+    missing = [i for i, result in enumerate(results) if result is None]
+
+    batch_size = max(1, req.batchSize or PARSE_BATCH_SIZE)
+    n_process = max(1, req.nProcess or PARSE_N_PROCESS)
+    n_process = min(n_process, available_cores())
+    # Forking workers only pays off when each of them gets at least one full batch
+    if len(missing) < batch_size * 2:
+        n_process = 1
+
+    docs = brief_nlp.pipe((texts[i] for i in missing), batch_size=batch_size, n_process=n_process)
+    parsed = 0
+    try:
+        for i, doc in zip(missing, docs):
+            results[i] = extract_brief_fields(texts[i], doc)
+            if "error" not in results[i]:
+                result_cache.put(keys[i], results[i])
+            parsed += 1
+    except Exception as e:
+        # A failing text stops the whole pipe; parse the rest one by one so only it reports the error
+        logger.warning("Batch parse failed after %d of %d briefs, parsing the rest singly: %s", parsed, len(missing), e)
+        for i in missing[parsed:]:
+            results[i] = _parse_brief(req.briefs[i])
+    return {"results": results}
+
+
 class TextReq(BaseModel):
     text: str
 
 
 @app.post("/nlp/entities")
 def nlp_entities(req: TextReq):
-    doc = nlp(req.text)
-    return [{"text": ent.text, "label": ent.label_} for ent in doc.ents]
+    with entities_gate.admit(len(req.text)), REQUEST_LATENCY.labels("/nlp/entities").time():
+        return _nlp_entities(req)
+
+
+def _nlp_entities(req: TextReq):
+    cache_key = result_cache.key("entities", req.text)
+    cached = result_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    doc = entities_nlp(req.text)
+    result = [{"text": ent.text, "label": ent.label_} for ent in doc.ents]
+    result_cache.put(cache_key, result)
+    return result
+
+
+# ============================================================================
+# Bulk Entity Extraction
+# ============================================================================
+# /nlp/entities/stream takes NDJSON lines of {"id", "text"} and answers with
+# NDJSON lines of {"id", "entities"} (or {"id", "error"}) as each nlp.pipe
+# batch finishes. At most two batches are held at a time: one being parsed
+# while the next is read, so memory stays flat however large the corpus is.
+
+ENTITIES_STREAM_BATCH_SIZE = int(os.environ.get("ENTITIES_STREAM_BATCH_SIZE", "64"))
+ENTITIES_STREAM_MAX_LINE_BYTES = int(os.environ.get("ENTITIES_STREAM_MAX_LINE_BYTES", str(1024 * 1024)))
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that never reads from the client. The stock one listens on
+    receive() for a disconnect, which would swallow request body chunks that the
+    body iterator is still reading; here a disconnect surfaces from the body read.
+    """
+
+    async def __call__(self, scope, receive, send) -> None:
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+async def read_ndjson_lines(http_request: Request):
+    """
+    Lines of the request body as bytes; overlong lines come back as None.
+    Each chunk is split once and only its trailing partial line is carried over.
+    """
+    partial: List[bytes] = []  # Pieces of the line still being read
+    partial_size = 0
+    skipping = False  # Inside a line already reported as too long
+    async for chunk in http_request.stream():
+        lines = chunk.split(b"\n")
+        tail = lines.pop()
+        if lines and partial:
+            lines[0] = b"".join(partial) + lines[0]
+            partial, partial_size = [], 0
+        for line in lines:
+            if skipping:
+                skipping = False
+            elif len(line) > ENTITIES_STREAM_MAX_LINE_BYTES:
+                yield None
+            elif line.strip():
+                yield line
+        if skipping:
+            continue
+        partial.append(tail)
+        partial_size += len(tail)
+        if partial_size > ENTITIES_STREAM_MAX_LINE_BYTES:
+            yield None
+            skipping = True
+            partial, partial_size = [], 0
+    line = b"".join(partial)
+    if line.strip() and not skipping:
+        yield line
+
+
+def parse_ndjson_record(line: Optional[bytes]) -> Tuple[Any, Optional[str], Optional[str]]:
+    """(id, text, error) for one input line."""
+    if line is None:
+        return None, None, f"Line longer than {ENTITIES_STREAM_MAX_LINE_BYTES} bytes"
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        return None, None, f"Invalid JSON: {e}"
+    if not isinstance(record, dict):
+        return None, None, "Expected an object with id and text"
+    if not isinstance(record.get("text"), str):
+        return record.get("id"), None, "Missing text"
+    return record.get("id"), record["text"], None
+
+
+def extract_entities_batch(records: List[Tuple[Any, Optional[str], Optional[str]]]) -> bytes:
+    """NDJSON output for one batch, in input order."""
+    texts = [text for _, text, error in records if error is None]
+    with entities_gate.admit(sum(len(text) for text in texts)):
+        docs = iter(entities_nlp.pipe(texts, batch_size=max(1, len(texts))))
+        lines = []
+        for record_id, _, error in records:
+            if error is None:
+                entities = [{"text": ent.text, "label": ent.label_} for ent in next(docs).ents]
+                lines.append(json.dumps({"id": record_id, "entities": entities}))
+            else:
+                lines.append(json.dumps({"id": record_id, "error": error}))
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+@app.post("/nlp/entities/stream")
+async def nlp_entities_stream(http_request: Request):
+    """
+    Entity extraction over an NDJSON body of {"id", "text"} lines, streamed back
+    as NDJSON in input order. The response starts before the body is fully read,
+    so clients should read it while still sending (e.g. curl -T - or httpx).
+    Batches wait for the entities admission gate instead of being rejected.
+    """
+    loop = asyncio.get_running_loop()
+
+    async def run_batch(records) -> bytes:
+        while True:
+            try:
+                return await loop.run_in_executor(None, extract_entities_batch, records)
+            except HTTPException as e:
+                # Back off while interactive requests hold the gate
+                await asyncio.sleep(min(10, int(e.headers["Retry-After"])))
+
+    async def results():
+        pending: Optional[asyncio.Task] = None
+        batch = []
+        count = 0
+        started = time.perf_counter()
+        try:
+            async for line in read_ndjson_lines(http_request):
+                batch.append(parse_ndjson_record(line))
+                if len(batch) < ENTITIES_STREAM_BATCH_SIZE:
+                    continue
+                if pending is not None:
+                    yield await pending
+                pending = asyncio.ensure_future(run_batch(batch))
+                count += len(batch)
+                batch = []
+            if pending is not None:
+                yield await pending
+                pending = None
+            if batch:
+                count += len(batch)
+                yield await run_batch(batch)
+            logger.info("entities stream texts=%d seconds=%.2f", count, time.perf_counter() - started)
+        except ClientDisconnect:
+            logger.info("entities stream client disconnected after texts=%d", count)
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+    return DuplexStreamingResponse(results(), media_type="application/x-ndjson")
 
 
 # Scheduler models and endpoint
@@ -337,6 +1043,8 @@ class Session(BaseModel):
     topic: str
     capacity: int
     roomId: Optional[int] = None  # User-provided room assignment (or None if whole venue)
+    startTime: Optional[str] = None  # Previous assignment (ISO datetime), used as a solver hint
+    pinned: bool = False  # Keep the previous startTime fixed instead of rescheduling
 
 
 class ScheduleEventRequest(BaseModel):
@@ -345,28 +1053,166 @@ class ScheduleEventRequest(BaseModel):
     endDate: str  # ISO date string
     gapMinutes: Optional[int] = 0  # Gap time in minutes between sessions in same room
     startTime: Optional[str] = None  # UTC start time (format: YYYY-MM-DDTHH:mm:ss), defaults to 9 AM if not provided
+    slotMinutes: Optional[int] = None  # Slot granularity, defaults to SCHEDULE_SLOT_MINUTES / auto
+    solver: Optional["SolverOptions"] = None  # Per-request overrides of the SOLVER_* settings
+    assignRooms: bool = False  # Let the solver choose rooms (by capacity) for sessions without roomId
+    mode: Optional[str] = None  # exact | fast | hybrid, defaults to SCHEDULE_MODE
     sessions: List[Session]
     rooms: List[Room]
 
 
+class SolverOptions(BaseModel):
+    profile: Optional[str] = None  # fast | balanced | thorough, defaults to SOLVER_PROFILE
+    numWorkers: Optional[int] = None  # CP-SAT search workers, 0 = the solve's share of the cores
+    randomSeed: Optional[int] = None
+    deterministic: Optional[bool] = None  # Reproducible search (interleaved workers, deterministic time limit)
+    maxTimeSeconds: Optional[float] = None  # Overrides the size-scaled time limit
+
+
+class SolverStats(BaseModel):
+    status: str
+    profile: str
+    numWorkers: int
+    deterministic: bool
+    timeLimitSeconds: float
+    wallTime: float
+    branches: int
+    conflicts: int
+    objectiveValue: Optional[float] = None
+    bestBound: Optional[float] = None
+    components: int = 1  # Independent subproblems solved (objective/bound are only reported for one)
+    numVariables: int = 0
+    numConstraints: int = 0
+
+
+ScheduleEventRequest.model_rebuild()
+
+
 class ScheduleAssignment(BaseModel):
     sessionId: int
     roomId: Optional[int] = None
     startTime: Optional[str] = None  # ISO datetime string
 
 
+class InfeasibilityReason(BaseModel):
+    kind: str  # session_too_long | room | rooms | whole_venue | speaker | pinned
+    message: str
+    roomId: Optional[int] = None
+    speaker: Optional[str] = None
+    sessionIds: List[int] = []
+    demandMinutes: Optional[int] = None  # Load bounds only: time the sessions need (including gaps where they apply)
+    availableMinutes: Optional[int] = None  # Load bounds only: time the horizon offers them
+
+
 class ScheduleEventResponse(BaseModel):
     assignments: List[ScheduleAssignment]
     success: bool
     message: Optional[str] = None
+    diagnosis: Optional[List[InfeasibilityReason]] = None  # Why the request cannot fit, when known
+    movedSessions: Optional[int] = None  # Previously scheduled sessions whose start time changed
+    solverStats: Optional[SolverStats] = None
+    engine: Optional[str] = None  # greedy | cp-sat | hybrid (greedy warm start refined by CP-SAT)
+    phaseSeconds: Optional[Dict[str, float]] = None  # Wall time per scheduling phase
+    cache: Optional[str] = None  # hit | warm-start when the schedule cache answered or seeded the solve
+
+
+DEFAULT_SLOT_MINUTES = 5
+DAY_END_HOUR = 17  # Sessions must finish by 5 PM each day
+# Slot granularity in minutes; "auto" picks the GCD of session durations, the gap and start offsets
+SCHEDULE_SLOT_MINUTES = os.environ.get("SCHEDULE_SLOT_MINUTES", "auto")
+
+
+def choose_slot_minutes(
+    duration_minutes: List[int],
+    gap_minutes: int,
+    requested: Optional[int] = None,
+    start_offsets: Optional[List[int]] = None
+) -> int:
+    """
+    Pick the slot granularity for a request. By default this is the GCD of all
+    session durations, the gap and the previous/pinned start offsets, so every
+    duration is a whole number of slots and every earlier start lies on the grid.
+    Falls back to 5-minute slots (durations rounded up) when the GCD is finer.
+    """
+    if requested:
+        return max(1, requested)
+    if SCHEDULE_SLOT_MINUTES != "auto":
+        return max(1, int(SCHEDULE_SLOT_MINUTES))
+
+    slot = 0
+    for minutes in duration_minutes + [gap_minutes] + (start_offsets or []):
+        if minutes > 0:
+            slot = gcd(slot, minutes)
+    return slot if slot >= DEFAULT_SLOT_MINUTES else DEFAULT_SLOT_MINUTES
+
+
+def get_start_offsets(request: ScheduleEventRequest) -> List[int]:
+    """Minutes from the first slot of the day to each previous or pinned start time."""
+    start_hour, start_minute = parse_day_start(request.startTime)
+    offsets = []
+    for session in request.sessions:
+        previous = parse_previous_start(session.startTime)
+        if previous is not None:
+            offsets.append((previous.hour - start_hour) * 60 + previous.minute - start_minute)
+    return offsets
+
+
+class TimeHorizon:
+    """
+    Day-aware slot model for the scheduling window.
 
+    Slot indices run across days: each day has slots_per_day open slots from the
+    start time until 5 PM, followed by gap_slots closed "night" slots. A session's
+    start domain has a hole over every night, so no session runs across the
+    5 PM -> next-morning seam, and a gap-extended interval ending at 5 PM never
+    reaches the next morning. Slot <-> datetime mapping is arithmetic.
+    """
 
-def generate_time_slots(start_date: str, end_date: str, slot_duration_minutes: int = 5, start_time_str: Optional[str] = None) -> List[datetime]:
-    """Generate time slots from start_date to end_date, using provided start time or defaulting to 9 AM."""
-    start = datetime.fromisoformat(start_date)
-    end = datetime.fromisoformat(end_date)
-    end = end.replace(hour=23, minute=59, second=59)  # End of day
-    
+    def __init__(self, first_day: date, num_days: int, start_hour: int, start_minute: int,
+                 slot_minutes: int, slots_per_day: int, gap_slots: int):
+        self.first_day = first_day
+        self.num_days = num_days
+        self.start_hour = start_hour
+        self.start_minute = start_minute
+        self.slot_minutes = slot_minutes
+        self.slots_per_day = slots_per_day
+        self.day_stride = slots_per_day + gap_slots
+        self.num_slots = num_days * self.day_stride
+
+    def to_datetime(self, slot: int) -> Optional[datetime]:
+        """Datetime at which the given slot starts, or None for a closed slot."""
+        day, offset = divmod(slot, self.day_stride)
+        if slot < 0 or day >= self.num_days or offset >= self.slots_per_day:
+            return None
+        day_start = datetime.combine(
+            self.first_day + timedelta(days=day),
+            datetime.min.time().replace(hour=self.start_hour, minute=self.start_minute)
+        )
+        return day_start + timedelta(minutes=offset * self.slot_minutes)
+
+    def to_slot(self, value: datetime) -> Optional[int]:
+        """Slot starting at the given datetime, or None if it is not an open slot boundary."""
+        day = (value.date() - self.first_day).days
+        minutes = (value.hour - self.start_hour) * 60 + (value.minute - self.start_minute)
+        if day < 0 or day >= self.num_days or minutes < 0 or value.second or value.microsecond:
+            return None
+        offset, remainder = divmod(minutes, self.slot_minutes)
+        if remainder or offset >= self.slots_per_day:
+            return None
+        return day * self.day_stride + offset
+
+    def start_domain(self, duration_slots: int) -> cp_model.Domain:
+        """Valid start slots for a session of this length: it must end by 5 PM on its day."""
+        latest = self.slots_per_day - duration_slots
+        if latest < 0:
+            return cp_model.Domain.FromValues([])
+        return cp_model.Domain.FromIntervals([
+            [day * self.day_stride, day * self.day_stride + latest] for day in range(self.num_days)
+        ])
+
+
+def parse_day_start(start_time_str: Optional[str]) -> Tuple[int, int]:
+    """Hour and minute of the first slot each day: the request's startTime, or 9 AM."""
     # Parse start time if provided (format: YYYY-MM-DDTHH:mm:ss in UTC)
     # Extract hour and minute from the start time string
     start_hour = 9  # Default to 9 AM
@@ -380,49 +1226,234 @@ def generate_time_slots(start_date: str, end_date: str, slot_duration_minutes: i
         except (ValueError, AttributeError):
             # If parsing fails, use default 9 AM
             pass
+    return start_hour, start_minute
+
+
+def build_time_horizon(start_date: str, end_date: str, slot_minutes: int = DEFAULT_SLOT_MINUTES,
+                       gap_slots: int = 0, start_time_str: Optional[str] = None) -> TimeHorizon:
+    """Build the slot model from start_date to end_date, using provided start time or defaulting to 9 AM."""
+    start = datetime.fromisoformat(start_date)
+    end = datetime.fromisoformat(end_date)
+    start_hour, start_minute = parse_day_start(start_time_str)
+
+    num_days = max(0, (end.date() - start.date()).days + 1)
+    day_minutes = max(0, DAY_END_HOUR * 60 - (start_hour * 60 + start_minute))
+    return TimeHorizon(
+        first_day=start.date(),
+        num_days=num_days,
+        start_hour=start_hour,
+        start_minute=start_minute,
+        slot_minutes=slot_minutes,
+        slots_per_day=day_minutes // slot_minutes,
+        gap_slots=gap_slots,
+    )
+
+
+def estimate_schedule_cost(request: ScheduleEventRequest) -> int:
+    """Rough solve cost for admission control: sessions x open slots in the horizon."""
+    durations = [max(1, session.durationMin) for session in request.sessions]
+    slot_minutes = choose_slot_minutes(durations, request.gapMinutes or 0, request.slotMinutes, get_start_offsets(request))
+    try:
+        horizon = build_time_horizon(request.startDate, request.endDate, slot_minutes, 0, request.startTime)
+        slots = horizon.num_days * horizon.slots_per_day
+    except (TypeError, ValueError):
+        slots = 0  # Rejected properly by the solve itself
+    return max(1, len(request.sessions) * slots)
+
+
+# ============================================================================
+# Solver Configuration
+# ============================================================================
+# Profiles scale the size-based time limit; SOLVER_* env settings are the
+# defaults and SolverOptions on the request override them.
+
+SOLVER_PROFILES = {
+    "fast": 0.25,
+    "balanced": 1.0,
+    "thorough": 4.0,
+}
+SOLVER_PROFILE = os.environ.get("SOLVER_PROFILE", "balanced")
+SOLVER_NUM_WORKERS = int(os.environ.get("SOLVER_NUM_WORKERS", "0"))  # 0 = the solve's share of the cores
+SOLVER_RANDOM_SEED = int(os.environ.get("SOLVER_RANDOM_SEED", "0"))
+SOLVER_DETERMINISTIC = os.environ.get("SOLVER_DETERMINISTIC", "false").lower() in ("1", "true", "yes")
+# Time limit = (base + per-session * sessions) * profile scale, capped at the maximum
+SOLVER_BASE_TIME_SECONDS = float(os.environ.get("SOLVER_BASE_TIME_SECONDS", "5"))
+SOLVER_TIME_PER_SESSION_SECONDS = float(os.environ.get("SOLVER_TIME_PER_SESSION_SECONDS", "0.1"))
+SOLVER_MAX_TIME_SECONDS = float(os.environ.get("SOLVER_MAX_TIME_SECONDS", "90"))
+
+
+def available_cores() -> int:
+    """CPU cores this process may run on (respects container CPU sets)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def solve_cores(gate: Optional[AdmissionGate] = None) -> int:
+    """
+    Cores for one admitted solve: the machine's cores split between every solve
+    the HTTP workers may run at once (WEB_CONCURRENCY x the gate's concurrency).
+    """
+    gate = gate or schedule_gate
+    return max(1, available_cores() // (WEB_CONCURRENCY * gate.max_concurrent))
+
+
+def solver_time_limit(options: Optional[SolverOptions], num_sessions: int) -> float:
+    """Time limit in seconds: explicit maxTimeSeconds, else scaled by size and profile."""
+    options = options or SolverOptions()
+    if options.maxTimeSeconds is not None:
+        return options.maxTimeSeconds
+    profile = options.profile or SOLVER_PROFILE
+    if profile not in SOLVER_PROFILES:
+        raise ValueError(f"Unknown solver profile '{profile}'. Use one of: {', '.join(SOLVER_PROFILES)}")
+    return min(
+        SOLVER_MAX_TIME_SECONDS,
+        (SOLVER_BASE_TIME_SECONDS + SOLVER_TIME_PER_SESSION_SECONDS * num_sessions) * SOLVER_PROFILES[profile]
+    )
+
+
+def configure_solver(
+    solver: cp_model.CpSolver,
+    options: Optional[SolverOptions],
+    num_sessions: int
+) -> Dict[str, Any]:
+    """
+    Apply the solver profile to solver.parameters.
+    In deterministic mode the workers interleave their search and the limit is
+    deterministic time, so the same request always yields the same schedule.
     
-    slots = []
-    current_date = start.date()
-    end_date_obj = end.date()
+    Returns:
+        The resolved settings (profile, numWorkers, deterministic, timeLimitSeconds)
+    """
+    options = options or SolverOptions()
+    profile = options.profile or SOLVER_PROFILE
+    time_limit = solver_time_limit(options, num_sessions)
     
-    while current_date <= end_date_obj:
-        # Start at the specified time (or 9 AM default) each day
-        current_time = datetime.combine(current_date, datetime.min.time().replace(hour=start_hour, minute=start_minute))
-        # End at 5 PM each day
-        day_end = datetime.combine(current_date, datetime.min.time().replace(hour=17))
-        
-        while current_time <= day_end:
-            slots.append(current_time)
-            current_time += timedelta(minutes=slot_duration_minutes)
-        
-        current_date += timedelta(days=1)
+    num_workers = options.numWorkers if options.numWorkers is not None else SOLVER_NUM_WORKERS
+    if num_workers <= 0:
+        num_workers = solve_cores()
+    deterministic = options.deterministic if options.deterministic is not None else SOLVER_DETERMINISTIC
+    
+    solver.parameters.num_workers = num_workers
+    solver.parameters.random_seed = options.randomSeed if options.randomSeed is not None else SOLVER_RANDOM_SEED
+    if deterministic:
+        # Wall-clock cap stays as a safety net; it only breaks reproducibility if hit first
+        solver.parameters.interleave_search = True
+        solver.parameters.max_deterministic_time = time_limit
+        solver.parameters.max_time_in_seconds = max(time_limit, SOLVER_MAX_TIME_SECONDS)
+    else:
+        solver.parameters.max_time_in_seconds = time_limit
     
-    return slots
+    return {
+        "profile": profile,
+        "numWorkers": num_workers,
+        "deterministic": deterministic,
+        "timeLimitSeconds": time_limit,
+    }
+
+
+def collect_solver_stats(
+    solver: cp_model.CpSolver,
+    status: int,
+    settings: Dict[str, Any],
+    model: cp_model.CpModel
+) -> SolverStats:
+    """Summarize a finished solve (and the model's size) for the response."""
+    has_solution = status in (cp_model.OPTIMAL, cp_model.FEASIBLE)
+    proto = model.Proto()
+    return SolverStats(
+        status=solver.StatusName(status),
+        wallTime=solver.WallTime(),
+        branches=solver.NumBranches(),
+        conflicts=solver.NumConflicts(),
+        objectiveValue=solver.ObjectiveValue() if has_solution else None,
+        bestBound=solver.BestObjectiveBound() if has_solution else None,
+        numVariables=len(proto.variables),
+        numConstraints=len(proto.constraints),
+        **settings
+    )
 
 
 # ============================================================================
 # Scheduler Helper Functions 
 # ============================================================================
 
+def parse_previous_start(value: Optional[str]) -> Optional[datetime]:
+    """Parse a previously assigned start time; aware values are converted to naive UTC."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def get_previous_slot(session: Session, horizon: TimeHorizon, duration_slots: int) -> Optional[int]:
+    """Session's previous start slot, or None if it has none or it no longer fits."""
+    previous = parse_previous_start(session.startTime)
+    slot = horizon.to_slot(previous) if previous is not None else None
+    if slot is not None and not horizon.start_domain(duration_slots).contains(slot):
+        return None
+    return slot
+
+
+def get_previous_slots(
+    sessions: List[Session],
+    horizon: TimeHorizon,
+    session_slot_durations: List[int]
+) -> Tuple[List[Optional[int]], List[Optional[int]]]:
+    """
+    Map previous start times onto the current horizon.
+    A previous time that no longer fits (outside the window, off the slot grid, or
+    now running past 5 PM) is dropped, so that session is scheduled from scratch.
+    Pinned times that don't fit never get here: the precheck rejects them.
+    
+    Returns:
+        Tuple of (previous_slots, fixed_slots) where:
+        - previous_slots[i] is session i's previous start slot (or None)
+        - fixed_slots[i] is the same slot if session i is pinned (or None)
+    """
+    previous_slots = []
+    fixed_slots = []
+    for i, session in enumerate(sessions):
+        slot = get_previous_slot(session, horizon, session_slot_durations[i])
+        previous_slots.append(slot)
+        fixed_slots.append(slot if session.pinned else None)
+    return previous_slots, fixed_slots
+
+
 def create_interval_variables(
     model: cp_model.CpModel,
     num_sessions: int,
-    num_slots: int,
-    session_slot_durations: List[int]
+    horizon: TimeHorizon,
+    session_slot_durations: List[int],
+    fixed_slots: Optional[List[Optional[int]]] = None
 ) -> Tuple[List[cp_model.IntVar], List[cp_model.IntervalVar]]:
     """
     Create interval variables for each session with proper start, size, and end variables.
-    Always schedules time slots (never preserves existing times).
+    Start domains only contain slots from which the session finishes on the same day.
+    Pinned sessions (fixed_slots[i] is not None) get a constant start, so only new or
+    edited sessions remain decision variables.
     
     Returns:
         Tuple of (start_vars, interval_vars) where:
         - start_vars[i] is the start slot index for session i
         - interval_vars[i] is the interval variable for session i
     """
-    start_vars = [
-        model.NewIntVar(0, num_slots - 1, f'start_{i}') 
-        for i in range(num_sessions)
-    ]
+    num_slots = horizon.num_slots
+    start_vars = []
+    for i in range(num_sessions):
+        fixed_slot = fixed_slots[i] if fixed_slots else None
+        if fixed_slot is not None:
+            start_vars.append(model.NewConstant(fixed_slot))
+        else:
+            start_vars.append(
+                model.NewIntVarFromDomain(horizon.start_domain(session_slot_durations[i]), f'start_{i}')
+            )
     
     interval_vars = []
     for i in range(num_sessions):
@@ -442,6 +1473,38 @@ def create_interval_variables(
     return start_vars, interval_vars
 
 
+def add_previous_assignment_hints(
+    model: cp_model.CpModel,
+    start_vars: List[cp_model.IntVar],
+    previous_slots: List[Optional[int]],
+    fixed_slots: List[Optional[int]],
+    hint_slots: Optional[List[int]] = None
+) -> List[cp_model.IntVar]:
+    """
+    Seed the solver with the previous assignment (AddHint) so it starts from the
+    existing schedule instead of from scratch. A complete warm start (hint_slots,
+    e.g. from the greedy engine) replaces the previous slots as the hint.
+    
+    Returns:
+        List of "moved" booleans, one per previously scheduled (not pinned) session;
+        the objective minimizes their sum as a tie-breaker to keep churn low.
+    """
+    moved_vars = []
+    for i, previous_slot in enumerate(previous_slots):
+        if fixed_slots[i] is not None:
+            continue
+        hint = hint_slots[i] if hint_slots else previous_slot
+        if hint is not None:
+            model.AddHint(start_vars[i], hint)
+        if previous_slot is None:
+            continue
+        moved = model.NewBoolVar(f'moved_{i}')
+        model.Add(start_vars[i] == previous_slot).OnlyEnforceIf(moved.Not())
+        model.AddHint(moved, int(hint != previous_slot))
+        moved_vars.append(moved)
+    return moved_vars
+
+
 def get_room_indices_for_sessions(
     sessions: List[Session],
     rooms: List[Room]
@@ -466,59 +1529,151 @@ def get_room_indices_for_sessions(
     return room_indices
 
 
-def add_room_no_overlap_constraints(
-    model: cp_model.CpModel,
-    num_sessions: int,
-    num_rooms: int,
-    start_vars: List[cp_model.IntVar],
-    interval_vars: List[cp_model.IntervalVar],
-    room_indices: List[Optional[int]],
-    session_slot_durations: List[int],
-    gap_slots: int,
+def get_room_candidates(
+    sessions: List[Session],
+    rooms: List[Room],
+    room_indices: List[Optional[int]]
+) -> List[Optional[List[int]]]:
+    """
+    Rooms the solver may choose for each session without a user-provided room.
+    Rooms are sorted by capacity once, so each session's fitting rooms are a bisect
+    away and rooms that are too small never enter the model.
+    
+    Returns:
+        List where room_candidates[i] is the fitting room indices (smallest first) for a
+        session to be assigned, or None if session i already has a room
+    """
+    by_capacity = sorted(range(len(rooms)), key=lambda r_idx: rooms[r_idx].capacity)
+    capacities = [rooms[r_idx].capacity for r_idx in by_capacity]
+    return [
+        by_capacity[bisect_left(capacities, session.capacity):] if room_indices[i] is None else None
+        for i, session in enumerate(sessions)
+    ]
+
+
+def create_room_options(
+    model: cp_model.CpModel,
+    start_vars: List[cp_model.IntVar],
+    session_slot_durations: List[int],
+    gap_slots: int,
+    room_candidates: List[Optional[List[int]]]
+) -> List[Dict[int, Tuple[cp_model.IntVar, cp_model.IntervalVar]]]:
+    """
+    One optional gap-extended interval per (session, fitting room) pair; exactly one
+    of each session's presence literals is true.
+    
+    Returns:
+        List where room_options[i] maps room index -> (presence literal, optional interval),
+        empty for sessions with a user-provided room
+    """
+    room_options = []
+    for i, candidates in enumerate(room_candidates):
+        options = {}
+        for r_idx in candidates or []:
+            present = model.NewBoolVar(f'session_{i}_in_room_{r_idx}')
+            interval = model.NewOptionalFixedSizeIntervalVar(
+                start_vars[i], session_slot_durations[i] + gap_slots, present, f'session_{i}_room_{r_idx}_interval'
+            )
+            options[r_idx] = (present, interval)
+        if options:
+            model.AddExactlyOne(present for present, _ in options.values())
+        room_options.append(options)
+    return room_options
+
+
+def get_whole_venue_flags(
+    room_indices: List[Optional[int]],
+    room_options: Optional[List[Dict[int, Tuple[cp_model.IntVar, cp_model.IntervalVar]]]] = None
+) -> List[bool]:
+    """Sessions that block the whole venue: no user-provided room and no room to choose from."""
+    return [
+        room_idx is None and not (room_options and room_options[i])
+        for i, room_idx in enumerate(room_indices)
+    ]
+
+
+def create_gap_extended_intervals(
+    model: cp_model.CpModel,
+    num_sessions: int,
+    start_vars: List[cp_model.IntVar],
+    interval_vars: List[cp_model.IntervalVar],
+    session_slot_durations: List[int],
+    gap_slots: int,
     num_slots: int
+) -> List[cp_model.IntervalVar]:
+    """
+    Create one interval per session that includes the trailing gap time.
+    Two gap-extended intervals that don't overlap are at least gap_slots apart.
+    Returns the original interval variables when there is no gap.
+    """
+    if gap_slots <= 0:
+        return interval_vars
+
+    extended_intervals = []
+    for i in range(num_sessions):
+        extended_size = session_slot_durations[i] + gap_slots
+        extended_end = model.NewIntVar(0, num_slots, f'extended_end_{i}')
+        model.Add(extended_end == start_vars[i] + extended_size)
+        extended_intervals.append(model.NewIntervalVar(
+            start_vars[i],
+            extended_size,
+            extended_end,
+            f'extended_session_{i}'
+        ))
+    return extended_intervals
+
+
+def add_room_no_overlap_constraints(
+    model: cp_model.CpModel,
+    num_sessions: int,
+    num_rooms: int,
+    extended_intervals: List[cp_model.IntervalVar],
+    room_indices: List[Optional[int]],
+    room_options: Optional[List[Dict[int, Tuple[cp_model.IntVar, cp_model.IntervalVar]]]] = None,
+    guards: Optional["ConstraintGuards"] = None
 ) -> None:
     """
     Add no-overlap constraints per room using AddNoOverlap.
     Sessions in the same room cannot overlap (with gap time).
+    Whole venue sessions occupy every room, so they join each room's set too.
+    Solver-assigned sessions join each fitting room's set with an optional interval.
+    With guards, each room's constraint can be switched off by its own literal.
     """
-    for r_idx in range(num_rooms):
-        # Collect intervals of sessions assigned to this room
-        room_intervals = []
-        
-        for i in range(num_sessions):
-            if room_indices[i] == r_idx:
-                # Session is in this room - add interval with gap
-                if gap_slots > 0:
-                    # Create extended interval that includes gap time
-                    extended_size = session_slot_durations[i] + gap_slots
-                    extended_end = model.NewIntVar(0, num_slots, f'extended_end_{i}_room_{r_idx}')
-                    model.Add(extended_end == start_vars[i] + extended_size)
-                    
-                    extended_interval = model.NewIntervalVar(
-                        start_vars[i],
-                        extended_size,
-                        extended_end,
-                        f'extended_session_{i}_room_{r_idx}'
-                    )
-                    room_intervals.append(extended_interval)
-                else:
-                    # No gap, use original interval
-                    room_intervals.append(interval_vars[i])
-        
-        # Add no-overlap constraint for this room
-        if room_intervals:
-            model.AddNoOverlap(room_intervals)
+    whole_venue = get_whole_venue_flags(room_indices, room_options)
+    whole_venue_members = [i for i in range(num_sessions) if whole_venue[i]]
+    whole_venue_intervals = [extended_intervals[i] for i in whole_venue_members]
+
+    room_intervals: List[List[cp_model.IntervalVar]] = [[] for _ in range(num_rooms)]
+    room_members: List[List[int]] = [[] for _ in range(num_rooms)]
+    for i in range(num_sessions):
+        if room_indices[i] is not None:
+            room_intervals[room_indices[i]].append(extended_intervals[i])
+            room_members[room_indices[i]].append(i)
+        elif room_options and room_options[i]:
+            for r_idx, (_, interval) in room_options[i].items():
+                room_intervals[r_idx].append(interval)
+                room_members[r_idx].append(i)
+
+    for r_idx, intervals in enumerate(room_intervals):
+        # Rooms without their own sessions add nothing beyond the whole venue constraint
+        if intervals:
+            intervals = intervals + whole_venue_intervals
+            if guards:
+                intervals = guards.guard(intervals, room_members[r_idx] + whole_venue_members, "room", room_idx=r_idx)
+            model.AddNoOverlap(intervals)
 
 
 def add_speaker_no_overlap_constraints(
     model: cp_model.CpModel,
     num_sessions: int,
     sessions: List[Session],
-    interval_vars: List[cp_model.IntervalVar]
+    interval_vars: List[cp_model.IntervalVar],
+    guards: Optional["ConstraintGuards"] = None
 ) -> None:
     """
     Add no-overlap constraints for speakers.
     Sessions with the same speaker cannot overlap.
+    With guards, each speaker's constraint can be switched off by its own literal.
     """
     # Group sessions by speaker
     speaker_sessions: Dict[str, List[int]] = {}
@@ -534,87 +1689,37 @@ def add_speaker_no_overlap_constraints(
     for speaker, session_indices in speaker_sessions.items():
         if len(session_indices) > 1:
             speaker_intervals = [interval_vars[i] for i in session_indices]
+            if guards:
+                speaker_intervals = guards.guard(speaker_intervals, session_indices, "speaker", speaker=speaker)
             model.AddNoOverlap(speaker_intervals)
 
 
 def add_whole_venue_no_overlap_constraints(
     model: cp_model.CpModel,
     num_sessions: int,
+    extended_intervals: List[cp_model.IntervalVar],
     room_indices: List[Optional[int]],
-    start_vars: List[cp_model.IntVar],
-    interval_vars: List[cp_model.IntervalVar],
-    session_slot_durations: List[int],
-    gap_slots: int,
-    num_slots: int
+    room_options: Optional[List[Dict[int, Tuple[cp_model.IntVar, cp_model.IntervalVar]]]] = None,
+    guards: Optional["ConstraintGuards"] = None
 ) -> None:
     """
     Add no-overlap constraints for whole venue sessions.
     Sessions without rooms (whole venue) cannot overlap with ANY other session.
     Gap time is respected between whole venue sessions and all other sessions.
-    Uses interval variables with AddNoOverlap for efficiency.
+
+    Overlap with roomed sessions is handled by add_room_no_overlap_constraints,
+    which puts every whole venue interval into each occupied room's AddNoOverlap
+    (linear in sessions, instead of a reified disjunction per session pair). Any
+    such room set also keeps whole venue sessions apart from each other, so they
+    only need their own constraint when no session has a room.
     """
-    # Find all sessions without rooms (whole venue)
-    whole_venue_sessions = [i for i in range(num_sessions) if room_indices[i] is None]
-    
-    if not whole_venue_sessions:
-        return
-    
-    # Create extended intervals for whole venue sessions (with gap)
-    whole_venue_intervals = []
-    for i in whole_venue_sessions:
-        if gap_slots > 0:
-            # Create extended interval that includes gap time
-            extended_size = session_slot_durations[i] + gap_slots
-            extended_end = model.NewIntVar(0, num_slots, f'extended_end_whole_venue_{i}')
-            model.Add(extended_end == start_vars[i] + extended_size)
-            
-            extended_interval = model.NewIntervalVar(
-                start_vars[i],
-                extended_size,
-                extended_end,
-                f'extended_whole_venue_{i}'
-            )
-            whole_venue_intervals.append(extended_interval)
-        else:
-            # No gap, use original interval
-            whole_venue_intervals.append(interval_vars[i])
-    
-    # Whole venue sessions cannot overlap with each other
-    if len(whole_venue_intervals) > 1:
+    whole_venue = get_whole_venue_flags(room_indices, room_options)
+    whole_venue_intervals = [extended_intervals[i] for i in range(num_sessions) if whole_venue[i]]
+
+    if len(whole_venue_intervals) > 1 and all(whole_venue):
+        if guards:
+            whole_venue_intervals = guards.guard(whole_venue_intervals, list(range(num_sessions)), "whole_venue")
         model.AddNoOverlap(whole_venue_intervals)
-    
-    # Create a mapping from session index to its extended interval
-    whole_venue_interval_map = {}
-    for idx, i in enumerate(whole_venue_sessions):
-        whole_venue_interval_map[i] = whole_venue_intervals[idx]
-    
-    # For each whole venue session, ensure it doesn't overlap with any roomed session
-    # We need to check against each roomed session individually
-    for i in whole_venue_sessions:
-        # Check against each roomed session
-        for j in range(num_sessions):
-            if room_indices[j] is not None:  # Roomed session
-                # Create a constraint that whole venue session i and roomed session j don't overlap
-                # Use boolean constraints for this specific pair
-                i_before_j = model.NewBoolVar(f'whole_venue_{i}_before_roomed_{j}')
-                j_before_i = model.NewBoolVar(f'roomed_{j}_before_whole_venue_{i}')
-                
-                # i ends + gap before j starts
-                i_end_plus_gap = model.NewIntVar(0, num_slots, f'i_end_plus_gap_{i}_{j}')
-                model.Add(i_end_plus_gap == start_vars[i] + session_slot_durations[i] + gap_slots)
-                
-                model.Add(start_vars[j] >= i_end_plus_gap).OnlyEnforceIf(i_before_j)
-                model.Add(start_vars[j] < i_end_plus_gap).OnlyEnforceIf(i_before_j.Not())
-                
-                # j ends + gap before i starts
-                j_end_plus_gap = model.NewIntVar(0, num_slots, f'j_end_plus_gap_{i}_{j}')
-                model.Add(j_end_plus_gap == start_vars[j] + session_slot_durations[j] + gap_slots)
-                
-                model.Add(start_vars[i] >= j_end_plus_gap).OnlyEnforceIf(j_before_i)
-                model.Add(start_vars[i] < j_end_plus_gap).OnlyEnforceIf(j_before_i.Not())
-                
-                # At least one must be true (ensures no overlap with gap)
-                model.AddBoolOr([i_before_j, j_before_i])
 
 
 def add_temporal_constraints(
@@ -632,42 +1737,657 @@ def add_temporal_constraints(
         model.Add(start_vars[i] + session_slot_durations[i] <= num_slots)
 
 
+# Order interchangeable sessions by start slot (see find_interchangeable_sessions)
+SCHEDULE_SYMMETRY_BREAKING = os.environ.get("SCHEDULE_SYMMETRY_BREAKING", "true").lower() in ("1", "true", "yes")
+
+
+def find_interchangeable_sessions(
+    sessions: List[Session],
+    session_slot_durations: List[int],
+    room_indices: List[Optional[int]],
+    room_candidates: List[Optional[List[int]]],
+    previous_slots: List[Optional[int]],
+    fixed_slots: List[Optional[int]]
+) -> List[List[int]]:
+    """
+    Group sessions that can swap schedules without changing feasibility or the
+    objective: same room (or the same fitting rooms), slot length, speaker and
+    topic. Sessions with a previous or pinned start time are never grouped, since
+    moving them counts against the objective.
+    
+    Returns:
+        Classes of two or more session indices, each in session order
+    """
+    classes: Dict[Tuple, List[int]] = {}
+    for i, session in enumerate(sessions):
+        if previous_slots[i] is not None or fixed_slots[i] is not None:
+            continue
+        candidates = tuple(room_candidates[i]) if room_candidates[i] is not None else None
+        speaker = (session.speaker or "").strip()
+        key = (room_indices[i], candidates, session_slot_durations[i], speaker, session.topic)
+        classes.setdefault(key, []).append(i)
+    return [members for members in classes.values() if len(members) > 1]
+
+
+def add_symmetry_breaking_constraints(
+    model: cp_model.CpModel,
+    start_vars: List[cp_model.IntVar],
+    classes: List[List[int]]
+) -> None:
+    """
+    Start the sessions of each class in session order. Any schedule can be
+    rearranged this way, so the optimum is kept, and the solver no longer
+    explores the k! orderings of a class of k sessions.
+    """
+    for members in classes:
+        for a, b in zip(members, members[1:]):
+            model.Add(start_vars[a] <= start_vars[b])
+
+
+def order_hint_by_class(
+    hint: Tuple[List[int], List[Optional[int]]],
+    classes: List[List[int]]
+) -> Tuple[List[int], List[Optional[int]]]:
+    """Permute a (start slots, room indices) schedule within each class so it satisfies the ordering."""
+    start_slots, session_rooms = list(hint[0]), list(hint[1])
+    for members in classes:
+        placements = sorted(((start_slots[i], session_rooms[i]) for i in members), key=lambda placement: placement[0])
+        for i, (slot, room) in zip(members, placements):
+            start_slots[i] = slot
+            session_rooms[i] = room
+    return start_slots, session_rooms
+
+
+def add_topic_span_variables(
+    model: cp_model.CpModel,
+    num_slots: int,
+    start_vars: List[cp_model.IntVar],
+    sessions: List[Session]
+) -> List[cp_model.IntVar]:
+    """
+    Topic cohesion terms: one span (last start - first start) per topic with at least
+    two sessions. Linear size: two bounds per session instead of one variable per pair.
+    
+    Returns:
+        List of span variables, one per shared topic
+    """
+    topic_sessions: Dict[str, List[int]] = {}
+    for i, session in enumerate(sessions):
+        topic_sessions.setdefault(session.topic, []).append(i)
+    
+    spans = []
+    for t_idx, indices in enumerate(topic_sessions.values()):
+        if len(indices) < 2:
+            continue
+        first = model.NewIntVar(0, num_slots - 1, f'topic_first_{t_idx}')
+        last = model.NewIntVar(0, num_slots - 1, f'topic_last_{t_idx}')
+        for i in indices:
+            model.Add(first <= start_vars[i])
+            model.Add(last >= start_vars[i])
+        span = model.NewIntVar(0, num_slots - 1, f'topic_span_{t_idx}')
+        model.Add(span == last - first)
+        spans.append(span)
+    return spans
+
+
 def create_objective_function(
     model: cp_model.CpModel,
     num_sessions: int,
     num_slots: int,
     start_vars: List[cp_model.IntVar],
-    sessions: List[Session]
+    sessions: List[Session],
+    moved_vars: Optional[List[cp_model.IntVar]] = None
 ) -> None:
     """
-    Extract objective function creation (minimize max slot) into separate function.
-    Preserves topic grouping logic.
+    Extract objective function creation into separate function.
+    Lexicographic objective, encoded with weights:
+    1. Minimize max slot (makespan)
+    2. When rescheduling, minimize the number of moved sessions
+    3. Minimize the total per-topic span, so sessions of a topic run close together
+    Decomposed events optimize topic cohesion within each component.
     """
-    # Calculate max and min slot indices
     max_slot = model.NewIntVar(0, num_slots - 1, 'max_slot')
-    min_slot = model.NewIntVar(0, num_slots - 1, 'min_slot')
-    
     for i in range(num_sessions):
         model.Add(max_slot >= start_vars[i])
-        model.Add(min_slot <= start_vars[i])
     
-    schedule_span = model.NewIntVar(0, num_slots - 1, 'schedule_span')
-    model.Add(schedule_span == max_slot - min_slot)
+    topic_spans = add_topic_span_variables(model, num_slots, start_vars, sessions)
+    moved_vars = moved_vars or []
     
-    # Topic grouping penalty (minimize distance between sessions with same topic)
-    topic_penalty = []
-    for i in range(num_sessions):
-        for j in range(i + 1, num_sessions):
-            if sessions[i].topic == sessions[j].topic:
-                # Penalty is the absolute difference in slot assignments
-                diff = model.NewIntVar(0, num_slots, f'topic_diff_{i}_{j}')
-                model.AddAbsEquality(diff, start_vars[i] - start_vars[j])
-                topic_penalty.append(diff)
+    # Each weight exceeds the largest possible total of all lower-priority terms
+    moved_weight = len(topic_spans) * (num_slots - 1) + 1
+    makespan_weight = moved_weight * (len(moved_vars) + 1)
+    model.Minimize(
+        makespan_weight * max_slot + moved_weight * sum(moved_vars) + sum(topic_spans)
+    )
+
+
+def add_search_strategy(
+    model: cp_model.CpModel,
+    start_vars: List[cp_model.IntVar],
+    fixed_slots: List[Optional[int]]
+) -> None:
+    """
+    Decision strategy on the start variables: branch on the session that can start
+    earliest and try its earliest slot first. This packs the schedule left, which
+    finds a short makespan quickly; the fixed-search worker of the portfolio follows it.
+    """
+    decision_vars = [start_vars[i] for i in range(len(start_vars)) if fixed_slots[i] is None]
+    if decision_vars:
+        model.AddDecisionStrategy(decision_vars, cp_model.CHOOSE_LOWEST_MIN, cp_model.SELECT_MIN_VALUE)
+
+
+# ============================================================================
+# Feasibility Pre-check
+# ============================================================================
+# Load bounds that any schedule must satisfy. Requests that break one are
+# rejected with a diagnosis before a model is built or the solver runs.
+
+def diagnose_infeasibility(
+    sessions: List[Session],
+    rooms: List[Room],
+    horizon: TimeHorizon,
+    session_slot_durations: List[int],
+    gap_slots: int,
+    room_indices: List[Optional[int]],
+    room_candidates: List[Optional[List[int]]]
+) -> List[InfeasibilityReason]:
+    """
+    Compare the time each room, speaker and the whole venue needs with what the horizon offers.
+    Gap-extended sessions pack into day_stride slots per day (the trailing gap may run
+    into the night), speakers have no gap and get slots_per_day. An empty list means
+    the bounds hold; the request may still be infeasible for less obvious reasons.
+    """
+    slot_minutes = horizon.slot_minutes
+    room_day_slots = horizon.num_days * horizon.day_stride
+    speaker_day_slots = horizon.num_days * horizon.slots_per_day
+    reasons = []
+
+    # Sessions that do not fit in any single day
+    for i, session in enumerate(sessions):
+        if session_slot_durations[i] > horizon.slots_per_day:
+            reasons.append(InfeasibilityReason(
+                kind="session_too_long",
+                message=f"Session {session.id} lasts {session.durationMin} minutes but a day has "
+                        f"{horizon.slots_per_day * slot_minutes}",
+                sessionIds=[session.id],
+                demandMinutes=session.durationMin,
+                availableMinutes=horizon.slots_per_day * slot_minutes
+            ))
+
+    # Pinned start times must be open slots, or the pin would be silently dropped
+    for i, session in enumerate(sessions):
+        if session.pinned and session.startTime and session_slot_durations[i] <= horizon.slots_per_day \
+                and get_previous_slot(session, horizon, session_slot_durations[i]) is None:
+            reasons.append(InfeasibilityReason(
+                kind="pinned",
+                message=f"Session {session.id} is pinned at {session.startTime}, which is not a "
+                        f"{slot_minutes}-minute slot within the event's days and hours (ending by 5 PM)",
+                sessionIds=[session.id]
+            ))
+
+    extended = [duration + gap_slots for duration in session_slot_durations]
+    whole_venue = [
+        room_idx is None and room_candidates[i] is None for i, room_idx in enumerate(room_indices)
+    ]
+    whole_venue_ids = [session.id for i, session in enumerate(sessions) if whole_venue[i]]
+    whole_venue_load = sum(extended[i] for i in range(len(sessions)) if whole_venue[i])
+
+    room_sessions: Dict[int, List[int]] = {}
+    for i, room_idx in enumerate(room_indices):
+        if room_idx is not None:
+            room_sessions.setdefault(room_idx, []).append(i)
+    room_loads = {r_idx: sum(extended[i] for i in indices) for r_idx, indices in room_sessions.items()}
+
+    # Each room on its own
+    for r_idx, load in room_loads.items():
+        if load > room_day_slots:
+            reasons.append(InfeasibilityReason(
+                kind="room",
+                message=f"Room {rooms[r_idx].id} ({rooms[r_idx].name}) needs {load * slot_minutes} minutes (sessions plus gaps) "
+                        f"but has {room_day_slots * slot_minutes} over {horizon.num_days} day(s)",
+                roomId=rooms[r_idx].id,
+                sessionIds=[sessions[i].id for i in room_sessions[r_idx]],
+                demandMinutes=load * slot_minutes,
+                availableMinutes=room_day_slots * slot_minutes
+            ))
+
+    # Whole venue sessions block every room, so they share the busiest room's time
+    if whole_venue_load:
+        busiest = max(room_loads, key=room_loads.get) if room_loads else None
+        load = whole_venue_load + (room_loads[busiest] if busiest is not None else 0)
+        if load > room_day_slots:
+            with_room = f" plus room {rooms[busiest].id} ({rooms[busiest].name})" if busiest is not None else ""
+            reasons.append(InfeasibilityReason(
+                kind="whole_venue",
+                message=f"Whole venue sessions{with_room} need {load * slot_minutes} minutes "
+                        f"but the venue has {room_day_slots * slot_minutes} over {horizon.num_days} day(s)",
+                roomId=rooms[busiest].id if busiest is not None else None,
+                sessionIds=whole_venue_ids + ([sessions[i].id for i in room_sessions[busiest]] if busiest is not None else []),
+                demandMinutes=load * slot_minutes,
+                availableMinutes=room_day_slots * slot_minutes
+            ))
+
+    # Sessions the solver places (assignRooms) share all rooms with the roomed sessions
+    flexible = [i for i, candidates in enumerate(room_candidates) if candidates]
+    if flexible:
+        load = sum(room_loads.values()) + sum(extended[i] for i in flexible)
+        if load > room_day_slots * len(rooms):
+            reasons.append(InfeasibilityReason(
+                kind="rooms",
+                message=f"Sessions need {load * slot_minutes} room minutes (sessions plus gaps) but "
+                        f"{len(rooms)} room(s) have {room_day_slots * len(rooms) * slot_minutes}",
+                sessionIds=[session.id for session in sessions],
+                demandMinutes=load * slot_minutes,
+                availableMinutes=room_day_slots * len(rooms) * slot_minutes
+            ))
+
+    # Speakers (no gap between a speaker's own sessions)
+    speaker_sessions: Dict[str, List[int]] = {}
+    for i, session in enumerate(sessions):
+        speaker = (session.speaker or "").strip()
+        if speaker:
+            speaker_sessions.setdefault(speaker, []).append(i)
+    for speaker, indices in speaker_sessions.items():
+        load = sum(session_slot_durations[i] for i in indices)
+        if load > speaker_day_slots:
+            reasons.append(InfeasibilityReason(
+                kind="speaker",
+                message=f"Speaker {speaker} has {load * slot_minutes} minutes of sessions "
+                        f"but the event has {speaker_day_slots * slot_minutes}",
+                speaker=speaker,
+                sessionIds=[sessions[i].id for i in indices],
+                demandMinutes=load * slot_minutes,
+                availableMinutes=speaker_day_slots * slot_minutes
+            ))
+
+    return reasons
+
+
+# ============================================================================
+# Infeasibility Explanation
+# ============================================================================
+# When CP-SAT proves a request infeasible, the model is rebuilt with every room,
+# speaker and whole venue constraint (and every pinned start) behind its own
+# assumption literal. The solver's sufficient assumptions for infeasibility,
+# shrunk to a minimal set, name exactly which constraints clash.
+
+SCHEDULE_EXPLAIN_TIME_SECONDS = float(os.environ.get("SCHEDULE_EXPLAIN_TIME_SECONDS", "10"))
+
+
+class ConstraintGuards:
+    """
+    Assumption literals for constraint groups. NoOverlap takes no enforcement
+    literal, so a guarded group works on optional copies of its intervals that
+    are only present while the group's literal is true.
+    """
+
+    def __init__(self, model: cp_model.CpModel):
+        self.model = model
+        # (literal, kind, session indices, room index, speaker)
+        self.groups: List[Tuple[cp_model.IntVar, str, List[int], Optional[int], Optional[str]]] = []
+
+    def _add_group(self, kind: str, session_indices: List[int],
+                   room_idx: Optional[int] = None, speaker: Optional[str] = None) -> cp_model.IntVar:
+        literal = self.model.NewBoolVar(f'guard_{kind}_{len(self.groups)}')
+        self.groups.append((literal, kind, session_indices, room_idx, speaker))
+        return literal
+
+    def guard(
+        self,
+        intervals: List[cp_model.IntervalVar],
+        session_indices: List[int],
+        kind: str,
+        room_idx: Optional[int] = None,
+        speaker: Optional[str] = None
+    ) -> List[cp_model.IntervalVar]:
+        """Copies of the intervals that only exist while the new group's literal holds."""
+        literal = self._add_group(kind, session_indices, room_idx, speaker)
+        proto = self.model.Proto()
+        guarded = []
+        for interval in intervals:
+            presence = [
+                self.model.GetBoolVarFromProtoIndex(index)
+                for index in proto.constraints[interval.Index()].enforcement_literal
+            ]
+            if presence:
+                # Already optional (solver-assigned room): present = literal and original presence
+                both = self.model.NewBoolVar(f'{interval.Name()}_guarded')
+                self.model.AddBoolAnd([literal] + presence).OnlyEnforceIf(both)
+                self.model.AddBoolOr([both, literal.Not()] + [p.Not() for p in presence])
+                present = both
+            else:
+                present = literal
+            guarded.append(self.model.NewOptionalIntervalVar(
+                interval.StartExpr(), interval.SizeExpr(), interval.EndExpr(), present, f'{interval.Name()}_guarded'
+            ))
+        return guarded
+
+    def pin(self, start_vars: List[cp_model.IntVar], fixed_slots: List[Optional[int]]) -> None:
+        """Pinned starts as guarded equalities instead of constants."""
+        for i, fixed_slot in enumerate(fixed_slots):
+            if fixed_slot is not None:
+                self.model.Add(start_vars[i] == fixed_slot).OnlyEnforceIf(self._add_group("pinned", [i]))
+
+    @property
+    def literals(self) -> List[cp_model.IntVar]:
+        return [literal for literal, *_ in self.groups]
+
+
+def describe_constraint_group(
+    kind: str,
+    session_indices: List[int],
+    room_idx: Optional[int],
+    speaker: Optional[str],
+    sessions: List[Session],
+    rooms: List[Room]
+) -> InfeasibilityReason:
+    session_ids = [sessions[i].id for i in session_indices]
+    listed = ", ".join(str(session_id) for session_id in session_ids)
+    if kind == "room":
+        room = rooms[room_idx]
+        return InfeasibilityReason(
+            kind=kind, roomId=room.id, sessionIds=session_ids,
+            message=f"Room {room.id} ({room.name}) cannot hold sessions {listed} without overlaps"
+        )
+    if kind == "speaker":
+        return InfeasibilityReason(
+            kind=kind, speaker=speaker, sessionIds=session_ids,
+            message=f"Speaker {speaker} cannot give sessions {listed} without overlaps"
+        )
+    if kind == "pinned":
+        return InfeasibilityReason(
+            kind=kind, sessionIds=session_ids,
+            message=f"Session {listed} is pinned at {sessions[session_indices[0]].startTime}"
+        )
+    return InfeasibilityReason(
+        kind=kind, sessionIds=session_ids,
+        message=f"Whole venue sessions {listed} cannot be scheduled one after another"
+    )
+
+
+def explain_infeasibility(
+    sessions: List[Session],
+    rooms: List[Room],
+    horizon: TimeHorizon,
+    session_slot_durations: List[int],
+    gap_slots: int,
+    room_indices: List[Optional[int]],
+    room_candidates: List[Optional[List[int]]],
+    fixed_slots: List[Optional[int]],
+    time_limit: float = SCHEDULE_EXPLAIN_TIME_SECONDS
+) -> List[InfeasibilityReason]:
+    """
+    Rebuild the model with guarded constraint groups and solve under assumptions.
+    The sufficient assumptions for infeasibility are shrunk (drop one, re-solve) while
+    time remains, so every group reported is needed for the conflict.
+    Returns an empty list if the conflict cannot be narrowed down in time.
+    """
+    deadline = time.perf_counter() + time_limit
+    num_sessions = len(sessions)
+    model = cp_model.CpModel()
+    guards = ConstraintGuards(model)
+
+    start_vars, interval_vars = create_interval_variables(model, num_sessions, horizon, session_slot_durations)
+    guards.pin(start_vars, fixed_slots)
+    extended_intervals = create_gap_extended_intervals(
+        model, num_sessions, start_vars, interval_vars, session_slot_durations, gap_slots, horizon.num_slots
+    )
+    room_options = create_room_options(model, start_vars, session_slot_durations, gap_slots, room_candidates)
+    add_room_no_overlap_constraints(
+        model, num_sessions, len(rooms), extended_intervals, room_indices, room_options, guards
+    )
+    add_speaker_no_overlap_constraints(model, num_sessions, sessions, interval_vars, guards)
+    add_whole_venue_no_overlap_constraints(
+        model, num_sessions, extended_intervals, room_indices, room_options, guards
+    )
+    add_temporal_constraints(model, num_sessions, horizon.num_slots, start_vars, session_slot_durations)
+
+    def infeasible_core(assumptions: List[cp_model.IntVar]) -> Optional[List[int]]:
+        """Indices of a sufficient subset of the assumptions, or None if not proven infeasible in time."""
+        remaining = deadline - time.perf_counter()
+        if remaining <= 0:
+            return None
+        model.ClearAssumptions()
+        model.AddAssumptions(assumptions)
+        solver = cp_model.CpSolver()
+        # Assumption cores come from the sequential search
+        solver.parameters.num_workers = 1
+        solver.parameters.max_time_in_seconds = remaining
+        if solver.Solve(model) != cp_model.INFEASIBLE:
+            return None
+        return list(solver.SufficientAssumptionsForInfeasibility())
+
+    core = infeasible_core(guards.literals)
+    if core is None:
+        return []
+    by_index = {group[0].Index(): group for group in guards.groups}
+    core_groups = [by_index[index] for index in core]
+
+    # Deletion pass: keep a group only if the rest is no longer infeasible without it
+    position = 0
+    while position < len(core_groups) and len(core_groups) > 1:
+        rest = core_groups[:position] + core_groups[position + 1:]
+        smaller = infeasible_core([group[0] for group in rest])
+        if smaller is None:
+            if time.perf_counter() >= deadline:
+                break
+            position += 1
+        else:
+            core_groups = [by_index[index] for index in smaller]
+
+    return [
+        describe_constraint_group(kind, session_indices, room_idx, speaker, sessions, rooms)
+        for _, kind, session_indices, room_idx, speaker in core_groups
+    ]
+
+
+# ============================================================================
+# Greedy Scheduling Engine
+# ============================================================================
+# Earliest-fit list scheduling with the same room, speaker, whole venue and gap
+# rules as the CP-SAT model. It returns a valid schedule in milliseconds, either
+# on its own (mode=fast) or as the warm start and makespan upper bound for a
+# time-boxed CP-SAT refinement (mode=hybrid).
+
+SCHEDULE_MODES = ("exact", "fast", "hybrid")
+SCHEDULE_MODE = os.environ.get("SCHEDULE_MODE", "exact")
+# CP-SAT time box for the hybrid refinement
+SCHEDULE_HYBRID_TIME_SECONDS = float(os.environ.get("SCHEDULE_HYBRID_TIME_SECONDS", "2"))
+
+
+def get_schedule_mode(request: ScheduleEventRequest) -> str:
+    """Requested scheduling mode, validated."""
+    mode = request.mode or SCHEDULE_MODE
+    if mode not in SCHEDULE_MODES:
+        raise ValueError(f"Unknown scheduling mode '{mode}'. Use one of: {', '.join(SCHEDULE_MODES)}")
+    return mode
+
+
+def schedule_time_limit(request: ScheduleEventRequest) -> float:
+    """CP-SAT time limit for a request; hybrid mode caps it at the refinement time box."""
+    time_limit = solver_time_limit(request.solver, len(request.sessions))
+    if get_schedule_mode(request) == "hybrid" and not (request.solver and request.solver.maxTimeSeconds is not None):
+        time_limit = min(time_limit, SCHEDULE_HYBRID_TIME_SECONDS)
+    return time_limit
+
+
+class BusyTimeline:
+    """Disjoint busy intervals [start, end) of one room, speaker or the whole venue, sorted by start."""
+
+    def __init__(self):
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+
+    def conflict_end(self, start: int, end: int) -> Optional[int]:
+        """End of the last busy interval overlapping [start, end), or None if free."""
+        idx = bisect_left(self.starts, end)
+        if idx and self.ends[idx - 1] > start:
+            return self.ends[idx - 1]
+        return None
+
+    def add(self, start: int, end: int) -> None:
+        idx = bisect_left(self.starts, start)
+        self.starts.insert(idx, start)
+        self.ends.insert(idx, end)
+
+
+def find_earliest_fit(
+    horizon: TimeHorizon,
+    duration_slots: int,
+    checks: List[Tuple[BusyTimeline, int]]
+) -> Optional[int]:
+    """
+    Earliest start slot at which every (timeline, length) check is free, without
+    crossing the end of a day. Jumps straight past each conflicting interval.
+    """
+    latest = horizon.slots_per_day - duration_slots
+    if latest < 0:
+        return None
+    for day in range(horizon.num_days):
+        slot = day * horizon.day_stride
+        last = slot + latest
+        while slot <= last:
+            jump = None
+            for timeline, length in checks:
+                conflict_end = timeline.conflict_end(slot, slot + length)
+                if conflict_end is not None and (jump is None or conflict_end > jump):
+                    jump = conflict_end
+            if jump is None:
+                return slot
+            slot = jump
+    return None
+
+
+def greedy_schedule(
+    sessions: List[Session],
+    horizon: TimeHorizon,
+    session_slot_durations: List[int],
+    gap_slots: int,
+    room_indices: List[Optional[int]],
+    room_candidates: List[Optional[List[int]]],
+    previous_slots: List[Optional[int]],
+    fixed_slots: List[Optional[int]],
+    num_rooms: int
+) -> Optional[Tuple[List[int], List[Optional[int]]]]:
+    """
+    Place sessions one at a time at their earliest feasible slot.
+    Order: pinned sessions at their slots, previously scheduled sessions back in
+    place when still free, then whole venue sessions, then topic by topic (largest
+    topic first) with the longest sessions first. Solver-assigned sessions take the
+    fitting room that frees up first (smallest room on ties).
     
-    # Objective: Minimize max slot (spreads sessions out across time)
-    # This ensures sessions are distributed across different time slots
-    # Topic grouping is handled implicitly by the solver when there are multiple optimal solutions
-    model.Minimize(max_slot)
+    Returns:
+        Tuple of (start_slots, session_rooms) where session_rooms[i] is the room index
+        used by session i (None for whole venue), or None if some session can't be placed
+    """
+    room_timelines = [BusyTimeline() for _ in range(num_rooms)]
+    venue_timeline = BusyTimeline()
+    speaker_timelines: Dict[str, BusyTimeline] = {}
+    whole_venue = [room_indices[i] is None and not room_candidates[i] for i in range(len(sessions))]
+    
+    topic_minutes: Dict[str, int] = {}
+    for session in sessions:
+        topic_minutes[session.topic] = topic_minutes.get(session.topic, 0) + session.durationMin
+    order = sorted(range(len(sessions)), key=lambda i: (
+        fixed_slots[i] is None,
+        previous_slots[i] is None,
+        not whole_venue[i],
+        -topic_minutes[sessions[i].topic],
+        sessions[i].topic,
+        -session_slot_durations[i],
+    ))
+    
+    start_slots: List[int] = [0] * len(sessions)
+    session_rooms: List[Optional[int]] = [None] * len(sessions)
+    for i in order:
+        duration = session_slot_durations[i]
+        extended = duration + gap_slots
+        speaker = sessions[i].speaker.strip() if sessions[i].speaker else ""
+        speaker_checks = [(speaker_timelines.setdefault(speaker, BusyTimeline()), duration)] if speaker else []
+        
+        if whole_venue[i]:
+            room_choices: List[Optional[int]] = [None]
+        elif room_indices[i] is not None:
+            room_choices = [room_indices[i]]
+        else:
+            room_choices = room_candidates[i]
+        
+        best: Optional[Tuple[int, Optional[int]]] = None
+        for room_idx in room_choices:
+            if room_idx is None:
+                checks = [(timeline, extended) for timeline in room_timelines] + [(venue_timeline, extended)]
+            else:
+                checks = [(room_timelines[room_idx], extended), (venue_timeline, extended)]
+            checks += speaker_checks
+            
+            # Pinned sessions must stay put; previous slots are kept when still free
+            preferred = fixed_slots[i] if fixed_slots[i] is not None else previous_slots[i]
+            if preferred is not None and all(
+                timeline.conflict_end(preferred, preferred + length) is None for timeline, length in checks
+            ):
+                slot = preferred
+            elif fixed_slots[i] is not None:
+                continue  # Busy at the pinned slot; try the next fitting room
+            else:
+                slot = find_earliest_fit(horizon, duration, checks)
+            if slot is not None and (best is None or slot < best[0]):
+                best = (slot, room_idx)
+        
+        if best is None:
+            return None
+        slot, room_idx = best
+        start_slots[i] = slot
+        session_rooms[i] = room_idx
+        if room_idx is None:
+            venue_timeline.add(slot, slot + extended)
+        else:
+            room_timelines[room_idx].add(slot, slot + extended)
+        if speaker:
+            speaker_timelines[speaker].add(slot, slot + duration)
+    
+    return start_slots, session_rooms
+
+
+def add_greedy_warm_start(
+    model: cp_model.CpModel,
+    start_vars: List[cp_model.IntVar],
+    room_options: List[Dict[int, Tuple[cp_model.IntVar, cp_model.IntervalVar]]],
+    greedy: Tuple[List[int], List[Optional[int]]]
+) -> None:
+    """
+    Hint the greedy room choices and bound the makespan by the greedy schedule, so
+    CP-SAT only searches for improvements. Start slot hints are added together with
+    the previous-assignment hints (add_previous_assignment_hints).
+    """
+    start_slots, session_rooms = greedy
+    for i, options in enumerate(room_options):
+        for r_idx, (present, _) in options.items():
+            model.AddHint(present, int(r_idx == session_rooms[i]))
+    upper_bound = max(start_slots)
+    for start_var in start_vars:
+        model.Add(start_var <= upper_bound)
+
+
+def build_assignments(
+    sessions: List[Session],
+    rooms: List[Room],
+    horizon: TimeHorizon,
+    start_slots: List[int],
+    session_rooms: List[Optional[int]]
+) -> List[ScheduleAssignment]:
+    """Format a schedule given as start slots and room indices."""
+    assignments = []
+    for i, session in enumerate(sessions):
+        room_id = session.roomId
+        if room_id is None and session_rooms[i] is not None:
+            room_id = rooms[session_rooms[i]].id
+        slot_time = horizon.to_datetime(start_slots[i])
+        assignments.append(ScheduleAssignment(
+            sessionId=session.id,
+            roomId=room_id,
+            startTime=slot_time.isoformat() if slot_time is not None else None
+        ))
+    return assignments
 
 
 def extract_solution(
@@ -676,45 +2396,43 @@ def extract_solution(
     start_vars: List[cp_model.IntVar],
     sessions: List[Session],
     rooms: List[Room],
-    time_slots: List[datetime],
-    room_indices: List[Optional[int]]
+    horizon: TimeHorizon,
+    room_indices: List[Optional[int]],
+    room_options: Optional[List[Dict[int, Tuple[cp_model.IntVar, cp_model.IntervalVar]]]] = None
 ) -> List[ScheduleAssignment]:
     """
     Extract solution and format assignments.
-    Preserves user-provided room assignments, schedules time slots.
+    Preserves user-provided room assignments, schedules time slots, and reports
+    the room the solver chose for sessions assigned by capacity.
     """
     assignments = []
-    slot_usage = {}  # Track which slots are used
-    room_usage = {}  # Track which rooms are used
+    debug = logger.isEnabledFor(logging.DEBUG)
     
     for i, session in enumerate(sessions):
         slot_idx = solver.Value(start_vars[i])
-        room_idx = room_indices[i]
-        
-        # Debug logging
-        has_room = room_idx is not None
-        print(f"Session {session.id} ({session.title}): room_idx={room_idx}, slot_idx={slot_idx}, has_room={has_room}")
         
         room_id = session.roomId  # Preserve user-provided room assignment
-        if room_id is not None:
-            if room_id not in room_usage:
-                room_usage[room_id] = []
-            room_usage[room_id].append(session.id)
-            room_name = next((r.name for r in rooms if r.id == room_id), "Unknown")
-            print(f"  -> Room: {room_id} ({room_name}) [USER PROVIDED]")
-        else:
-            print(f"  -> Room: None (Whole Venue)")
+        room_source = "user"
+        if room_id is None and room_options and room_options[i]:
+            room_id = next(
+                rooms[r_idx].id for r_idx, (present, _) in room_options[i].items() if solver.BooleanValue(present)
+            )
+            room_source = "solver"
+        elif room_id is None:
+            room_source = "whole-venue"
         
         # Get start time from slot
         start_time = None
-        if slot_idx < len(time_slots):
-            start_time = time_slots[slot_idx].isoformat()
-            if slot_idx not in slot_usage:
-                slot_usage[slot_idx] = []
-            slot_usage[slot_idx].append(session.id)
-            print(f"  -> Scheduled to slot {slot_idx} ({start_time})")
+        slot_time = horizon.to_datetime(slot_idx)
+        if slot_time is not None:
+            start_time = slot_time.isoformat()
         else:
-            print(f"  -> WARNING: Invalid slot index {slot_idx}")
+            logger.warning("invalid slot session=%s slot=%d", session.id, slot_idx)
+        if debug:
+            logger.debug(
+                "assignment session=%s room=%s source=%s slot=%d start=%s",
+                session.id, room_id, room_source, slot_idx, start_time
+            )
         
         assignments.append(ScheduleAssignment(
             sessionId=session.id,
@@ -722,31 +2440,339 @@ def extract_solution(
             startTime=start_time
         ))
     
-    # Log conflicts
-    print(f"\nSlot usage summary:")
-    for slot_idx, session_ids in sorted(slot_usage.items()):
-        if len(session_ids) > 1:
-            print(f"  WARNING: Slot {slot_idx} has {len(session_ids)} sessions: {session_ids}")
-        else:
-            print(f"  Slot {slot_idx}: {session_ids[0]}")
+    return assignments
+
+
+def count_moved_sessions(sessions: List[Session], assignments: List[ScheduleAssignment]) -> int:
+    """Number of previously scheduled sessions whose start time changed."""
+    moved = 0
+    for session, assignment in zip(sessions, assignments):
+        previous = parse_previous_start(session.startTime)
+        if previous is None:
+            continue
+        if assignment.startTime is None or datetime.fromisoformat(assignment.startTime) != previous:
+            moved += 1
+    return moved
+
+
+# ============================================================================
+# Solver Pool
+# ============================================================================
+# One long-lived process pool runs every solve that leaves the request thread
+# (decomposed components, jobs, batch events). Its workers come from a forkserver
+# that imported this module once, so no request pays for pool startup, the
+# multithreaded server is never forked, and the models are loaded once for all workers.
+
+SOLVER_POOL_WORKERS = int(os.environ.get("SOLVER_POOL_WORKERS", str(max(1, available_cores() // WEB_CONCURRENCY))))
+
+
+class SolverPool:
+    """
+    Process pool created on first use. When a worker dies (OOM, a crash inside
+    OR-Tools) the broken pool is dropped and the next task starts a fresh one.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max(1, max_workers)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        # Created on first use so importing the app never starts processes
+        with self._lock:
+            if self._executor is None:
+                context = multiprocessing.get_context("forkserver")
+                context.set_forkserver_preload([__name__])
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+            return self._executor
+
+    def _drop_executor(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            logger.warning("solver pool broken, starting a new one")
+            self._executor = None
+        # A broken pool has already failed all of its futures, so nothing is left to cancel
+        executor.shutdown(wait=False)
+
+    def _check_broken(self, executor: ProcessPoolExecutor, future: Future) -> None:
+        if not future.cancelled() and isinstance(future.exception(), BrokenProcessPool):
+            self._drop_executor(executor)
+
+    def submit(self, fn: Callable, *args) -> Future:
+        executor = self._get_executor()
+        try:
+            future = executor.submit(fn, *args)
+        except BrokenProcessPool:
+            self._drop_executor(executor)
+            executor = self._get_executor()
+            future = executor.submit(fn, *args)
+        future.add_done_callback(lambda f, executor=executor: self._check_broken(executor, f))
+        return future
+
+    def map(self, fn: Callable, items: List[Any], parallel: int) -> List[Any]:
+        """fn over items in the pool, at most `parallel` at a time; results in order."""
+        slots = threading.Semaphore(max(1, parallel))
+        futures = []
+        try:
+            for item in items:
+                slots.acquire()
+                future = self.submit(fn, item)
+                future.add_done_callback(lambda f: slots.release())
+                futures.append(future)
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+solver_pool = SolverPool(SOLVER_POOL_WORKERS)
+
+
+# ============================================================================
+# Problem Decomposition
+# ============================================================================
+# Without whole-venue sessions, rooms are only coupled through shared speakers.
+# Each connected room/speaker component is then an independent subproblem, and
+# several small CP-SAT models solve much faster than one large one.
+
+SCHEDULE_COMPONENT_WORKERS = int(os.environ.get("SCHEDULE_COMPONENT_WORKERS", str(available_cores())))
+
+
+def find_independent_components(
+    sessions: List[Session],
+    room_indices: List[Optional[int]]
+) -> Optional[List[List[int]]]:
+    """
+    Split sessions into groups that share no room and no speaker.
     
-    print(f"\nRoom usage summary:")
-    for room_id, session_ids in sorted(room_usage.items()):
-        print(f"  Room {room_id}: {len(session_ids)} sessions: {session_ids}")
+    Returns:
+        Lists of session indices per component (in first-appearance order),
+        or None when a whole venue session couples every room
+    """
+    if any(idx is None for idx in room_indices):
+        return None
     
-    return assignments
+    # Union-find over room indices; sessions of one speaker join their rooms
+    parent: Dict[int, int] = {}
+    
+    def find(room_idx: int) -> int:
+        while parent.setdefault(room_idx, room_idx) != room_idx:
+            parent[room_idx] = parent[parent[room_idx]]
+            room_idx = parent[room_idx]
+        return room_idx
+    
+    speaker_rooms: Dict[str, int] = {}
+    for i, session in enumerate(sessions):
+        room_root = find(room_indices[i])
+        speaker = session.speaker.strip() if session.speaker else ""
+        if speaker:
+            if speaker in speaker_rooms:
+                parent[room_root] = find(speaker_rooms[speaker])
+            else:
+                speaker_rooms[speaker] = room_root
+    
+    components: Dict[int, List[int]] = {}
+    for i in range(len(sessions)):
+        components.setdefault(find(room_indices[i]), []).append(i)
+    return list(components.values())
+
+
+def build_component_request(
+    request: ScheduleEventRequest,
+    session_indices: List[int],
+    slot_minutes: int,
+    num_workers: Optional[int],
+    time_limit: float
+) -> ScheduleEventRequest:
+    """Sub-request with one component's sessions and rooms, on the parent's slot grid."""
+    sessions = [request.sessions[i] for i in session_indices]
+    room_ids = {session.roomId for session in sessions}
+    solver = (request.solver or SolverOptions()).model_copy()
+    if solver.numWorkers is None:
+        solver.numWorkers = num_workers
+    solver.maxTimeSeconds = time_limit
+    return request.model_copy(update={
+        "sessions": sessions,
+        "rooms": [room for room in request.rooms if room.id in room_ids],
+        "slotMinutes": slot_minutes,
+        "solver": solver,
+    })
+
+
+def merge_component_responses(
+    request: ScheduleEventRequest,
+    components: List[List[int]],
+    responses: List[ScheduleEventResponse],
+    wall_time: float
+) -> ScheduleEventResponse:
+    """
+    Merge per-component results back into request order.
+    The event fails if any component fails (responses may stop at the first failure).
+    """
+    stats = [response.solverStats for response in responses if response.solverStats is not None]
+    merged_stats = None
+    if stats:
+        # The event is only as good as its worst component
+        status_rank = ["MODEL_INVALID", "INFEASIBLE", "UNKNOWN", "FEASIBLE", "OPTIMAL"]
+        merged_stats = stats[0].model_copy(update={
+            "status": min((stat.status for stat in stats), key=status_rank.index),
+            "numWorkers": sum(stat.numWorkers for stat in stats),
+            "timeLimitSeconds": max(stat.timeLimitSeconds for stat in stats),
+            "wallTime": wall_time,
+            "branches": sum(stat.branches for stat in stats),
+            "conflicts": sum(stat.conflicts for stat in stats),
+            "objectiveValue": None,
+            "bestBound": None,
+            "components": len(components),
+            "numVariables": sum(stat.numVariables for stat in stats),
+            "numConstraints": sum(stat.numConstraints for stat in stats),
+        })
+    
+    # Phase timings add up across components (CPU time when they run in parallel)
+    phase_seconds: Dict[str, float] = {}
+    for response in responses:
+        for phase, seconds in (response.phaseSeconds or {}).items():
+            phase_seconds[phase] = phase_seconds.get(phase, 0.0) + seconds
+    
+    for session_indices, response in zip(components, responses):
+        if not response.success:
+            room_ids = sorted({request.sessions[i].roomId for i in session_indices})
+            return ScheduleEventResponse(
+                assignments=[],
+                success=False,
+                message=f"Rooms {', '.join(str(room_id) for room_id in room_ids)}: {response.message}",
+                diagnosis=response.diagnosis,
+                solverStats=merged_stats,
+                engine=response.engine,
+                phaseSeconds=phase_seconds
+            )
+    
+    engines = sorted({response.engine for response in responses if response.engine})
+    cache_results = sorted({response.cache for response in responses if response.cache})
+    assignments: List[Optional[ScheduleAssignment]] = [None] * len(request.sessions)
+    for session_indices, response in zip(components, responses):
+        for i, assignment in zip(session_indices, response.assignments):
+            assignments[i] = assignment
+    return ScheduleEventResponse(
+        assignments=assignments,
+        success=True,
+        message="Schedule generated successfully",
+        movedSessions=count_moved_sessions(request.sessions, assignments),
+        solverStats=merged_stats,
+        engine=",".join(engines) or None,
+        phaseSeconds=phase_seconds,
+        cache=",".join(cache_results) or None
+    )
+
+
+def solve_decomposed(
+    request: ScheduleEventRequest,
+    components: List[List[int]],
+    component_workers: int = SCHEDULE_COMPONENT_WORKERS
+) -> ScheduleEventResponse:
+    """
+    Solve each component on its own, in parallel worker processes when more than
+    one core is available, and merge the assignments.
+    All components share the parent request's slot size so the grids line up.
+    """
+    started = time.perf_counter()
+    slot_minutes = choose_slot_minutes(
+        [s.durationMin for s in request.sessions], request.gapMinutes or 0, request.slotMinutes,
+        get_start_offsets(request)
+    )
+    cores = solve_cores()
+    parallel = max(1, min(component_workers, len(components), cores))
+    # Split the solve's cores between concurrent components instead of oversubscribing them
+    num_workers = max(1, cores // parallel)
+    # Share the event's time limit by component size so the total wall time stays within it
+    time_limit = schedule_time_limit(request)
+    component_requests = [
+        build_component_request(
+            request, session_indices, slot_minutes, num_workers,
+            min(time_limit, time_limit * parallel * len(session_indices) / len(request.sessions))
+        )
+        for session_indices in components
+    ]
+    logger.info(
+        "decomposed event=%s sessions=%d components=%d parallel=%d",
+        request.eventId, len(request.sessions), len(components), parallel
+    )
+    
+    if parallel > 1:
+        responses = solver_pool.map(solve_schedule, component_requests, parallel)
+    else:
+        responses = []
+        for component_request in component_requests:
+            responses.append(solve_schedule(component_request))
+            if not responses[-1].success:
+                break  # One infeasible component fails the whole event
+    
+    return merge_component_responses(request, components, responses, time.perf_counter() - started)
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize with pydantic-core directly. Returning the model would make FastAPI
+    validate it again and re-encode it through jsonable_encoder, which costs more
+    than the solve for large schedules.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
 
 
 @app.post("/schedule-event", response_model=ScheduleEventResponse)
-def schedule_event(request: ScheduleEventRequest):
+def schedule_event_endpoint(request: ScheduleEventRequest):
+    with schedule_gate.admit(estimate_schedule_cost(request)), REQUEST_LATENCY.labels("/schedule-event").time():
+        response = schedule_event(request)
+    observe_schedule_metrics(response)
+    return json_response(response)
+
+
+def schedule_event(
+    request: ScheduleEventRequest,
+    component_workers: int = SCHEDULE_COMPONENT_WORKERS
+) -> ScheduleEventResponse:
+    """
+    Schedule time slots for sessions.
+    Events without whole venue sessions are split into independent room/speaker
+    components solved in parallel (up to component_workers at a time); otherwise
+    the whole event is one CP-SAT model.
+    The greedy engine (mode=fast) is fast enough to skip the decomposition.
+    """
+    if request.sessions and request.rooms and (request.mode or SCHEDULE_MODE) != "fast":
+        room_indices = get_room_indices_for_sessions(request.sessions, request.rooms)
+        components = find_independent_components(request.sessions, room_indices)
+        if components is not None and len(components) > 1:
+            try:
+                return solve_decomposed(request, components, component_workers)
+            except Exception as e:
+                return ScheduleEventResponse(
+                    assignments=[],
+                    success=False,
+                    message=f"Error generating schedule: {str(e)}"
+                )
+    return solve_schedule(request)
+
+
+def _solve_schedule(
+    request: ScheduleEventRequest,
+    stream: Optional["ScheduleStream"] = None,
+    warm_start: Optional[List[ScheduleAssignment]] = None
+) -> ScheduleEventResponse:
     """
     Schedule time slots for sessions using OR Tools constraint programming.
-    - Never schedules rooms (uses user-provided room assignments)
-    - Always schedules time slots (never preserves existing start times)
+    - Uses user-provided room assignments; with assignRooms, also chooses a fitting room
+      (by capacity) for sessions without one instead of blocking the whole venue
+    - Schedules time slots, starting from any previous start times (hints) and keeping pinned sessions fixed
     - Prevents room conflicts (sessions in same room can't overlap)
     - Prevents speaker conflicts (same speaker can't have overlapping sessions)
     - Handles whole venue case (sessions without rooms can't overlap with ANY session)
+    - mode=fast returns the greedy schedule; mode=hybrid refines it with time-boxed CP-SAT
+    Every phase is timed; the timings come back in phaseSeconds.
+    With a stream, the greedy schedule and every improving CP-SAT solution are published as found.
+    A warm start (a known feasible schedule for the same problem) replaces the greedy hint.
     """
+    timer = PhaseTimer()
     try:
         if not request.sessions:
             return ScheduleEventResponse(
@@ -762,15 +2788,33 @@ def schedule_event(request: ScheduleEventRequest):
                 message="No rooms available for scheduling"
             )
         
-        # Generate time slots (5-minute intervals, using provided start time or defaulting to 9 AM - 5 PM each day)
-        slot_duration_minutes = 5
-        time_slots = generate_time_slots(request.startDate, request.endDate, slot_duration_minutes, request.startTime)
+        with timer.phase("horizon"):
+            # Slot size: GCD of session durations, gap and earlier start times (at least 5 minutes) unless configured
+            gap_minutes = request.gapMinutes or 0
+            slot_duration_minutes = choose_slot_minutes(
+                [s.durationMin for s in request.sessions], gap_minutes, request.slotMinutes,
+                get_start_offsets(request)
+            )
+            
+            # Helper: session duration in slots (e.g., 60 min = 12 slots of 5 min)
+            session_slot_durations = [
+                max(1, (s.durationMin + slot_duration_minutes - 1) // slot_duration_minutes) for s in request.sessions
+            ]
+            
+            # Convert gap time to slots (round up)
+            gap_slots = max(0, (gap_minutes + slot_duration_minutes - 1) // slot_duration_minutes)
+            
+            # Day-aware slot model (using provided start time or defaulting to 9 AM - 5 PM each day)
+            horizon = build_time_horizon(
+                request.startDate, request.endDate, slot_duration_minutes, gap_slots, request.startTime
+            )
         
-        if not time_slots:
+        if horizon.num_days == 0 or horizon.slots_per_day == 0:
             return ScheduleEventResponse(
                 assignments=[],
                 success=False,
-                message="Invalid date range or no time slots available"
+                message="Invalid date range or no time slots available",
+                phaseSeconds=timer.seconds
             )
         
         # Create the model
@@ -778,98 +2822,1161 @@ def schedule_event(request: ScheduleEventRequest):
         
         num_sessions = len(request.sessions)
         num_rooms = len(request.rooms)
-        num_slots = len(time_slots)
-        
-        # Helper: session duration in slots (e.g., 60 min = 12 slots of 5 min)
-        session_slot_durations = [
-            max(1, (s.durationMin + slot_duration_minutes - 1) // slot_duration_minutes) for s in request.sessions
-        ]
-        
-        # Convert gap time to slots (round up)
-        gap_slots = max(0, (request.gapMinutes + slot_duration_minutes - 1) // slot_duration_minutes) if request.gapMinutes else 0
+        num_slots = horizon.num_slots
         
         # Step 1: Get room indices for each session (user-provided room assignments)
         room_indices = get_room_indices_for_sessions(request.sessions, request.rooms)
         
-        # Debug: Log room assignments
-        print(f"\nRoom assignments from user:")
-        for i, session in enumerate(request.sessions):
-            room_idx = room_indices[i]
-            room_name = "None (Whole Venue)"
-            if room_idx is not None and room_idx < len(request.rooms):
-                room_name = request.rooms[room_idx].name
-            print(f"  Session {session.id} ({session.title}): roomId={session.roomId}, room_idx={room_idx}, room_name={room_name}")
+        # Rooms the solver may choose from (opt-in), pruned by capacity
+        room_candidates = [None] * num_sessions
+        if request.assignRooms:
+            room_candidates = get_room_candidates(request.sessions, request.rooms, room_indices)
+            unfit = [request.sessions[i].id for i, candidates in enumerate(room_candidates) if candidates == []]
+            if unfit:
+                return ScheduleEventResponse(
+                    assignments=[],
+                    success=False,
+                    message=f"No room is large enough for sessions {', '.join(str(session_id) for session_id in unfit)} "
+                            f"(largest room capacity: {max(room.capacity for room in request.rooms)})",
+                    phaseSeconds=timer.seconds
+                )
+        
+        with timer.phase("precheck"):
+            diagnosis = diagnose_infeasibility(
+                request.sessions, request.rooms, horizon, session_slot_durations,
+                gap_slots, room_indices, room_candidates
+            )
+        if diagnosis:
+            logger.info(
+                "schedule rejected by precheck event=%s reasons=%d seconds=%.4f",
+                request.eventId, len(diagnosis), timer.seconds["precheck"]
+            )
+            return ScheduleEventResponse(
+                assignments=[],
+                success=False,
+                message=f"Schedule cannot fit: {diagnosis[0].message}"
+                        + (f" (and {len(diagnosis) - 1} more)" if len(diagnosis) > 1 else ""),
+                diagnosis=diagnosis,
+                phaseSeconds=timer.seconds
+            )
         
-        # Step 2: Create interval variables for time-based scheduling
-        # Always schedules time slots (never preserves existing times)
-        start_vars, interval_vars = create_interval_variables(
-            model, num_sessions, num_slots, session_slot_durations
+        previous_slots, fixed_slots = get_previous_slots(
+            request.sessions, horizon, session_slot_durations
         )
         
+        # Greedy engine: the whole answer in fast mode, the warm start in hybrid mode
+        mode = get_schedule_mode(request)
+        greedy = None
+        if mode != "exact":
+            with timer.phase("greedy"):
+                greedy = greedy_schedule(
+                    request.sessions, horizon, session_slot_durations, gap_slots, room_indices,
+                    room_candidates, previous_slots, fixed_slots, num_rooms
+                )
+            logger.info(
+                "greedy schedule event=%s sessions=%d found=%s seconds=%.4f",
+                request.eventId, num_sessions, greedy is not None, timer.seconds["greedy"]
+            )
+            if stream and greedy:
+                stream.publish(ScheduleProgress(
+                    solution=0,
+                    assignments=build_assignments(request.sessions, request.rooms, horizon, *greedy),
+                    wallTime=timer.seconds["greedy"],
+                    engine="greedy"
+                ))
+            if mode == "fast":
+                if greedy is None:
+                    return ScheduleEventResponse(
+                        assignments=[],
+                        success=False,
+                        message="Greedy scheduler could not place every session; try mode 'exact'",
+                        engine="greedy",
+                        phaseSeconds=timer.seconds
+                    )
+                with timer.phase("extract"):
+                    assignments = build_assignments(request.sessions, request.rooms, horizon, *greedy)
+                return ScheduleEventResponse(
+                    assignments=assignments,
+                    success=True,
+                    message="Schedule generated successfully",
+                    movedSessions=count_moved_sessions(request.sessions, assignments),
+                    engine="greedy",
+                    phaseSeconds=timer.seconds
+                )
+        
+        hint = greedy
+        if warm_start:
+            hint = get_warm_start_slots(
+                warm_start, request.sessions, request.rooms, horizon, session_slot_durations, fixed_slots
+            ) or greedy
+        
+        symmetric_classes = []
+        if SCHEDULE_SYMMETRY_BREAKING:
+            with timer.phase("symmetry_breaking"):
+                symmetric_classes = find_interchangeable_sessions(
+                    request.sessions, session_slot_durations, room_indices, room_candidates,
+                    previous_slots, fixed_slots
+                )
+                if hint:
+                    hint = order_hint_by_class(hint, symmetric_classes)
+        
+        with timer.phase("variables"):
+            # Step 2: Create interval variables for time-based scheduling
+            # Previous start times (or the greedy schedule) become hints; pinned sessions keep theirs as constants
+            start_vars, interval_vars = create_interval_variables(
+                model, num_sessions, horizon, session_slot_durations, fixed_slots
+            )
+            moved_vars = add_previous_assignment_hints(
+                model, start_vars, previous_slots, fixed_slots, hint[0] if hint else None
+            )
+            
+            # Gap-extended intervals shared by the room and whole venue constraints
+            extended_intervals = create_gap_extended_intervals(
+                model, num_sessions, start_vars, interval_vars,
+                session_slot_durations, gap_slots, num_slots
+            )
+            room_options = create_room_options(
+                model, start_vars, session_slot_durations, gap_slots, room_candidates
+            )
+            if hint:
+                add_greedy_warm_start(model, start_vars, room_options, hint)
+
         # Step 3: Add no-overlap constraints per room (sessions in same room can't overlap)
-        add_room_no_overlap_constraints(
-            model, num_sessions, num_rooms, start_vars, interval_vars,
-            room_indices, session_slot_durations, gap_slots, num_slots
-        )
+        with timer.phase("room_constraints"):
+            add_room_no_overlap_constraints(
+                model, num_sessions, num_rooms, extended_intervals, room_indices, room_options
+            )
         
         # Step 4: Add speaker conflict constraints (same speaker can't have overlapping sessions)
-        add_speaker_no_overlap_constraints(
-            model, num_sessions, request.sessions, interval_vars
-        )
+        with timer.phase("speaker_constraints"):
+            add_speaker_no_overlap_constraints(
+                model, num_sessions, request.sessions, interval_vars
+            )
         
         # Step 5: Add whole venue constraints (sessions without rooms can't overlap with ANY session)
-        add_whole_venue_no_overlap_constraints(
-            model, num_sessions, room_indices, start_vars, interval_vars,
-            session_slot_durations, gap_slots, num_slots
-        )
+        with timer.phase("whole_venue_constraints"):
+            add_whole_venue_no_overlap_constraints(
+                model, num_sessions, extended_intervals, room_indices, room_options
+            )
         
         # Step 6: Add temporal constraints (sessions must fit within time slots)
-        add_temporal_constraints(
-            model, num_sessions, num_slots, start_vars, session_slot_durations
-        )
+        with timer.phase("temporal_constraints"):
+            add_temporal_constraints(
+                model, num_sessions, num_slots, start_vars, session_slot_durations
+            )
         
-        # Step 7: Create objective function (minimize max slot)
-        create_objective_function(
-            model, num_sessions, num_slots, start_vars, request.sessions
-        )
+        # Step 6b: Order interchangeable sessions so the search skips their permutations
+        if symmetric_classes:
+            with timer.phase("symmetry_breaking"):
+                add_symmetry_breaking_constraints(model, start_vars, symmetric_classes)
         
-        # Solve
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = 30.0  # 30 second timeout
-        status = solver.Solve(model)
+        with timer.phase("objective"):
+            # Step 7: Create objective function (makespan, churn, topic cohesion)
+            create_objective_function(
+                model, num_sessions, num_slots, start_vars, request.sessions, moved_vars
+            )
+            
+            # Step 8: Search strategy (earliest start first)
+            add_search_strategy(model, start_vars, fixed_slots)
+        
+        # Solve (workers, seed and time limit from the solver profile; hybrid mode is time-boxed)
+        with timer.phase("solve"):
+            solver = cp_model.CpSolver()
+            solver_options = (request.solver or SolverOptions()).model_copy(
+                update={"maxTimeSeconds": schedule_time_limit(request)}
+            )
+            solver_settings = configure_solver(solver, solver_options, num_sessions)
+            if stream:
+                stream.attach(solver)
+                status = solver.Solve(model, StreamingSolutionCallback(
+                    stream,
+                    lambda values: extract_solution(
+                        values, num_sessions, start_vars,
+                        request.sessions, request.rooms, horizon, room_indices, room_options
+                    )
+                ))
+            else:
+                status = solver.Solve(model)
+        solver_stats = collect_solver_stats(solver, status, solver_settings, model)
         
-        # Debug logging
-        print(f"\n=== Solver Results ===")
-        print(f"Solver status: {status}")
-        print(f"  OPTIMAL={cp_model.OPTIMAL}, FEASIBLE={cp_model.FEASIBLE}, INFEASIBLE={cp_model.INFEASIBLE}, MODEL_INVALID={cp_model.MODEL_INVALID}")
-        print(f"Number of sessions: {num_sessions}, rooms: {num_rooms}, time slots: {num_slots}")
-        print(f"Slot size: {slot_duration_minutes} minutes")
-        print(f"Gap time: {request.gapMinutes} minutes ({gap_slots} slots)")
-        print(f"Whole venue sessions: {sum(1 for idx in room_indices if idx is None)}")
+        logger.info(
+            "schedule solved event=%s mode=%s status=%s sessions=%d rooms=%d slots=%d slot_minutes=%d gap_slots=%d "
+            "whole_venue=%d variables=%d constraints=%d workers=%d limit=%.1f wall=%.3f",
+            request.eventId, mode, solver_stats.status, num_sessions, num_rooms, num_slots, slot_duration_minutes,
+            gap_slots, sum(get_whole_venue_flags(room_indices, room_options)), solver_stats.numVariables,
+            solver_stats.numConstraints, solver_stats.numWorkers, solver_stats.timeLimitSeconds, solver_stats.wallTime
+        )
         
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-            print(f"✓ Solver found a solution!")
-            # Step 8: Extract solution (preserves user-provided room assignments, schedules time slots)
-            assignments = extract_solution(
-                solver, num_sessions, start_vars,
-                request.sessions, request.rooms, time_slots, room_indices
-            )
+            # Step 9: Extract solution (preserves user-provided room assignments, schedules time slots)
+            with timer.phase("extract"):
+                assignments = extract_solution(
+                    solver, num_sessions, start_vars,
+                    request.sessions, request.rooms, horizon, room_indices, room_options
+                )
             
             return ScheduleEventResponse(
                 assignments=assignments,
                 success=True,
-                message="Schedule generated successfully"
+                message="Schedule generated successfully",
+                movedSessions=count_moved_sessions(request.sessions, assignments),
+                solverStats=solver_stats,
+                engine="hybrid" if greedy else "cp-sat",
+                phaseSeconds=timer.seconds
+            )
+        elif greedy:
+            # The time box ran out before CP-SAT confirmed a schedule; keep the greedy one
+            with timer.phase("extract"):
+                assignments = build_assignments(request.sessions, request.rooms, horizon, *greedy)
+            return ScheduleEventResponse(
+                assignments=assignments,
+                success=True,
+                message="Schedule generated successfully",
+                movedSessions=count_moved_sessions(request.sessions, assignments),
+                solverStats=solver_stats,
+                engine="greedy",
+                phaseSeconds=timer.seconds
+            )
+        elif status == cp_model.INFEASIBLE:
+            # Proven infeasible: find which rooms, speakers and pinned sessions clash
+            with timer.phase("explain"):
+                diagnosis = explain_infeasibility(
+                    request.sessions, request.rooms, horizon, session_slot_durations,
+                    gap_slots, room_indices, room_candidates, fixed_slots
+                )
+            message = "Could not find a feasible schedule"
+            if diagnosis:
+                message += ": " + "; ".join(reason.message for reason in diagnosis)
+            return ScheduleEventResponse(
+                assignments=[],
+                success=False,
+                message=message,
+                diagnosis=diagnosis or None,
+                solverStats=solver_stats,
+                engine="cp-sat",
+                phaseSeconds=timer.seconds
             )
         else:
             return ScheduleEventResponse(
                 assignments=[],
                 success=False,
-                message=f"Could not find a feasible schedule. Status: {status}"
+                message=f"Could not find a feasible schedule. Status: {status}",
+                solverStats=solver_stats,
+                engine="cp-sat",
+                phaseSeconds=timer.seconds
             )
     
     except Exception as e:
+        logger.exception("schedule failed event=%s", request.eventId)
         return ScheduleEventResponse(
+            assignments=[],
+            success=False,
+            message=f"Error generating schedule: {str(e)}",
+            phaseSeconds=timer.seconds
+        )
+
+
+# ============================================================================
+# Schedule Cache
+# ============================================================================
+# Solved schedules persist in a local SQLite file keyed by a canonical hash of
+# the problem, so repeated "Generate schedule" clicks on an unchanged event do
+# not solve again. Proven results (optimal, or infeasible) are returned as is;
+# a feasible but unproven one seeds the next solve of the same problem, which
+# then continues from it. Every process (HTTP and solver workers) opens its own
+# connection; the file is bounded by size, least recently used entries first.
+
+SCHEDULE_CACHE_PATH = os.environ.get(
+    "SCHEDULE_CACHE_PATH", os.path.join(tempfile.gettempdir(), "ai-schedule-cache.sqlite")
+)  # Empty disables the cache
+SCHEDULE_CACHE_MAX_BYTES = int(os.environ.get("SCHEDULE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+# Bump whenever the model or objective changes so cached schedules are invalidated
+SCHEDULE_MODEL_VERSION = "1"
+PROVEN_STATUSES = ("OPTIMAL", "INFEASIBLE")
+
+
+class ScheduleCache:
+    """
+    Size-bounded persistent store of schedule responses. Cache errors are logged
+    and treated as misses, so a broken or locked file never fails a solve.
+    """
+
+    def __init__(self, path: str, max_bytes: int, fingerprint: str):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.fingerprint = fingerprint
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path) and self.max_bytes > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread and process; never reuse one across a fork
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS schedules ("
+                "key TEXT PRIMARY KEY, status TEXT NOT NULL, objective REAL, response TEXT NOT NULL, "
+                "size INTEGER NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS schedules_accessed_at ON schedules (accessed_at)")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def key(self, request: ScheduleEventRequest) -> str:
+        """
+        Hash of everything that defines the problem: dates, start time, gap, slot
+        size, room assignment mode, sessions (including previous and pinned start
+        times) and rooms, in id order. The event id, mode and solver settings only
+        change how hard the solver looks, not what a proven answer is.
+        """
+        problem = request.model_dump(exclude={"eventId", "mode", "solver"})
+        problem["sessions"].sort(key=lambda session: session["id"])
+        problem["rooms"].sort(key=lambda room: room["id"])
+        canonical = json.dumps(problem, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(f"{self.fingerprint}|{canonical}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[ScheduleEventResponse]:
+        try:
+            connection = self._connection()
+            row = connection.execute("SELECT response FROM schedules WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            connection.execute("UPDATE schedules SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            return ScheduleEventResponse.model_validate_json(row[0])
+        except (sqlite3.Error, ValueError):
+            logger.warning("schedule cache read failed path=%s", self.path, exc_info=True)
+            return None
+
+    def put(self, key: str, response: ScheduleEventResponse) -> None:
+        stats = response.solverStats
+        data = response.model_dump_json(exclude={"phaseSeconds", "cache"})
+        if len(data) > self.max_bytes:
+            return
+        try:
+            connection = self._connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute("SELECT status, objective FROM schedules WHERE key = ?", (key,)).fetchone()
+                # Keep a stored schedule unless this one is proven or at least as good
+                if (row is None or stats.status in PROVEN_STATUSES or row[1] is None
+                        or (stats.objectiveValue is not None and stats.objectiveValue <= row[1])):
+                    connection.execute(
+                        "INSERT OR REPLACE INTO schedules (key, status, objective, response, size, accessed_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, stats.status, stats.objectiveValue, data, len(key) + len(data), time.time())
+                    )
+                    self._evict(connection)
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+        except sqlite3.Error:
+            logger.warning("schedule cache write failed path=%s", self.path, exc_info=True)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        """Drop least recently used entries until the stored responses fit in max_bytes."""
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM schedules").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = 0
+        for key, size in connection.execute("SELECT key, size FROM schedules ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM schedules WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        logger.info("schedule cache evicted entries=%d bytes=%d", evicted, total)
+
+    def stats(self) -> Dict[str, Any]:
+        if not self.enabled:
+            return {"enabled": False}
+        try:
+            entries, size = self._connection().execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM schedules"
+            ).fetchone()
+        except sqlite3.Error as e:
+            return {"enabled": True, "path": self.path, "error": str(e)}
+        return {"enabled": True, "path": self.path, "entries": entries, "bytes": size, "maxBytes": self.max_bytes}
+
+
+def get_warm_start_slots(
+    assignments: List[ScheduleAssignment],
+    sessions: List[Session],
+    rooms: List[Room],
+    horizon: TimeHorizon,
+    session_slot_durations: List[int],
+    fixed_slots: List[Optional[int]]
+) -> Optional[Tuple[List[int], List[Optional[int]]]]:
+    """
+    A cached schedule as (start slots, room indices) in session order, the same
+    shape as the greedy engine's result; None if it no longer fits the horizon.
+    """
+    by_session = {assignment.sessionId: assignment for assignment in assignments}
+    room_index = {room.id: r_idx for r_idx, room in enumerate(rooms)}
+    start_slots = []
+    session_rooms = []
+    for i, session in enumerate(sessions):
+        assignment = by_session.get(session.id)
+        start = parse_previous_start(assignment.startTime) if assignment else None
+        slot = horizon.to_slot(start) if start is not None else None
+        if slot is None or not horizon.start_domain(session_slot_durations[i]).contains(slot):
+            return None
+        if fixed_slots[i] is not None and fixed_slots[i] != slot:
+            return None
+        start_slots.append(slot)
+        session_rooms.append(room_index.get(assignment.roomId) if session.roomId is None else None)
+    return start_slots, session_rooms
+
+
+schedule_cache = ScheduleCache(
+    SCHEDULE_CACHE_PATH,
+    SCHEDULE_CACHE_MAX_BYTES,
+    fingerprint=f"{SCHEDULE_MODEL_VERSION}|{SCHEDULE_SLOT_MINUTES}|{DAY_END_HOUR}",
+)
+
+
+def solve_schedule(request: ScheduleEventRequest, stream: Optional["ScheduleStream"] = None) -> ScheduleEventResponse:
+    """
+    _solve_schedule behind the schedule cache. The greedy engine (mode=fast) is
+    cheaper than a lookup, and deterministic requests must not depend on what
+    earlier requests left in the cache, so both always solve.
+    """
+    solver_options = request.solver or SolverOptions()
+    deterministic = solver_options.deterministic if solver_options.deterministic is not None else SOLVER_DETERMINISTIC
+    if not schedule_cache.enabled or deterministic:
+        return _solve_schedule(request, stream)
+    try:
+        mode = get_schedule_mode(request)
+    except ValueError as e:
+        return ScheduleEventResponse(assignments=[], success=False, message=f"Error generating schedule: {str(e)}")
+    if mode == "fast":
+        return _solve_schedule(request, stream)
+
+    started = time.perf_counter()
+    key = schedule_cache.key(request)
+    cached = schedule_cache.get(key)
+    lookup_seconds = time.perf_counter() - started
+    stats = cached.solverStats if cached else None
+    if stats is not None and stats.status in PROVEN_STATUSES:
+        SCHEDULE_CACHE_LOOKUPS.labels("hit").inc()
+        logger.info("schedule cache hit event=%s status=%s", request.eventId, stats.status)
+        return cached_schedule_response(request, cached, lookup_seconds)
+
+    warm_start = cached.assignments if cached is not None and cached.success else None
+    SCHEDULE_CACHE_LOOKUPS.labels("warm_start" if warm_start else "miss").inc()
+    response = _solve_schedule(request, stream, warm_start)
+    if warm_start:
+        # The hint bounds the makespan, but the search may still settle for a worse
+        # topic spread (or run out of time) before getting back to the cached schedule
+        if not response.success or response.engine == "greedy" or is_worse_schedule(response, cached):
+            return cached_schedule_response(request, cached, lookup_seconds)
+        response.cache = "warm-start"
+
+    stats = response.solverStats
+    if stats is not None and response.engine != "greedy" and (
+        (response.success and stats.status in ("OPTIMAL", "FEASIBLE")) or stats.status == "INFEASIBLE"
+    ):
+        started = time.perf_counter()
+        schedule_cache.put(key, response)
+        lookup_seconds += time.perf_counter() - started
+    if response.phaseSeconds is not None:
+        response.phaseSeconds["cache"] = lookup_seconds
+    return response
+
+
+def is_worse_schedule(response: ScheduleEventResponse, cached: ScheduleEventResponse) -> bool:
+    new, old = response.solverStats, cached.solverStats
+    return (new is not None and old is not None and new.objectiveValue is not None
+            and old.objectiveValue is not None and new.objectiveValue > old.objectiveValue)
+
+
+def cached_schedule_response(
+    request: ScheduleEventRequest,
+    cached: ScheduleEventResponse,
+    lookup_seconds: float
+) -> ScheduleEventResponse:
+    """A stored response with its assignments in this request's session order."""
+    by_session = {assignment.sessionId: assignment for assignment in cached.assignments}
+    assignments = [by_session[session.id] for session in request.sessions] if cached.success else []
+    return cached.model_copy(update={
+        "assignments": assignments,
+        "phaseSeconds": {"cache": lookup_seconds},
+        "cache": "hit"
+    })
+
+
+@app.get("/schedule-cache/stats")
+def schedule_cache_stats():
+    return schedule_cache.stats()
+
+
+# ============================================================================
+# Columnar Format
+# ============================================================================
+# For events with thousands of sessions: sessions and rooms travel as parallel
+# arrays, speakers and topics as indices into interned lists, and times as
+# minutes after midnight of startDate. Arrays are validated as a whole and the
+# Session/Room objects are built without per-item validation.
+
+class SessionColumns(BaseModel):
+    id: List[int]
+    durationMin: List[int]
+    capacity: List[int]
+    topic: List[int]  # Index into topics
+    title: Optional[List[str]] = None
+    speaker: Optional[List[Optional[int]]] = None  # Index into speakers
+    roomId: Optional[List[Optional[int]]] = None
+    startMinute: Optional[List[Optional[int]]] = None  # Previous start, minutes after midnight of startDate
+    pinned: Optional[List[bool]] = None
+
+
+class RoomColumns(BaseModel):
+    id: List[int]
+    name: List[str]
+    capacity: List[int]
+
+
+class ColumnarScheduleEventRequest(BaseModel):
+    eventId: int
+    startDate: str  # ISO date string
+    endDate: str  # ISO date string
+    gapMinutes: Optional[int] = 0
+    startTime: Optional[str] = None
+    slotMinutes: Optional[int] = None
+    solver: Optional[SolverOptions] = None
+    assignRooms: bool = False
+    mode: Optional[str] = None
+    speakers: List[str] = []
+    topics: List[str]
+    sessions: SessionColumns
+    rooms: RoomColumns
+
+
+class ScheduleColumns(BaseModel):
+    sessionId: List[int]
+    roomId: List[Optional[int]]
+    startMinute: List[Optional[int]]  # Minutes after midnight of startDate
+
+
+class ColumnarScheduleEventResponse(BaseModel):
+    columns: ScheduleColumns
+    success: bool
+    message: Optional[str] = None
+    diagnosis: Optional[List[InfeasibilityReason]] = None
+    movedSessions: Optional[int] = None
+    solverStats: Optional[SolverStats] = None
+    engine: Optional[str] = None
+    phaseSeconds: Optional[Dict[str, float]] = None
+
+
+def _check_column(name: str, values: Optional[list], length: int, index_limit: Optional[int] = None) -> None:
+    if values is None:
+        return
+    if len(values) != length:
+        raise HTTPException(status_code=422, detail=f"{name} has {len(values)} values, expected {length}")
+    if index_limit is not None and any(value is not None and not 0 <= value < index_limit for value in values):
+        raise HTTPException(status_code=422, detail=f"{name} has an index outside 0..{index_limit - 1}")
+
+
+def columns_to_request(req: ColumnarScheduleEventRequest) -> ScheduleEventRequest:
+    """Rebuild a ScheduleEventRequest from validated columns without validating each session again."""
+    columns = req.sessions
+    num_sessions = len(columns.id)
+    for name in ("durationMin", "capacity", "title", "roomId", "startMinute", "pinned"):
+        _check_column(f"sessions.{name}", getattr(columns, name), num_sessions)
+    _check_column("sessions.topic", columns.topic, num_sessions, len(req.topics))
+    _check_column("sessions.speaker", columns.speaker, num_sessions, len(req.speakers))
+    _check_column("rooms.name", req.rooms.name, len(req.rooms.id))
+    _check_column("rooms.capacity", req.rooms.capacity, len(req.rooms.id))
+
+    try:
+        first_day = datetime.fromisoformat(req.startDate).date()
+    except ValueError:
+        raise HTTPException(status_code=422, detail=f"startDate '{req.startDate}' is not an ISO date")
+    midnight = datetime.combine(first_day, datetime.min.time())
+    no_values = [None] * num_sessions
+    sessions = [
+        Session.model_construct(
+            id=session_id,
+            title=title or "",
+            speaker=req.speakers[speaker] if speaker is not None else None,
+            durationMin=duration,
+            topic=req.topics[topic],
+            capacity=capacity,
+            roomId=room_id,
+            startTime=(midnight + timedelta(minutes=start_minute)).isoformat() if start_minute is not None else None,
+            pinned=bool(pinned)
+        )
+        for session_id, title, speaker, duration, topic, capacity, room_id, start_minute, pinned in zip(
+            columns.id, columns.title or no_values, columns.speaker or no_values, columns.durationMin,
+            columns.topic, columns.capacity, columns.roomId or no_values, columns.startMinute or no_values,
+            columns.pinned or no_values
+        )
+    ]
+    rooms = [
+        Room.model_construct(id=room_id, name=name, capacity=capacity)
+        for room_id, name, capacity in zip(req.rooms.id, req.rooms.name, req.rooms.capacity)
+    ]
+    return ScheduleEventRequest.model_construct(
+        **req.model_dump(exclude={"speakers", "topics", "sessions", "rooms", "solver"}),
+        solver=req.solver,
+        sessions=sessions,
+        rooms=rooms
+    )
+
+
+def response_to_columns(request: ScheduleEventRequest, response: ScheduleEventResponse) -> ColumnarScheduleEventResponse:
+    midnight = datetime.combine(datetime.fromisoformat(request.startDate).date(), datetime.min.time())
+    start_minutes = []
+    for assignment in response.assignments:
+        if assignment.startTime is None:
+            start_minutes.append(None)
+        else:
+            start_minutes.append(int((datetime.fromisoformat(assignment.startTime) - midnight).total_seconds()) // 60)
+    return ColumnarScheduleEventResponse(
+        columns=ScheduleColumns.model_construct(
+            sessionId=[assignment.sessionId for assignment in response.assignments],
+            roomId=[assignment.roomId for assignment in response.assignments],
+            startMinute=start_minutes
+        ),
+        **{field: getattr(response, field) for field in ColumnarScheduleEventResponse.model_fields if field != "columns"}
+    )
+
+
+@app.post("/schedule-event/columnar", response_model=ColumnarScheduleEventResponse)
+def schedule_event_columnar(req: ColumnarScheduleEventRequest):
+    """/schedule-event with the columnar request and response format."""
+    request = columns_to_request(req)
+    with schedule_gate.admit(estimate_schedule_cost(request)), REQUEST_LATENCY.labels("/schedule-event/columnar").time():
+        response = schedule_event(request)
+    observe_schedule_metrics(response)
+    return json_response(response_to_columns(request, response))
+
+
+# ============================================================================
+# Streaming Schedules
+# ============================================================================
+# CP-SAT usually finds a good schedule long before it proves optimality. The
+# streaming endpoint sends each improvement as a server-sent event; closing the
+# connection stops the search.
+
+class ScheduleProgress(BaseModel):
+    solution: int  # 0 = greedy warm start, then 1, 2, ... for each CP-SAT improvement
+    assignments: List[ScheduleAssignment]
+    objectiveValue: Optional[float] = None
+    bestBound: Optional[float] = None
+    wallTime: float
+    engine: str
+
+
+class ScheduleStream:
+    """Passes intermediate schedules from a running solve to a consumer, which may stop the search."""
+
+    def __init__(self, publish: Callable[[ScheduleProgress], None]):
+        self.publish = publish
+        self.stopped = threading.Event()
+        self._solver: Optional[cp_model.CpSolver] = None
+        self._lock = threading.Lock()
+
+    def attach(self, solver: cp_model.CpSolver) -> None:
+        with self._lock:
+            self._solver = solver
+            if self.stopped.is_set():
+                solver.StopSearch()
+
+    def stop(self) -> None:
+        """Stop the search; the solve returns the best schedule found so far."""
+        with self._lock:
+            self.stopped.set()
+            if self._solver is not None:
+                self._solver.StopSearch()
+
+
+class StreamingSolutionCallback(cp_model.CpSolverSolutionCallback):
+    """Publishes each improving solution, formatted by extract_solution."""
+
+    def __init__(self, stream: ScheduleStream, extract: Callable[[Any], List[ScheduleAssignment]]):
+        super().__init__()
+        self.stream = stream
+        self.extract = extract
+        self.solutions = 0
+
+    def on_solution_callback(self) -> None:
+        self.solutions += 1
+        self.stream.publish(ScheduleProgress(
+            solution=self.solutions,
+            assignments=self.extract(self),
+            objectiveValue=self.ObjectiveValue(),
+            bestBound=self.BestObjectiveBound(),
+            wallTime=self.WallTime(),
+            engine="cp-sat"
+        ))
+
+
+def sse_event(event: str, data: BaseModel) -> str:
+    return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+
+
+@app.post("/schedule-event/stream")
+async def schedule_event_stream(request: ScheduleEventRequest, http_request: Request):
+    """
+    Same input as /schedule-event, answered as server-sent events:
+    `solution` (ScheduleProgress) for the greedy warm start and each improvement,
+    then `result` (ScheduleEventResponse). Close the connection to stop early.
+    The event is solved as a single model so every solution is a complete schedule.
+    """
+    loop = asyncio.get_running_loop()
+    cost = estimate_schedule_cost(request)
+    # Waiting for a slot blocks, so it happens off the event loop
+    await loop.run_in_executor(None, schedule_gate.acquire, cost)
+    started = time.perf_counter()
+    queue: asyncio.Queue = asyncio.Queue()
+    stream = ScheduleStream(lambda progress: loop.call_soon_threadsafe(queue.put_nowait, progress))
+
+    async def events():
+        solve = loop.run_in_executor(None, solve_schedule, request, stream)
+        solve.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while True:
+                try:
+                    progress = await asyncio.wait_for(queue.get(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    if await http_request.is_disconnected():
+                        return
+                    continue
+                if progress is None:
+                    break
+                yield sse_event("solution", progress)
+            response = solve.result()
+            observe_schedule_metrics(response)
+            yield sse_event("result", response)
+        finally:
+            # Client gone (or done): stop the search so the worker thread frees up
+            stream.stop()
+            schedule_gate.release(cost, time.perf_counter() - started)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+# ============================================================================
+# Schedule Jobs
+# ============================================================================
+# Solves run in the solver pool so a long CP-SAT search never holds a FastAPI
+# worker thread (or the GIL) while clients poll for the result. A job starts once
+# it gets a schedule gate slot and holds it until it finishes, with the cores of
+# one slot. Until then it waits in a bounded queue; submitting never blocks, and
+# a full queue is rejected at once with 429 and Retry-After.
+
+SCHEDULE_JOB_TTL_SECONDS = float(os.environ.get("SCHEDULE_JOB_TTL_SECONDS", "3600"))
+SCHEDULE_MAX_QUEUED_JOBS = int(os.environ.get("SCHEDULE_MAX_QUEUED_JOBS", "32"))
+
+
+class ScheduleJob(BaseModel):
+    jobId: str
+    status: str  # queued | running | succeeded | failed | cancelled
+    createdAt: str
+    finishedAt: Optional[str] = None
+    result: Optional[ScheduleEventResponse] = None
+    error: Optional[str] = None
+
+
+def solve_schedule_job(request: ScheduleEventRequest, num_workers: int) -> ScheduleEventResponse:
+    """Pool task: one event on num_workers cores, its components solved one after another."""
+    solver = (request.solver or SolverOptions()).model_copy()
+    if solver.numWorkers is None:
+        solver.numWorkers = num_workers
+    return schedule_event(request.model_copy(update={"solver": solver}), component_workers=1)
+
+
+class ScheduleJobStore:
+    """
+    Local store of schedule jobs run in a solver pool. A job starts once it takes
+    a slot of the admission gate, released when it finishes; until then it waits
+    in a queue of at most max_queued jobs, started oldest first by a dispatcher
+    thread as slots free up. Finished jobs are kept for ttl_seconds and purged
+    lazily on the next access.
+    """
+
+    def __init__(self, pool: SolverPool, gate: AdmissionGate, ttl_seconds: float, max_queued: int):
+        self.pool = pool
+        self.gate = gate
+        self.ttl_seconds = ttl_seconds
+        self.max_queued = max(0, max_queued)
+        self.name = f"{gate.name}_jobs"
+        self._jobs: Dict[str, ScheduleJob] = {}
+        self._futures: Dict[str, Future] = {}
+        self._queue: "OrderedDict[str, Tuple[ScheduleEventRequest, float]]" = OrderedDict()  # job id -> (request, cost)
+        self._admitted: Dict[str, Tuple[float, float]] = {}  # job id -> (cost, admitted at)
+        self._expires_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._slot_freed = threading.Condition(self._lock)
+        self._dispatcher: Optional[threading.Thread] = None
+        # Slots freed by direct solves start queued jobs too
+        gate.add_release_listener(self._notify_slot_freed)
+
+    def submit(self, request: ScheduleEventRequest) -> ScheduleJob:
+        cost = estimate_schedule_cost(request)
+        with self._lock:
+            self._purge_expired()
+            if self._queue or not self.gate.try_acquire(cost):
+                if len(self._queue) >= self.max_queued:
+                    raise self.gate.reject(
+                        429, "jobs_queue_full", "Too many schedule jobs queued",
+                        extra_cost=sum(queued_cost for _, queued_cost in self._queue.values()),
+                        extra_count=len(self._queue)
+                    )
+                job = ScheduleJob(jobId=uuid.uuid4().hex, status="queued", createdAt=datetime.utcnow().isoformat())
+                self._jobs[job.jobId] = job
+                self._queue[job.jobId] = (request, cost)
+                ADMISSION_QUEUE_DEPTH.labels(self.name).inc()
+                if self._dispatcher is None:
+                    # Started on first use so importing the app never starts threads
+                    self._dispatcher = threading.Thread(target=self._dispatch, name="schedule-jobs", daemon=True)
+                    self._dispatcher.start()
+                self._slot_freed.notify()
+                return job
+            job = ScheduleJob(jobId=uuid.uuid4().hex, status="queued", createdAt=datetime.utcnow().isoformat())
+            self._jobs[job.jobId] = job
+        self._start(job.jobId, request, cost)
+        return job
+
+    def _notify_slot_freed(self) -> None:
+        with self._lock:
+            self._slot_freed.notify()
+
+    def _dispatch(self) -> None:
+        """Dispatcher thread: start queued jobs, oldest first, whenever the gate has a free slot."""
+        while True:
+            with self._lock:
+                while not self._queue or not self.gate.try_acquire(next(iter(self._queue.values()))[1]):
+                    self._slot_freed.wait()
+                job_id, (request, cost) = self._queue.popitem(last=False)
+                ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+            self._start(job_id, request, cost)
+
+    def _start(self, job_id: str, request: ScheduleEventRequest, cost: float) -> None:
+        """Hand a job that holds a gate slot to the pool (called without the lock)."""
+        try:
+            future = self.pool.submit(solve_schedule_job, request, solve_cores(self.gate))
+        except Exception as e:
+            logger.exception("schedule job could not start job=%s", job_id)
+            self.gate.release(cost, 0.0)
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None and job.status == "queued":
+                    job.status = "failed"
+                    job.error = str(e)
+                    job.finishedAt = datetime.utcnow().isoformat()
+                    self._expires_at[job_id] = time.monotonic() + self.ttl_seconds
+            return
+        with self._lock:
+            self._futures[job_id] = future
+            self._admitted[job_id] = (cost, time.perf_counter())
+            job = self._jobs.get(job_id)
+            if job is None or job.status == "cancelled":
+                future.cancel()
+        future.add_done_callback(lambda f, job_id=job_id: self._finish(job_id, f))
+
+    def _finish(self, job_id: str, future: Future) -> None:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            self._futures.pop(job_id, None)
+            cost, admitted_at = self._admitted.pop(job_id)
+            if job is not None:
+                if job.status != "cancelled":
+                    if future.cancelled():
+                        job.status = "cancelled"
+                    elif future.exception() is not None:
+                        job.status = "failed"
+                        job.error = str(future.exception())
+                    else:
+                        job.status = "succeeded"
+                        job.result = future.result()
+                        observe_schedule_metrics(job.result)
+                if job.finishedAt is None:
+                    job.finishedAt = datetime.utcnow().isoformat()
+                self._expires_at[job_id] = time.monotonic() + self.ttl_seconds
+        # Outside the lock: releasing wakes the dispatcher, which takes it
+        self.gate.release(cost, time.perf_counter() - admitted_at)
+
+    def get(self, job_id: str) -> Optional[ScheduleJob]:
+        with self._lock:
+            self._purge_expired()
+            job = self._jobs.get(job_id)
+            future = self._futures.get(job_id)
+            if job is not None and job.status == "queued" and future is not None and future.running():
+                job.status = "running"
+            return job
+
+    def cancel(self, job_id: str) -> Optional[ScheduleJob]:
+        """
+        Cancel a job. Queued jobs never start; a running solve can't be interrupted
+        inside the pool, so its result is discarded when it finishes.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status in ("queued", "running"):
+                if self._queue.pop(job_id, None) is not None:
+                    ADMISSION_QUEUE_DEPTH.labels(self.name).dec()
+                future = self._futures.get(job_id)
+                if future is not None:
+                    future.cancel()
+                job.status = "cancelled"
+                job.finishedAt = datetime.utcnow().isoformat()
+                self._expires_at[job_id] = time.monotonic() + self.ttl_seconds
+            return job
+
+    def _purge_expired(self) -> None:
+        now = time.monotonic()
+        for job_id in [job_id for job_id, expires_at in self._expires_at.items() if expires_at < now]:
+            self._expires_at.pop(job_id, None)
+            if job_id not in self._futures:
+                self._jobs.pop(job_id, None)
+
+
+schedule_jobs = ScheduleJobStore(
+    pool=solver_pool,
+    gate=schedule_gate,
+    ttl_seconds=SCHEDULE_JOB_TTL_SECONDS,
+    max_queued=SCHEDULE_MAX_QUEUED_JOBS,
+)
+
+
+@app.post("/schedule-event/jobs", response_model=ScheduleJob, status_code=202)
+def create_schedule_job(request: ScheduleEventRequest):
+    """Queue a schedule solve and return its job id immediately."""
+    return schedule_jobs.submit(request)
+
+
+@app.get("/jobs/{job_id}", response_model=ScheduleJob)
+def get_schedule_job(job_id: str):
+    job = schedule_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@app.delete("/jobs/{job_id}", response_model=ScheduleJob)
+def cancel_schedule_job(job_id: str):
+    job = schedule_jobs.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+# ============================================================================
+# Batch Scheduling
+# ============================================================================
+# Many events solved in one request, one event per solver pool process. Each event
+# gets a share of the cores and of the batch's time budget (by size, as components do
+# in solve_decomposed), and a failing event only fails its own result.
+
+SCHEDULE_BATCH_WORKERS = int(os.environ.get("SCHEDULE_BATCH_WORKERS", str(available_cores())))
+SCHEDULE_BATCH_MAX_EVENTS = int(os.environ.get("SCHEDULE_BATCH_MAX_EVENTS", "100"))
+SCHEDULE_BATCH_TIME_BUDGET_SECONDS = float(os.environ.get("SCHEDULE_BATCH_TIME_BUDGET_SECONDS", "300"))
+
+
+class ScheduleEventBatch(BaseModel):
+    events: List[ScheduleEventRequest]
+    timeBudgetSeconds: Optional[float] = None  # For the whole batch (defaults to SCHEDULE_BATCH_TIME_BUDGET_SECONDS)
+
+
+class ScheduleEventBatchItem(BaseModel):
+    eventId: int
+    seconds: Optional[float] = None  # Wall time of this event's solve (None if it never ran)
+    response: ScheduleEventResponse
+
+
+class ScheduleEventBatchResponse(BaseModel):
+    results: List[ScheduleEventBatchItem]  # Same order as the request's events
+    succeeded: int
+    failed: int
+    workers: int
+    wallTime: float
+
+
+def solve_batch_event(
+    request: ScheduleEventRequest,
+    time_share: float,
+    deadline: float
+) -> Tuple[ScheduleEventResponse, float]:
+    """
+    Pool task: one event, with its components solved in this process. The solver
+    time is the event's share of the batch budget, never more than its own limit
+    nor the time left until the batch deadline (time.time(), shared by all processes).
+    """
+    started = time.perf_counter()
+    remaining = deadline - time.time()
+    if remaining <= 0:
+        response = ScheduleEventResponse(
+            assignments=[],
+            success=False,
+            message="Skipped: batch time budget exhausted"
+        )
+        return response, time.perf_counter() - started
+    try:
+        time_limit = schedule_time_limit(request)
+    except ValueError as e:
+        # Bad mode or profile: only this event fails
+        response = ScheduleEventResponse(
             assignments=[],
             success=False,
             message=f"Error generating schedule: {str(e)}"
         )
+        return response, time.perf_counter() - started
+    solver = request.solver.model_copy(update={"maxTimeSeconds": max(0.1, min(time_limit, time_share, remaining))})
+    response = schedule_event(request.model_copy(update={"solver": solver}), component_workers=1)
+    return response, time.perf_counter() - started
+
+
+def build_batch_requests(
+    events: List[ScheduleEventRequest],
+    workers: int,
+    time_budget: float
+) -> List[Tuple[ScheduleEventRequest, float]]:
+    """
+    Per-event requests sharing the cores, each with its share of the time budget.
+    Events run `workers` at a time, so an event's solver time is roughly
+    workers * its share of all sessions; solve_batch_event caps it at the event's limit.
+    """
+    num_workers = max(1, solve_cores() // workers)
+    total_sessions = sum(len(event.sessions) for event in events) or 1
+    requests = []
+    for event in events:
+        solver = (event.solver or SolverOptions()).model_copy()
+        if solver.numWorkers is None:
+            solver.numWorkers = num_workers
+        # 10% of the budget is left for model building, pre-checks and process overhead
+        share = 0.9 * time_budget * workers * max(1, len(event.sessions)) / total_sessions
+        requests.append((event.model_copy(update={"solver": solver}), share))
+    return requests
+
+
+@app.post("/schedule-events/batch", response_model=ScheduleEventBatchResponse)
+def schedule_events_batch(req: ScheduleEventBatch):
+    """
+    Schedule many events at once. Results come back in request order, one per event.
+    Events still queued when the time budget runs out are skipped; an event that
+    overruns it is reported as timed out. Each solve stops at the budget's deadline,
+    and the batch holds its schedule gate slot until the last of them has.
+    """
+    if len(req.events) > SCHEDULE_BATCH_MAX_EVENTS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {SCHEDULE_BATCH_MAX_EVENTS} events per batch (got {len(req.events)})"
+        )
+    started = time.perf_counter()
+    time_budget = req.timeBudgetSeconds or SCHEDULE_BATCH_TIME_BUDGET_SECONDS
+    deadline = started + time_budget
+    wall_deadline = time.time() + time_budget
+    # The batch holds one gate slot, so its events share that slot's cores
+    workers = max(1, min(SCHEDULE_BATCH_WORKERS, len(req.events), solve_cores()))
+    requests = build_batch_requests(req.events, workers, time_budget)
+    logger.info("schedule batch events=%d workers=%d budget=%.1f", len(requests), workers, time_budget)
+
+    items: List[Optional[ScheduleEventBatchItem]] = [None] * len(requests)
+    futures: List[Optional[Future]] = [None] * len(requests)
+    cost = sum(estimate_schedule_cost(request) for request, _ in requests)
+    schedule_gate.acquire(cost)
+    try:
+        with REQUEST_LATENCY.labels("/schedule-events/batch").time():
+            # Keep `workers` events in the solver pool until the budget runs out
+            submitted = 0
+            running = set()
+            while submitted < len(requests) or running:
+                while submitted < len(requests) and len(running) < workers and time.perf_counter() < deadline:
+                    request, share = requests[submitted]
+                    futures[submitted] = solver_pool.submit(solve_batch_event, request, share, wall_deadline)
+                    running.add(futures[submitted])
+                    submitted += 1
+                if not running:
+                    break
+                done, running = wait(running, timeout=max(0.0, deadline - time.perf_counter()), return_when=FIRST_COMPLETED)
+                if not done:
+                    break
+
+            for i, ((request, _), future) in enumerate(zip(requests, futures)):
+                seconds = None
+                if future is None or not future.done():
+                    skipped = future is None or future.cancel()
+                    response = ScheduleEventResponse(
+                        assignments=[],
+                        success=False,
+                        message="Skipped: batch time budget exhausted" if skipped
+                                else "Timed out: batch time budget exhausted"
+                    )
+                else:
+                    try:
+                        response, seconds = future.result()
+                    except Exception as e:
+                        # Worker crash or unpicklable result: only this event fails
+                        logger.exception("schedule batch event failed event=%s", request.eventId)
+                        response = ScheduleEventResponse(
+                            assignments=[],
+                            success=False,
+                            message=f"Error generating schedule: {str(e)}"
+                        )
+                observe_schedule_metrics(response)
+                items[i] = ScheduleEventBatchItem(eventId=request.eventId, seconds=seconds, response=response)
+    finally:
+        # Solves that overran the budget stop at the deadline; their cores stay reserved until then
+        for future in futures:
+            if future is not None:
+                future.cancel()
+        schedule_gate.release_after(cost, started, [future for future in futures if future is not None])
+
+    succeeded = sum(1 for item in items if item.response.success)
+    return ScheduleEventBatchResponse(
+        results=items,
+        succeeded=succeeded,
+        failed=len(items) - succeeded,
+        workers=workers,
+        wallTime=time.perf_counter() - started
+    )
+
+
+# ============================================================================
+# Warm-up
+# ============================================================================
+# The first parse and the first solve pay for lazy initialization (spaCy
+# vectors and caches, OR-Tools native code). serve.py warms up once in the
+# parent before forking workers; a plain `uvicorn app:app` warms up on startup.
+
+WARM_UP_BRIEF = "Tech Summit in Colombo for 200 attendees with a budget of 2 million LKR, tracks: AI, Cloud"
+
+
+def warm_up() -> None:
+    if ready.is_set():
+        return
+    started = time.perf_counter()
+    brief_nlp(WARM_UP_BRIEF)
+    entities_nlp(WARM_UP_BRIEF)
+    # Past the schedule cache, which would skip the solver on a restart
+    _solve_schedule(ScheduleEventRequest(
+        eventId=0,
+        startDate="2026-01-05",
+        endDate="2026-01-05",
+        sessions=[
+            Session(id=1, title="Warm-up", speaker="A", durationMin=60, topic="AI", capacity=10, roomId=1),
+            Session(id=2, title="Warm-up", speaker="A", durationMin=30, topic="AI", capacity=10, roomId=1),
+        ],
+        rooms=[Room(id=1, name="Room", capacity=10)],
+        mode="exact",
+        solver=SolverOptions(numWorkers=1, maxTimeSeconds=1),
+    ))
+    ready.set()
+    logger.info("warm-up finished seconds=%.3f", time.perf_counter() - started)
+
+
+@app.on_event("startup")
+def start_warm_up():
+    # In a thread, so the liveness probe answers while warming up
+    threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
@@ -0,0 +1,7 @@
+"""
+Reproducible benchmarks for the AI service.
+
+Run from services/ai:
+    python -m benchmarks.run                      # compare against benchmarks/baseline.json
+    python -m benchmarks.run --update-baseline    # record a new baseline on this machine
+"""
@@ -0,0 +1,129 @@
+"""
+Seeded generators for benchmark inputs. The same seed and parameters always
+produce the same payloads, so runs on different commits solve identical problems.
+"""
+import random
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+TOPICS = ["AI", "Cloud", "Web", "Data", "Security", "Mobile", "DevOps", "Design"]
+DURATIONS = [30, 45, 60, 90]
+DURATION_WEIGHTS = [3, 2, 4, 1]
+
+
+def generate_schedule_request(
+    seed: int,
+    sessions: int = 60,
+    rooms: int = 4,
+    speakers: int = 15,
+    speaker_sharing: float = 0.5,
+    whole_venue_ratio: float = 0.05,
+    gap_minutes: int = 10,
+    days: int = 2,
+    start_date: date = date(2026, 3, 2),
+    lightning_ratio: float = 0.0
+) -> Dict[str, Any]:
+    """
+    ScheduleEventRequest payload for a synthetic event.
+    
+    - speaker_sharing: share of sessions whose speaker comes from a pool of `speakers`
+      people (and may collide); the rest get a speaker of their own
+    - whole_venue_ratio: share of sessions without a room (they block the whole venue)
+    - lightning_ratio: share of 30-minute lightning talks without a speaker; the ones
+      in the same room are interchangeable
+    """
+    rng = random.Random(seed)
+    room_list = [
+        {"id": r + 1, "name": f"Room {r + 1}", "capacity": rng.choice([40, 80, 120, 200, 400])}
+        for r in range(rooms)
+    ]
+    session_list = []
+    for i in range(sessions):
+        # Only draws when enabled, so the other scenarios keep their payloads
+        if lightning_ratio and rng.random() < lightning_ratio:
+            session_list.append({
+                "id": i + 1,
+                "title": f"Lightning Talk {i + 1}",
+                "speaker": None,
+                "durationMin": 30,
+                "topic": "Lightning",
+                "capacity": 40,
+                "roomId": rng.randint(1, rooms),
+            })
+            continue
+        if rng.random() < speaker_sharing:
+            speaker = f"Speaker {rng.randrange(speakers)}"
+        else:
+            speaker = f"Guest {i}"
+        session_list.append({
+            "id": i + 1,
+            "title": f"Session {i + 1}",
+            "speaker": speaker,
+            "durationMin": rng.choices(DURATIONS, DURATION_WEIGHTS)[0],
+            "topic": rng.choice(TOPICS),
+            "capacity": rng.randint(20, 150),
+            "roomId": None if rng.random() < whole_venue_ratio else rng.randint(1, rooms),
+        })
+    return {
+        "eventId": seed,
+        "startDate": start_date.isoformat(),
+        "endDate": (start_date + timedelta(days=days - 1)).isoformat(),
+        "gapMinutes": gap_minutes,
+        "sessions": session_list,
+        "rooms": room_list,
+    }
+
+
+EVENT_NAMES = ["Tech Summit", "Developer Conference", "Data Workshop", "Startup Meetup",
+               "Cloud Expo", "Design Festival", "Security Seminar", "AI Conference"]
+CITIES = ["Colombo", "Kandy", "Galle", "Jaffna", "Negombo"]
+AUDIENCE_NOUNS = ["people", "attendees", "participants", "guests", "delegates", "developers"]
+WRITTEN = ["one", "two", "three", "four", "five", "six"]
+
+
+def _budget_phrase(rng: random.Random) -> Tuple[str, int]:
+    """A budget phrase and the amount in LKR it should parse to."""
+    style = rng.randrange(4)
+    if style == 0:
+        millions = rng.choice([1, 2, 3, 5, 10])
+        return f"a budget of {millions} million LKR", millions * 1_000_000
+    if style == 1:
+        thousands = rng.choice([150, 250, 500, 750])
+        return f"{thousands}k LKR budget", thousands * 1_000
+    if style == 2:
+        amount = rng.choice([300000, 450000, 1200000])
+        return f"budget: LKR {amount}", amount
+    thousands = rng.choice([200, 400, 600])
+    return f"Rs {thousands}k to spend", thousands * 1_000
+
+
+def generate_brief_corpus(seed: int, count: int = 500) -> List[Tuple[str, Dict[str, Optional[int]]]]:
+    """
+    Event brief texts with the audience, budget and track counts parse_brief should find.
+    Templates vary order, wording and sentence count; every text is unique.
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(count):
+        name = rng.choice(EVENT_NAMES)
+        city = rng.choice(CITIES)
+        audience = rng.choice([50, 120, 200, 350, 800, 1500])
+        budget_text, budget = _budget_phrase(rng)
+        track_count = rng.randint(1, 6)
+        if rng.random() < 0.5:
+            tracks_text = f"{track_count} tracks"
+        else:
+            tracks_text = f"{WRITTEN[track_count - 1]} tracks"
+        audience_text = f"{audience} {rng.choice(AUDIENCE_NOUNS)}"
+        
+        sentences = [
+            f"{name} {2026 + i % 3} in {city} for {audience_text}",
+            f"We plan {tracks_text} with {budget_text}",
+        ]
+        if rng.random() < 0.5:
+            sentences.reverse()
+        if rng.random() < 0.6:
+            sentences.append(f"Venue shortlist {i} includes hotels near {city} station")
+        text = ". ".join(sentences) + "."
+        corpus.append((text, {"estimatedAudience": audience, "budgetLkr": budget, "tracks": track_count}))
+    return corpus
@@ -0,0 +1,231 @@
+"""
+Benchmark runner: solves the schedule scenarios and parses the brief corpus,
+then compares the numbers against a stored baseline.
+
+Usage (from services/ai):
+    python -m benchmarks.run [--suite all|schedule|parse] [--threshold 0.25]
+                             [--baseline benchmarks/baseline.json] [--update-baseline [--timings]]
+
+Exits with status 1 when any metric regresses by more than the threshold, or
+when there is no baseline to compare against.
+The committed baseline only holds the deterministic schedule metrics (success,
+objective, makespan), which any machine with the same OR-Tools reproduces; parser
+accuracy depends on the spaCy model, so it is added with --suite parse
+--update-baseline where the production model is installed. Timings are machine
+specific: record a baseline with --update-baseline --timings on the machine (or
+CI runner) that will run the comparison and pass it with --baseline.
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from typing import Any, Dict, List
+
+from .generators import generate_brief_corpus, generate_schedule_request
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# name -> generate_schedule_request parameters
+SCHEDULE_SCENARIOS: Dict[str, Dict[str, Any]] = {
+    "small": {"seed": 1, "sessions": 30, "rooms": 3, "days": 2},
+    "medium": {"seed": 2, "sessions": 100, "rooms": 6, "days": 5},
+    "large": {"seed": 3, "sessions": 300, "rooms": 10, "days": 8, "whole_venue_ratio": 0.0},
+    "whole_venue_heavy": {"seed": 4, "sessions": 60, "rooms": 4, "days": 4, "whole_venue_ratio": 0.25},
+    "shared_speakers": {"seed": 5, "sessions": 120, "rooms": 6, "days": 6, "speakers": 8, "speaker_sharing": 0.9},
+    "long_gaps": {"seed": 6, "sessions": 80, "rooms": 5, "days": 4, "gap_minutes": 30},
+    "lightning_talks": {"seed": 8, "sessions": 120, "rooms": 4, "days": 4, "lightning_ratio": 0.5},
+}
+# Deterministic search so objectives are comparable between runs; in this mode
+# maxTimeSeconds is the solver's deterministic time, not wall time
+SCHEDULE_SOLVER = {"deterministic": True, "randomSeed": 0, "numWorkers": 1, "maxTimeSeconds": 3}
+BUILD_PHASES = ("horizon", "variables", "room_constraints", "speaker_constraints",
+                "whole_venue_constraints", "temporal_constraints", "symmetry_breaking", "objective")
+
+BRIEF_CORPUS_SEED = 7
+BRIEF_CORPUS_SIZE = 500
+
+# Metric direction: lower is better unless listed here
+HIGHER_IS_BETTER = {"briefsPerSecond", "batchBriefsPerSecond", "fieldAccuracy", "sessionsPerSecond"}
+# Same on every machine (deterministic search, fixed corpus); everything else is a timing
+DETERMINISTIC_METRICS = {"success", "objective", "makespanMinutes", "fieldAccuracy"}
+
+
+def run_schedule_suite(app) -> Dict[str, Dict[str, Any]]:
+    results = {}
+    for name, params in SCHEDULE_SCENARIOS.items():
+        payload = generate_schedule_request(**params)
+        payload["mode"] = "exact"
+        payload["solver"] = SCHEDULE_SOLVER
+        request = app.ScheduleEventRequest(**payload)
+
+        started = time.perf_counter()
+        response = app.schedule_event(request)
+        wall = time.perf_counter() - started
+
+        phases = response.phaseSeconds or {}
+        stats = response.solverStats
+        results[name] = {
+            "success": response.success,
+            "buildSeconds": sum(phases.get(phase, 0.0) for phase in BUILD_PHASES),
+            "solveSeconds": phases.get("solve", 0.0),
+            "wallSeconds": wall,
+            "objective": stats.objectiveValue if stats and stats.components == 1 else None,
+            "makespanMinutes": _makespan_minutes(response, payload),
+            "sessionsPerSecond": len(payload["sessions"]) / wall if wall else None,
+        }
+        logging.getLogger("benchmarks").info("schedule %s %s", name, results[name])
+    return results
+
+
+def _makespan_minutes(response, payload) -> Any:
+    """Minutes from midnight of the start date to the last session end; comparable across decomposed runs."""
+    if not response.success:
+        return None
+    from datetime import datetime, timedelta
+    durations = {s["id"]: s["durationMin"] for s in payload["sessions"]}
+    ends = [
+        datetime.fromisoformat(a.startTime) + timedelta(minutes=durations[a.sessionId])
+        for a in response.assignments
+    ]
+    first = datetime.fromisoformat(payload["startDate"])
+    return (max(ends) - first).total_seconds() / 60
+
+
+def run_parse_suite(app) -> Dict[str, Dict[str, Any]]:
+    corpus = generate_brief_corpus(BRIEF_CORPUS_SEED, BRIEF_CORPUS_SIZE)
+    texts = [text for text, _ in corpus]
+
+    # Cold cache for both passes, so the pipeline itself is measured
+    app.result_cache.clear()
+    started = time.perf_counter()
+    parsed = [app.parse_brief(app.Brief(text=text)) for text in texts]
+    single = time.perf_counter() - started
+
+    app.result_cache.clear()
+    started = time.perf_counter()
+    app.parse_brief_batch(app.BriefBatch(briefs=[app.Brief(text=text) for text in texts]))
+    batch = time.perf_counter() - started
+    app.result_cache.clear()
+
+    checked = correct = 0
+    for result, (_, expected) in zip(parsed, corpus):
+        for field, value in expected.items():
+            checked += 1
+            correct += result.get(field) == value
+
+    results = {"briefs": {
+        "briefsPerSecond": len(texts) / single,
+        "batchBriefsPerSecond": len(texts) / batch,
+        "fieldAccuracy": correct / checked,
+    }}
+    logging.getLogger("benchmarks").info("parse %s", results["briefs"])
+    return results
+
+
+def compare(
+    current: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    threshold: float,
+    min_seconds: float
+) -> List[str]:
+    """Regressions beyond the threshold, as readable lines."""
+    regressions = []
+    for case, metrics in current.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        if base.get("success") and not metrics.get("success", True):
+            regressions.append(f"{case}: no longer finds a schedule")
+            continue
+        for metric, value in metrics.items():
+            base_value = base.get(metric)
+            if not isinstance(value, (int, float)) or not isinstance(base_value, (int, float)) or isinstance(value, bool):
+                continue
+            # Timings this short are mostly noise
+            if metric.endswith("Seconds") and max(value, base_value) < min_seconds:
+                continue
+            if metric in HIGHER_IS_BETTER:
+                worse = value < base_value * (1 - threshold)
+            else:
+                worse = value > base_value * (1 + threshold)
+            if worse:
+                regressions.append(f"{case}.{metric}: {value:.4g} vs baseline {base_value:.4g}")
+    return regressions
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="AI service benchmarks")
+    parser.add_argument("--suite", choices=["all", "schedule", "parse"], default="all")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the new baseline")
+    parser.add_argument("--timings", action="store_true",
+                        help="With --update-baseline, also store the machine-specific timings")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.05, help="Ignore timings below this on both sides")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    import app  # Loads the spaCy model; imported here so --help stays fast
+    import ortools
+
+    results: Dict[str, Dict[str, Any]] = {}
+    if args.suite in ("all", "schedule"):
+        results.update(run_schedule_suite(app))
+    if args.suite in ("all", "parse"):
+        results.update(run_parse_suite(app))
+
+    run = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "ortools": ortools.__version__,
+        "model": app.MODEL,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(run, f, indent=2)
+
+    if args.update_baseline:
+        if not args.timings:
+            results = {
+                case: {metric: value for metric, value in metrics.items() if metric in DETERMINISTIC_METRICS}
+                for case, metrics in results.items()
+            }
+            run = {**run, "results": results}
+        baseline_run = run
+        if os.path.exists(args.baseline):
+            # Keep the other suite's numbers when only one suite was run
+            with open(args.baseline) as f:
+                baseline_run = json.load(f)
+            baseline_run.update({key: value for key, value in run.items() if key != "results"})
+            baseline_run["results"].update(results)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline_run, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline first")
+        return 1
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    # Objectives depend on the OR-Tools version and parser accuracy on the spaCy model
+    for key in ("ortools", "model"):
+        if key in baseline and baseline[key] != run[key]:
+            print(f"Note: baseline was recorded with {key} {baseline[key]}, this run uses {run[key]}")
+
+    regressions = compare(results, baseline["results"], args.threshold, args.min_seconds)
+    if regressions:
+        print("Regressions beyond threshold:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print(f"No regressions beyond {args.threshold:.0%} across {len(results)} cases")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
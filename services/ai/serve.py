@@ -0,0 +1,113 @@
+"""
+Production entry point for the AI service.
+
+The parent process loads and warms up the spaCy models and OR-Tools once, then
+forks HTTP workers. Workers share the parent's memory pages copy-on-write and
+accept connections from one listening socket, so each extra worker costs
+neither another model load nor another copy of the model.
+
+Usage:
+    python serve.py
+
+Environment:
+    HOST, PORT             listen address (default 0.0.0.0:8000)
+    WEB_CONCURRENCY        HTTP workers (default: available cores)
+    PROMETHEUS_MULTIPROC_DIR
+                           metric files shared by the workers (default: a fresh temp dir)
+"""
+import gc
+import glob
+import os
+import signal
+import socket
+import tempfile
+import time
+
+HOST = os.environ.get("HOST", "0.0.0.0")
+PORT = int(os.environ.get("PORT", "8000"))
+RESPAWN_DELAY_SECONDS = 1.0
+
+
+def prepare_metrics_dir() -> str:
+    """
+    Metric files must start empty and exist before prometheus_client is imported.
+    Only the metric files (*.db) are removed, never anything else in the directory.
+    """
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR") or tempfile.mkdtemp(prefix="ai-metrics-")
+    os.makedirs(path, exist_ok=True)
+    for name in glob.glob(os.path.join(path, "*.db")):
+        os.remove(name)
+    os.environ["PROMETHEUS_MULTIPROC_DIR"] = path
+    return path
+
+
+def main() -> None:
+    prepare_metrics_dir()
+
+    import uvicorn
+    from prometheus_client import multiprocess
+
+    # The app splits the cores and its admission limits between the workers, so it must know their number
+    os.environ.setdefault("WEB_CONCURRENCY", str(len(os.sched_getaffinity(0))))
+    num_workers = int(os.environ["WEB_CONCURRENCY"])
+
+    import app as service
+
+    service.warm_up()
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((HOST, PORT))
+    sock.listen(2048)
+
+    # Everything loaded so far is left alone by the cyclic GC from now on, so the
+    # collector never writes to (and un-shares) the model's pages in the workers
+    gc.collect()
+    gc.freeze()
+
+    def spawn() -> int:
+        pid = os.fork()
+        if pid == 0:
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            config = uvicorn.Config(service.app, log_level=service.LOG_LEVEL.lower(), timeout_graceful_shutdown=30)
+            uvicorn.Server(config).run(sockets=[sock])
+            os._exit(0)
+        return pid
+
+    workers = {spawn() for _ in range(max(1, num_workers))}
+    service.logger.info("serving on %s:%d with %d workers (pids %s)", HOST, PORT, len(workers), sorted(workers))
+
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        if pid not in workers:
+            continue
+        workers.discard(pid)
+        multiprocess.mark_process_dead(pid)
+        if not stopping:
+            service.logger.warning("worker %d exited (status %d), restarting", pid, status)
+            time.sleep(RESPAWN_DELAY_SECONDS)
+            workers.add(spawn())
+
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
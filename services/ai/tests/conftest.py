@@ -0,0 +1,19 @@
+"""
+Shared setup: tests import the service module directly (from services/ai).
+The spaCy model comes from SPACY_MODEL as in production; the persistent
+schedule cache is disabled so results never depend on earlier runs.
+"""
+import os
+import sys
+
+os.environ.setdefault("SCHEDULE_CACHE_PATH", "")
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def service():
+    import app
+    return app
@@ -0,0 +1,36 @@
+import asyncio
+
+import pytest
+
+
+class ChunkedBody:
+    """Stands in for a Request whose body arrives in the given chunks."""
+
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def stream(self):
+        for chunk in self.chunks:
+            yield chunk
+
+
+def read_lines(service, chunks):
+    async def collect():
+        return [line async for line in service.read_ndjson_lines(ChunkedBody(chunks))]
+    return asyncio.run(collect())
+
+
+@pytest.mark.parametrize("chunks", [
+    [b'{"id": 1}\n{"id": 2}\n\n{"id": 3}'],
+    [b'{"id"', b': 1}\n{"id": 2', b'}\n', b'\n{"id": 3}'],
+    [bytes([byte]) for byte in b'{"id": 1}\n{"id": 2}\n\n{"id": 3}'],
+])
+def test_read_ndjson_lines_across_chunks(service, chunks):
+    assert read_lines(service, chunks) == [b'{"id": 1}', b'{"id": 2}', b'{"id": 3}']
+
+
+def test_read_ndjson_lines_reports_overlong_lines_once(service, monkeypatch):
+    monkeypatch.setattr(service, "ENTITIES_STREAM_MAX_LINE_BYTES", 8)
+    # Spread over chunks, then whole within one chunk
+    chunks = [b'{"id": 1}', b'23456789', b'0123\n{"a":1}\n', b'{"id": 1234567}\n{"b":2}']
+    assert read_lines(service, chunks) == [None, b'{"a":1}', None, b'{"b":2}']
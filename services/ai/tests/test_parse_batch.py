@@ -0,0 +1,28 @@
+class FailingPipeline:
+    """Wraps the brief pipeline and raises on any text containing "BOOM"."""
+
+    def __init__(self, nlp):
+        self.nlp = nlp
+
+    def __call__(self, text):
+        if "BOOM" in text:
+            raise RuntimeError("pipeline failed")
+        return self.nlp(text)
+
+    def pipe(self, texts, **kwargs):
+        for text in texts:
+            yield self(text)
+
+
+def test_batch_parse_isolates_failing_briefs(service, monkeypatch):
+    monkeypatch.setattr(service, "brief_nlp", FailingPipeline(service.brief_nlp))
+    service.result_cache.clear()
+    batch = service.BriefBatch(briefs=[
+        service.Brief(text="Cloud Expo for 200 people"),
+        service.Brief(text="BOOM Summit for 50 people"),
+        service.Brief(text="Data Workshop for 80 people"),
+    ])
+    results = service.parse_brief_batch(batch)["results"]
+    assert [result.get("error") for result in results] == [None, "pipeline failed", None]
+    assert results[0]["estimatedAudience"] == 200
+    assert results[2]["estimatedAudience"] == 80
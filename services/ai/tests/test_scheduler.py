@@ -0,0 +1,272 @@
+from datetime import datetime
+
+
+def make_request(service, sessions, rooms, **fields):
+    return service.ScheduleEventRequest(
+        eventId=1,
+        startDate="2026-03-02",
+        endDate="2026-03-02",
+        sessions=[service.Session(**{"title": "Talk", "topic": "AI", "capacity": 10, **session}) for session in sessions],
+        rooms=[service.Room(**room) for room in rooms],
+        **fields,
+    )
+
+
+def test_greedy_tries_next_room_for_pinned_session(service):
+    # Both sessions are pinned at 09:00 without a room; the smallest room is taken by the first
+    request = make_request(
+        service,
+        sessions=[
+            {"id": 1, "durationMin": 60, "startTime": "2026-03-02T09:00:00", "pinned": True},
+            {"id": 2, "durationMin": 60, "startTime": "2026-03-02T09:00:00", "pinned": True},
+        ],
+        rooms=[{"id": 1, "name": "Small", "capacity": 50}, {"id": 2, "name": "Large", "capacity": 100}],
+        assignRooms=True,
+        mode="fast",
+    )
+    response = service.schedule_event(request)
+    assert response.success, response.message
+    assert {a.sessionId: a.roomId for a in response.assignments} == {1: 1, 2: 2}
+    assert all(datetime.fromisoformat(a.startTime).hour == 9 for a in response.assignments)
+
+
+def event_payload(event_id, **fields):
+    return {
+        "eventId": event_id,
+        "startDate": "2026-03-02",
+        "endDate": "2026-03-02",
+        "sessions": [
+            {"id": 1, "title": "Talk", "speaker": "A", "durationMin": 60, "topic": "AI", "capacity": 10, "roomId": 1},
+            {"id": 2, "title": "Talk", "speaker": "A", "durationMin": 30, "topic": "AI", "capacity": 10, "roomId": 1},
+        ],
+        "rooms": [{"id": 1, "name": "Room", "capacity": 20}],
+        "solver": {"maxTimeSeconds": 5},
+        **fields,
+    }
+
+
+def wait_for_job(store, job_id, timeout=60):
+    import time
+
+    deadline = time.monotonic() + timeout
+    while store.get(job_id).status in ("queued", "running"):
+        assert time.monotonic() < deadline
+        time.sleep(0.1)
+    return store.get(job_id)
+
+
+def test_batch_fails_only_the_invalid_events(service):
+    from fastapi.testclient import TestClient
+
+    events = [
+        event_payload(1),
+        event_payload(2, mode="bogus"),
+        event_payload(3, solver={"profile": "bogus"}),
+        event_payload(4, mode="fast"),
+    ]
+    response = TestClient(service.app).post("/schedule-events/batch", json={"events": events})
+    assert response.status_code == 200
+    results = {item["eventId"]: item["response"] for item in response.json()["results"]}
+    assert results[1]["success"] and results[4]["success"]
+    assert not results[2]["success"] and "Unknown scheduling mode" in results[2]["message"]
+    assert not results[3]["success"] and "Unknown solver profile" in results[3]["message"]
+
+
+def test_schedule_jobs_go_through_admission(service, monkeypatch):
+    import time
+    from fastapi.testclient import TestClient
+    from benchmarks.generators import generate_schedule_request
+
+    gate = service.AdmissionGate("schedule-test", max_concurrent=1, max_queued=0, max_wait_seconds=10)
+    store = service.ScheduleJobStore(pool=service.SolverPool(2), gate=gate, ttl_seconds=60, max_queued=1)
+    monkeypatch.setattr(service, "schedule_jobs", store)
+    client = TestClient(service.app)
+
+    # Large enough to run until its time limit, so it still holds the only slot
+    busy = generate_schedule_request(seed=1, sessions=30, rooms=3, days=2)
+    busy["solver"] = {"maxTimeSeconds": 2}
+    first = client.post("/schedule-event/jobs", json=busy)
+    assert first.status_code == 202
+    # The next job waits in the queue instead of holding the request; the one after is shed at once
+    started = time.monotonic()
+    queued = client.post("/schedule-event/jobs", json=event_payload(2))
+    assert queued.status_code == 202 and queued.json()["status"] == "queued"
+    rejected = client.post("/schedule-event/jobs", json=event_payload(3))
+    assert rejected.status_code == 429
+    assert int(rejected.headers["Retry-After"]) >= 1
+    assert time.monotonic() - started < 1
+
+    for job in (first, queued):
+        assert wait_for_job(store, job.json()["jobId"]).status == "succeeded"
+    assert gate.stats()["inFlight"] == 0
+    assert client.post("/schedule-event/jobs", json=event_payload(4)).status_code == 202
+
+
+def test_cancelled_queued_job_never_starts(service):
+    from benchmarks.generators import generate_schedule_request
+
+    gate = service.AdmissionGate("schedule-test", max_concurrent=1, max_queued=0, max_wait_seconds=0)
+    store = service.ScheduleJobStore(pool=service.SolverPool(1), gate=gate, ttl_seconds=60, max_queued=1)
+    busy = generate_schedule_request(seed=1, sessions=30, rooms=3, days=2)
+    busy["solver"] = {"maxTimeSeconds": 2}
+    first = store.submit(service.ScheduleEventRequest(**busy))
+    queued = store.submit(service.ScheduleEventRequest(**event_payload(2)))
+    assert store.cancel(queued.jobId).status == "cancelled"
+    assert wait_for_job(store, first.jobId).status == "succeeded"
+    assert store.get(queued.jobId).status == "cancelled" and store.get(queued.jobId).result is None
+    assert gate.stats()["inFlight"] == 0
+
+
+def test_invalid_mode_fails_the_response_with_cache_enabled(service, monkeypatch, tmp_path):
+    from fastapi.testclient import TestClient
+
+    cache = service.ScheduleCache(str(tmp_path / "schedules.db"), 1024 * 1024, fingerprint="test")
+    monkeypatch.setattr(service, "schedule_cache", cache)
+    response = TestClient(service.app).post("/schedule-event", json={
+        "eventId": 1,
+        "startDate": "2026-03-02",
+        "endDate": "2026-03-02",
+        "sessions": [{"id": 1, "title": "Talk", "topic": "AI", "durationMin": 60, "capacity": 10}],
+        "rooms": [{"id": 1, "name": "Hall", "capacity": 50}],
+        "mode": "bogus",
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["success"] is False
+    assert "Unknown scheduling mode 'bogus'" in body["message"]
+
+
+def test_schedule_jobs_recover_from_a_dead_worker(service):
+    import os
+    import signal
+    from benchmarks.generators import generate_schedule_request
+
+    gate = service.AdmissionGate("schedule-test", max_concurrent=1, max_queued=0, max_wait_seconds=0)
+    pool = service.SolverPool(1)
+    store = service.ScheduleJobStore(pool=pool, gate=gate, ttl_seconds=60, max_queued=0)
+    busy = generate_schedule_request(seed=1, sessions=30, rooms=3, days=2)
+    busy["solver"] = {"maxTimeSeconds": 2}
+    crashed = store.submit(service.ScheduleEventRequest(**busy))
+    for pid in list(pool._executor._processes):
+        os.kill(pid, signal.SIGKILL)
+    assert wait_for_job(store, crashed.jobId).status == "failed"
+
+    # The broken pool is replaced instead of failing every later job
+    job = store.submit(service.ScheduleEventRequest(**event_payload(2)))
+    assert wait_for_job(store, job.jobId).status == "succeeded"
+
+
+def test_slot_grid_keeps_pinned_start_times(service):
+    # 60-minute sessions on a 60-minute grid would have no 10:30 slot
+    request = make_request(
+        service,
+        sessions=[
+            {"id": 1, "durationMin": 60, "roomId": 1, "startTime": "2026-03-02T10:30:00", "pinned": True},
+            {"id": 2, "durationMin": 60, "roomId": 1},
+        ],
+        rooms=[{"id": 1, "name": "Hall", "capacity": 50}],
+    )
+    response = service.schedule_event(request)
+    assert response.success, response.message
+    assert response.movedSessions == 0
+    assert {a.sessionId: a.startTime for a in response.assignments}[1] == "2026-03-02T10:30:00"
+
+
+def test_overlapping_pins_are_not_dropped(service):
+    request = make_request(
+        service,
+        sessions=[
+            {"id": 1, "durationMin": 60, "roomId": 1, "startTime": "2026-03-02T09:00:00", "pinned": True},
+            {"id": 2, "durationMin": 60, "roomId": 1, "startTime": "2026-03-02T09:30:00", "pinned": True},
+        ],
+        rooms=[{"id": 1, "name": "Hall", "capacity": 50}],
+    )
+    response = service.schedule_event(request)
+    assert not response.success
+    assert {reason.kind for reason in response.diagnosis} >= {"pinned"}
+
+
+def test_pin_off_the_slot_grid_is_rejected(service):
+    request = make_request(
+        service,
+        sessions=[{"id": 1, "durationMin": 60, "roomId": 1, "startTime": "2026-03-02T10:32:00", "pinned": True}],
+        rooms=[{"id": 1, "name": "Hall", "capacity": 50}],
+        mode="fast",
+    )
+    response = service.schedule_event(request)
+    assert not response.success
+    assert [(reason.kind, reason.sessionIds) for reason in response.diagnosis] == [("pinned", [1])]
+
+
+def test_decomposed_solves_reuse_the_solver_pool(service, monkeypatch):
+    pool = service.SolverPool(2)
+    monkeypatch.setattr(service, "solver_pool", pool)
+    monkeypatch.setattr(service, "available_cores", lambda: 2 * service.schedule_gate.max_concurrent)
+    # Two rooms without shared speakers are independent components
+    request = make_request(
+        service,
+        sessions=[
+            {"id": 1, "durationMin": 60, "roomId": 1, "speaker": "A"},
+            {"id": 2, "durationMin": 60, "roomId": 2, "speaker": "B"},
+        ],
+        rooms=[{"id": 1, "name": "Hall", "capacity": 50}, {"id": 2, "name": "Lab", "capacity": 50}],
+        solver={"maxTimeSeconds": 5},
+    )
+    first = service.schedule_event(request, component_workers=2)
+    executor = pool._executor
+    second = service.schedule_event(request, component_workers=2)
+    assert first.success and second.success, (first.message, second.message)
+    assert first.solverStats.components == 2
+    assert executor is not None and pool._executor is executor
+
+
+def test_columnar_rejects_an_invalid_start_date(service):
+    from fastapi.testclient import TestClient
+
+    response = TestClient(service.app).post("/schedule-event/columnar", json={
+        "eventId": 1,
+        "startDate": "not-a-date",
+        "endDate": "2026-03-02",
+        "topics": ["AI"],
+        "sessions": {"id": [1], "durationMin": [60], "topic": [0], "capacity": [10]},
+        "rooms": {"id": [1], "name": ["Hall"], "capacity": [50]},
+    })
+    assert response.status_code == 422
+    assert "startDate" in response.json()["detail"]
+
+
+def test_batch_solves_stop_at_the_batch_deadline(service):
+    import time
+
+    request = service.ScheduleEventRequest(**event_payload(1, solver={"maxTimeSeconds": 60}))
+    response, _ = service.solve_batch_event(request, 60, time.time() + 1)
+    assert response.success, response.message
+    assert response.solverStats.timeLimitSeconds <= 1
+
+    response, _ = service.solve_batch_event(request, 60, time.time() - 1)
+    assert not response.success and response.message.startswith("Skipped")
+
+
+def test_gate_slot_is_held_until_the_work_finishes(service):
+    import time
+    from concurrent.futures import Future
+
+    gate = service.AdmissionGate("schedule-test", max_concurrent=1, max_queued=0, max_wait_seconds=0)
+    gate.acquire(10)
+    futures = [Future(), Future()]
+    futures[0].set_result(None)
+    gate.release_after(10, time.perf_counter(), futures)
+    assert gate.stats()["inFlight"] == 1
+    futures[1].set_result(None)
+    assert gate.stats()["inFlight"] == 0
+
+
+def test_solves_split_the_cores_between_http_workers(service, monkeypatch):
+    gate = service.AdmissionGate("schedule-test", max_concurrent=2, max_queued=0, max_wait_seconds=0)
+    monkeypatch.setattr(service, "available_cores", lambda: 16)
+    monkeypatch.setattr(service, "WEB_CONCURRENCY", 4)
+    assert service.solve_cores(gate) == 2
+    options = service.SolverOptions()
+    monkeypatch.setattr(service, "schedule_gate", gate)
+    settings = service.configure_solver(service.cp_model.CpSolver(), options, num_sessions=10)
+    assert settings["numWorkers"] == 2
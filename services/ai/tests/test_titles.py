@@ -0,0 +1,14 @@
+import pytest
+
+
+@pytest.mark.parametrize("sentence, title", [
+    # The budget span takes its multiplier and currency with it
+    ("Tech Summit for budget 2 million LKR 3 tracks", "Tech Summit for 3 tracks"),
+    ("Annual Tech Summit with a budget of 500k LKR", "Annual Tech Summit with a"),
+    ("Cloud Expo, budget: LKR 750k", "Cloud Expo"),
+    ("Data Workshop in Colombo for 80 people", "Data Workshop for"),
+    # Currency words only match whole, never the "rs" inside another word
+    ("users 5 500k k", "users 5 k"),
+])
+def test_clean_title_text_strips_budget_spans(service, sentence, title):
+    assert service.clean_title_text(sentence) == title